@@ -0,0 +1,381 @@
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+import subprocess
+import multiprocessing
+import homparser.homdeflex as hdl
+import homparser.homdefyacc as hdy
+import homparser.ply.lex as lex
+import homparser.ply.yacc as yacc
+from homparser.homdefexpr import ExpressionFeed
+from homparser.homdefparser import HomdefParser
+from homparser import homdefbatch
+from homparser import homdeftokens
+
+
+# An expression-heavy sequential body
+def make_input(statements):
+    body = '\t   sum = sum * n + s[i] - (a + b) / 3 <= c && !d;\n' * statements
+    return ('join(int sumL | int sumR) returns (sum) locals (int sum) {\n'
+            '\t   sum = sumL + sumR ;\n'
+            '}\n'
+            'sequential (int* s, int n) returns (sum) locals (int i, int sum) {\n' +
+            body + '}\n')
+
+
+# Logger that counts the reductions reported by the debugging parser
+class ReduceCounter(object):
+    def __init__(self):
+        self.reductions = 0
+        self.callbacks = 0
+
+    def info(self, msg, *args):
+        if msg.startswith('Action : Reduce'):
+            self.reductions += 1
+            self.callbacks += 1
+        elif msg.startswith('Action : Pass through'):
+            self.reductions += 1
+
+    def debug(self, msg, *args):
+        pass
+
+    warning = error = critical = debug
+
+
+def count_tokens(data):
+    lexer = hdl.lexer.clone()
+    lexer.input(data)
+    return sum(1 for tok in lexer)
+
+
+def tokenfunc(parser, lexer, climbing):
+    if climbing:
+        return ExpressionFeed(parser, lexer.token).token
+    return lexer.token
+
+
+def run(parser, data, tokens, label, climbing=False):
+    counter = ReduceCounter()
+    lexer = hdl.lexer.clone()
+    assert parser.parse(data, lexer=lexer, debug=counter,
+                        tokenfunc=tokenfunc(parser, lexer, climbing)) is not None
+
+    lexer = hdl.lexer.clone()
+    start = time.time()
+    parser.parse(data, lexer=lexer, tokenfunc=tokenfunc(parser, lexer, climbing))
+    elapsed = time.time() - start
+
+    print '%-18s %6.2f reductions/token %6.2f callbacks/token %8.3fs' % (
+        label, counter.reductions / float(tokens), counter.callbacks / float(tokens), elapsed)
+
+
+# Size of an object with its instance dictionary, if it has one
+def object_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+# Count the instances of the classes, given as (module, name) pairs, made
+# while calling func, by putting counting subclasses in the modules.  With
+# slotted false the stand-ins are copies of the classes without __slots__,
+# which carry an instance dictionary, as the classes did before.  Returns the
+# number of instances and the number of dictionaries among them.
+def count_instances(func, classes, slotted=True):
+    made = [0, 0]
+    originals = []
+    for module, name in classes:
+        original = getattr(module, name)
+        if slotted:
+            base, namespace = original, {'__slots__': ()}
+        else:
+            base = object
+            namespace = dict((key, value) for key, value in vars(original).items()
+                             if key != '__slots__' and key not in original.__slots__)
+        def new(cls, *args):
+            made[0] += 1
+            made[1] += cls.__dictoffset__ != 0
+            return object.__new__(cls)
+        namespace['__new__'] = new
+        setattr(module, name, type(name, (base,), namespace))
+        originals.append((module, name, original))
+    try:
+        func()
+    finally:
+        for module, name, original in originals:
+            setattr(module, name, original)
+    return made
+
+
+# Throughput of the lexer and of the generic parse loop, and the objects the
+# loop allocates per token: the tokens and the symbols, counted as they are
+# made, their dictionaries, if they have any, and a slice list per reduction
+# that calls a grammar rule.  The same parse with the classes unslotted gives
+# the baseline.
+def bench_driver(data, tokens, runs=5):
+    tok = lex.LexToken()
+    tok.type, tok.value, tok.lineno, tok.lexpos = 'IDENT', 'x', 1, 0
+    sym = yacc.YaccSymbol()
+    sym.type, sym.value = 'identifier', None
+    print '%-18s %8d bytes per token %8d bytes per symbol' % (
+        'driver objects', object_size(tok), object_size(sym))
+
+    lexer = hdl.lexer.clone()
+    best = None
+    for i in range(runs):
+        lexer.input(data)
+        start = time.time()
+        for t in lexer:
+            pass
+        elapsed = time.time() - start
+        best = min(best or elapsed, elapsed)
+    print '%-18s %8.0f tokens/s' % ('lexer', tokens / best)
+
+    parser = hdy.get_parser().clone()
+    best = None
+    for i in range(runs):
+        start = time.time()
+        parser.parse(data, lexer=hdl.lexer.clone())
+        elapsed = time.time() - start
+        best = min(best or elapsed, elapsed)
+
+    counter = ReduceCounter()
+    parser.parse(data, lexer=hdl.lexer.clone(), debug=counter)
+    parse = lambda: parser.parse(data, lexer=hdl.lexer.clone())
+    classes = [(lex, 'LexToken'), (yacc, 'YaccSymbol')]
+    line = []
+    for slotted in (True, False):
+        instances, dicts = count_instances(parse, classes, slotted)
+        line.append((instances + dicts + counter.callbacks) / float(tokens))
+        line.append(dicts / float(tokens))
+    print '%-18s %8.0f tokens/s %6.2f objects/token %6.2f of them dicts, unslotted %6.2f and %6.2f' % (
+        ('generic loop', tokens / best) + tuple(line))
+
+
+# Bytes held by the action and goto tables, not counting the symbol names
+# and the small ints, which are shared
+def table_size(table):
+    if isinstance(table, yacc.CompactTable):
+        return (sys.getsizeof(table) + sum(sys.getsizeof(row) for row in table) +
+                sys.getsizeof(table.codes) + sys.getsizeof(table.check) + sys.getsizeof(table.value))
+    return sys.getsizeof(table) + sum(sys.getsizeof(row) for row in table.values())
+
+
+# Write the tables in both encodings and compare loading them, their size,
+# the speed of looking up actions in them and of the generic loop using them
+def bench_tables(data, tokens, lookups=200000, runs=3):
+    outputdir = tempfile.mkdtemp()
+    sys.path.insert(0, outputdir)
+    try:
+        for tabmodule, compact in ('parsetab_dict', False), ('parsetab_compact', True):
+            yacc.yacc(module=hdy, tabmodule=tabmodule, outputdir=outputdir,
+                      debug=False, write_tables=True, compact=compact,
+                      errorlog=yacc.NullLogger())
+            __import__(tabmodule)              # Leaves the .pyc behind
+            del sys.modules[tabmodule]
+
+            start = time.time()
+            lr = yacc.LRTable()
+            lr.read_table(tabmodule)
+            elapsed = time.time() - start
+            print '%-18s %8d bytes on disk %8d bytes in memory %8.2fms to load' % (
+                tabmodule, os.path.getsize(os.path.join(outputdir, tabmodule + '.py')),
+                table_size(lr.lr_action) + table_size(lr.lr_goto), elapsed * 1000)
+
+            lr.bind_callables(vars(hdy))
+            parser = yacc.LRParser(lr, hdy.p_error)
+            best = None
+            for i in range(runs):
+                start = time.time()
+                parser.parse(data, lexer=hdl.lexer.clone())
+                elapsed = time.time() - start
+                best = min(best or elapsed, elapsed)
+            print '%-18s %8.0f tokens/s in the generic loop' % ('', tokens / best)
+
+            rows = lr.lr_action
+            states = [state for state in rows.keys() if rows[state]]
+            random.seed(1)
+            pairs = []
+            for i in range(lookups):
+                state = random.choice(states)
+                pairs.append((state, random.choice(list(rows[state].keys()))))
+            start = time.time()
+            for state, name in pairs:
+                rows[state].get(name)
+            elapsed = time.time() - start
+            print '%-18s %8.1fns per action lookup' % ('', elapsed / lookups * 1e9)
+
+            if compact:
+                codes, base = rows.codes, [row.base for row in rows]
+                check, value = rows.check, rows.value
+                start = time.time()
+                for state, name in pairs:
+                    i = base[state] + codes[name]
+                    if check[i] == state:
+                        value[i]
+                elapsed = time.time() - start
+                print '%-18s %8.1fns per action lookup, indexing the arrays' % (
+                    '', elapsed / lookups * 1e9)
+    finally:
+        sys.path.remove(outputdir)
+        shutil.rmtree(outputdir)
+
+
+# Start a fresh worker that loads the compiled parser, from parsetab.py or
+# from a mapped table file, and report the time it took and the private
+# memory it needed (Linux only)
+worker = """
+import sys, time
+import homparser.homdefyacc as hdy
+
+def private():
+    with open('/proc/self/smaps') as f:
+        return sum(int(line.split()[1]) for line in f if line.startswith('Private_'))
+
+if len(sys.argv) > 1:
+    hdy.use_shared_tables(sys.argv[1])
+memory = private()
+start = time.time()
+hdy.get_compiled_parser()
+print time.time() - start, private() - memory
+"""
+
+
+def bench_workers(runs=10):
+    tabledir = tempfile.mkdtemp()
+    try:
+        mapfile = os.path.join(tabledir, 'homdef.tables')
+        hdy.write_shared_tables(mapfile)
+        for label, args in ('parsetab worker', []), ('mapped worker', [mapfile]):
+            results = [map(float, subprocess.check_output([sys.executable, '-c', worker] + args).split())
+                       for i in range(runs)]
+            print '%-18s %8.2fms to load %8d kB private' % (
+                label, min(r[0] for r in results) * 1000, min(r[1] for r in results))
+    finally:
+        shutil.rmtree(tabledir)
+
+
+# Parse a sequential body of the given number of statements in a fresh
+# process, and report the time, the peak memory and the statements kept
+scaler = """
+import sys, time, resource
+import homparser.homdefyacc as hdy
+from homparser.homdefparser import HomdefParser
+statements = int(sys.argv[1])
+data = ('join(int a | int b) returns (s) locals (int s) { s = a + b; }\\n'
+        'sequential (int* s, int n) returns (sum) locals (int i, int sum) {\\n' +
+        '\\t   sum = sum + i;\\n' * statements + '}\\n')
+parser = HomdefParser(climbing=True, compiled=True)
+start = time.time()
+program = parser.parse(data)
+elapsed = time.time() - start
+print elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(program.sequential.body.statements)
+"""
+
+
+def bench_scaling(maxexp):
+    print '%10s %10s %10s %12s %10s' % ('statements', 'seconds', 'us/stmt', 'peak kB', 'kept')
+    for exp in range(3, maxexp + 1):
+        statements = 10 ** exp
+        elapsed, peak, kept = subprocess.check_output(
+            [sys.executable, '-c', scaler, str(statements)]).split()
+        print '%10d %10.3f %10.2f %12s %10s' % (
+            statements, float(elapsed), float(elapsed) / statements * 1e6, peak, kept)
+
+
+# Index the signatures of a corpus of specifications, parsing every body
+# and only brace-matching them
+def bench_lazy(data, files=20, runs=3):
+    for label, lazy in ('eager signatures', False), ('lazy signatures', True):
+        parser = HomdefParser(climbing=True, compiled=True, lazy=lazy)
+        best = None
+        for i in range(runs):
+            start = time.time()
+            index = []
+            for n in range(files):
+                program = parser.parse(data)
+                join, sequential = program.join, program.sequential
+                index.append((join.argsl, join.argsr, join.returns, join.locals,
+                              sequential.args, sequential.returns, sequential.locals))
+            elapsed = time.time() - start
+            best = min(best or elapsed, elapsed)
+        print '%-18s %8.2f files/s' % (label, files / best)
+
+
+# Latency of parsing one large file, whole and with its two sections in
+# parallel, which needs two free CPUs to gain anything.  The join section
+# gets as many statements as the sequential one.
+def bench_sections(data, runs=3):
+    data = data.replace('\t   sum = sumL + sumR ;\n', data.split('{\n', 2)[2].rsplit('}', 1)[0])
+    parser = HomdefParser(climbing=True, compiled=True)
+    pool = homdefbatch.start_pool(2)
+    try:
+        for label, parse in (('whole file', parser.parse),
+                             ('sections', lambda data: homdefbatch.parse_sections(data, pool))):
+            best = None
+            for i in range(runs):
+                start = time.time()
+                parse(data)
+                elapsed = time.time() - start
+                best = min(best or elapsed, elapsed)
+            print '%-18s %8.3fs' % (label, best)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+# Throughput of columnar tokenization, in this process and in chunks on a
+# pool with one worker per CPU
+def bench_lexing(data, tokens, chunksize=1 << 16, runs=3):
+    pool = multiprocessing.Pool()
+    try:
+        for label, tokenize in (('bulk lexing', homdeftokens.tokenize_bulk),
+                                ('parallel lexing',
+                                 lambda data: homdeftokens.tokenize_parallel(data, pool, chunksize))):
+            best = None
+            for i in range(runs):
+                start = time.time()
+                tokenize(data)
+                elapsed = time.time() - start
+                best = min(best or elapsed, elapsed)
+            print '%-18s %8.0f tokens/s' % (label, tokens / best)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+if len(sys.argv) > 1 and sys.argv[1] == 'scaling':
+    bench_scaling(int(sys.argv[2]) if len(sys.argv) > 2 else 6)
+    sys.exit()
+
+statements = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+data = make_input(statements)
+tokens = count_tokens(data)
+print '%d statements, %d tokens' % (statements, tokens)
+
+parser = hdy.get_parser().clone()
+parser.disable_passthrough_rules()
+run(parser, data, tokens, 'callbacks')
+
+parser = hdy.get_parser().clone()
+run(parser, data, tokens, 'pass through')
+
+parser = hdy.get_parser().clone()
+run(parser, data, tokens, 'climbing', climbing=True)
+
+parser = hdy.get_compiled_parser().clone()
+run(parser, data, tokens, 'compiled')
+
+parser = hdy.get_compiled_parser().clone()
+run(parser, data, tokens, 'compiled climbing', climbing=True)
+
+bench_driver(data, tokens)
+bench_lazy(data)
+bench_sections(data)
+bench_lexing(data, tokens)
+bench_tables(data, tokens)
+bench_workers()
@@ -2,9 +2,25 @@ import sys
 import utils
 
 class Node(object):
-    __slots__ = ()
     """ Abstract base class for AST nodes.
+        start and end are set by a parser with spans: the offset of the
+        first character of the tokens of the rule that built the node
+        and the offset just past the last one.  A node passed on by a
+        rule keeps its span, so the parentheses around an expression are
+        not part of it.  A node that stands for no source text has None
+        for both; one parsed without spans or built by hand has neither.
     """
+    __slots__ = ('start', 'end')
+
+    @property
+    def coord(self):
+        """ The (start, end) of the node, or None if it has no span.
+        """
+        start = getattr(self, 'start', None)
+        if start is None:
+            return None
+        return start, self.end
+
     def children(self):
         """ A sequence of all children that are Nodes
         """
@@ -33,17 +49,20 @@ class Node(object):
         else:
             buf.write(lead + self.__class__.__name__+ ': ')
 
-        if self.__slots__:
+        # The fields after the span
+        names = _fields(self.__class__)[2:]
+        if names:
             if attrnames:
-                nvlist = [(n, getattr(self, n)) for n in self.__slots__]
+                nvlist = [(n, getattr(self, n)) for n in names]
                 attrstr = ', '.join('%s=%s' % nv for nv in nvlist)
             else:
-                vlist = [getattr(self, n) for n in self.__slots__]
+                vlist = [getattr(self, n) for n in names]
                 attrstr = ', '.join('%s' % v for v in vlist)
             buf.write(attrstr)
 
         if showcoord:
-            buf.write(' (at %s)' % self.coord)
+            coord = self.coord
+            buf.write(' (at %d-%d)' % coord if coord else ' (at ?)')
         buf.write('\n')
 
 
@@ -310,6 +329,47 @@ class SequentialSpec(Node):
                 utils.isinstance_list(self.locals, Argument) & isinstance(self.body, Block))
 
 
+class LazyBody(object):
+    """ The body of a join or sequential spec that was skipped by a lazy
+        parse: the source text of the braced block, its offset and line
+        in the input, and the function that parses it.
+    """
+    __slots__ = ('text', 'offset', 'lineno', 'parser')
+
+    def __init__(self, text, offset, lineno, parser):
+        self.text = text
+        self.offset = offset
+        self.lineno = lineno
+        self.parser = parser
+
+    def parse(self):
+        return self.parser(self)
+
+
+class _LazySlot(object):
+    """ Stands in for the slot of a class, parsing a LazyBody stored
+        in it on first access and storing the result in its place.
+    """
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, node, cls):
+        if node is None:
+            return self
+        value = self.slot.__get__(node, cls)
+        if isinstance(value, LazyBody):
+            value = value.parse()
+            self.slot.__set__(node, value)
+        return value
+
+    def __set__(self, node, value):
+        self.slot.__set__(node, value)
+
+
+JoinSpec.body = _LazySlot(JoinSpec.__dict__['body'])
+SequentialSpec.body = _LazySlot(SequentialSpec.__dict__['body'])
+
+
 class Program(Node):
     __slots__ = ('join', 'sequential')
 
@@ -321,3 +381,81 @@ class Program(Node):
         return isinstance(self.sequential, SequentialSpec) & isinstance(self.join, JoinSpec)
 
 
+
+
+def _fields(cls):
+    # The slots of the class and its bases, Node's first.  A single slot
+    # may be given as a bare string.
+    fields = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        fields.extend(slots)
+    return tuple(fields)
+
+
+def unspanned(node):
+    """ Give node no span, for nodes that stand for no source text.
+    """
+    node.start = node.end = None
+    return node
+
+
+_nodeclasses = dict((name, cls) for name, cls in globals().items()
+                    if isinstance(cls, type) and issubclass(cls, Node))
+
+# The fields of each node class, by class and by class name
+_classfields = dict((cls, _fields(cls)) for cls in _nodeclasses.values())
+_namefields = dict((name, (cls, _fields(cls))) for name, cls in _nodeclasses.items())
+
+
+def to_tuple(node):
+    """ Convert a tree of Nodes to a flat list of tuples of plain values,
+        which marshal can serialize however deep the tree is.  The list
+        holds the tree in postorder: a plain value is (0, value), a list
+        of the n items before it is (1, n), and a node of the fields
+        before it is (2, class name).  Its span comes first; a missing
+        field becomes None.
+    """
+    # The tree is walked in preorder with the children taken from the
+    # right, which is the postorder reversed
+    items = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        fields = _classfields.get(node.__class__)
+        if fields is not None:
+            items.append((2, node.__class__.__name__))
+            stack.extend([getattr(node, name, None) for name in fields])
+        elif isinstance(node, list):
+            items.append((1, len(node)))
+            stack.extend(node)
+        else:
+            items.append((0, node))
+    items.reverse()
+    return items
+
+
+def from_tuple(items):
+    """ Rebuild a tree of Nodes converted by to_tuple().
+    """
+    stack = []
+    for kind, value in items:
+        if kind == 0:
+            stack.append(value)
+        elif kind == 1:
+            i = len(stack) - value
+            value = stack[i:]
+            del stack[i:]
+            stack.append(value)
+        else:
+            cls, fields = _namefields[value]
+            node = cls.__new__(cls)
+            i = len(stack) - len(fields)
+            for name, value in zip(fields, stack[i:]):
+                setattr(node, name, value)
+            del stack[i:]
+            stack.append(node)
+    node, = stack
+    return node
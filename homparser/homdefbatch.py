@@ -0,0 +1,201 @@
+# ------------------------------------------------------------
+# homdefbatch.py
+# Parsing many homdef specifications on a pool of processes
+# ------------------------------------------------------------
+import os
+import re
+import sys
+import time
+import marshal
+import multiprocessing
+from collections import namedtuple
+
+import homdefast as ast
+import homdefyacc
+import homdeflex
+from homdefparser import HomdefParser, UnexpectedToken
+
+# The outcome of parsing one file.  program is the ast.Program, or None if
+# the parse failed; failure is then the message of the exception that
+# stopped it, if any.  seconds is the time the worker spent on the file.
+ParseResult = namedtuple('ParseResult', 'path program errors syntaxerrors failure seconds')
+
+# The parser of a worker process
+_parser = None
+
+# Braces and the keyword that starts the sequential section
+_sections = re.compile(r'[{}]|\bsequential\b')
+
+
+def _start_worker(maxerrors, climbing, compiled, mapfile, spans):
+    global _parser
+    # Errors are returned in the results.  The messages printed by the
+    # error rules would only interleave the output of the workers.
+    sys.stdout = open(os.devnull, 'w')
+    if mapfile is not None:
+        homdefyacc.use_shared_tables(mapfile)
+    _parser = HomdefParser(maxerrors, climbing, compiled, spans=spans)
+
+
+def _parse(path):
+    start = time.time()
+    tree = failure = None
+    # A parse that fails to start must not report the last file's errors
+    _parser.reset()
+    try:
+        tree = ast.to_tuple(_parser.parse_file(path))
+    except Exception as e:
+        failure = '%s: %s' % (e.__class__.__name__, e)
+    return marshal.dumps((path, tree,
+                          [tuple(e) for e in _parser.errors],
+                          [tuple(e) for e in _parser.syntaxerrors],
+                          failure, time.time() - start))
+
+
+def _parse_section(args):
+    symbol, data, lineno, offset = args
+    tree = failure = None
+    # A parse that fails to start must not report the last section's errors
+    _parser.reset()
+    try:
+        tree = ast.to_tuple(_parser.parse_fragment(symbol, data, lineno=lineno, offset=offset))
+    except Exception as e:
+        failure = '%s: %s' % (e.__class__.__name__, e)
+    clean = not (failure or _parser.errors or _parser.syntaxerrors)
+    return marshal.dumps((tree, clean))
+
+
+# A tree sent back by a worker, or None if it failed before sending one
+def _tree(tree):
+    return ast.from_tuple(tree) if tree is not None else None
+
+
+def _result(data):
+    path, tree, errors, syntaxerrors, failure, seconds = marshal.loads(data)
+    return ParseResult(path, _tree(tree),
+                       [homdeflex.IllegalInput(*e) for e in errors],
+                       [UnexpectedToken(*e) for e in syntaxerrors],
+                       failure, seconds)
+
+
+def start_pool(jobs=None, maxerrors=100, climbing=True, compiled=True, mapfile=None,
+               spans=True):
+    """ Return a multiprocessing.Pool of jobs worker processes (by
+        default one per CPU), each with a HomdefParser of its own.
+        mapfile is a table file written by homdefyacc.write_shared_tables()
+        for the workers to load their tables from.
+    """
+    return multiprocessing.Pool(jobs, _start_worker,
+                                (maxerrors, climbing, compiled, mapfile, spans))
+
+
+def split_sections(data):
+    """ Return the offset of the sequential keyword that starts the
+        second section of data, or None if there is no such keyword
+        outside the braces of the join section.
+    """
+    depth = 0
+    for m in _sections.finditer(data):
+        if m.group() == '{':
+            depth += 1
+        elif m.group() == '}':
+            depth -= 1
+        elif depth == 0:
+            return m.start()
+    return None
+
+
+def parse_sections(data, pool, maxerrors=100, climbing=True, compiled=True, spans=True):
+    """ Parse a specification with its two sections in parallel and
+        return a ParseResult without a path.  The smaller section is
+        parsed by a worker of pool (see start_pool()) while this process
+        parses the larger one, and the program is assembled from the
+        two.  Sending a tree back from a worker costs about as much as
+        parsing it, so this only pays off when the smaller section is
+        still a sizeable part of the input.  If either section has
+        illegal characters or syntax errors, or the sections cannot be
+        told apart, the whole input is parsed again here, so that the
+        diagnostics are those of a plain parse; the messages of the error
+        rules are then printed twice.
+        The pool must have been started with the same spans.
+    """
+    start = time.time()
+    parser = HomdefParser(maxerrors, climbing, compiled, spans=spans)
+    split = split_sections(data)
+    if split is not None:
+        sections = [('joinspec', data[:split], 1, 0),
+                    ('sequentialspec', data[split:], data.count('\n', 0, split) + 1, split)]
+        # The larger section stays here
+        here = int(split < len(data) - split)
+        pending = pool.apply_async(_parse_section, (sections[1 - here],))
+        symbol, text, lineno, offset = sections[here]
+        trees = [None, None]
+        try:
+            trees[here] = parser.parse_fragment(symbol, text, lineno=lineno, offset=offset)
+        except Exception:
+            pass
+        tree, clean = marshal.loads(pending.get())
+        trees[1 - here] = _tree(tree)
+        clean = clean and not (parser.errors or parser.syntaxerrors)
+        if clean and trees[0] is not None and trees[1] is not None:
+            program = ast.Program(*trees)
+            if spans:
+                program.start, program.end = trees[0].start, trees[1].end
+            return ParseResult(None, program, [], [], None, time.time() - start)
+
+    program = failure = None
+    try:
+        program = parser.parse(data)
+    except Exception as e:
+        failure = '%s: %s' % (e.__class__.__name__, e)
+    return ParseResult(None, program, list(parser.errors), list(parser.syntaxerrors),
+                       failure, time.time() - start)
+
+
+def parse_many(paths, jobs=None, maxerrors=100, climbing=True, compiled=True,
+               mapfile=None, chunksize=8, spans=True):
+    """ Parse the files in paths on jobs worker processes (by default
+        one per CPU) and yield a ParseResult for each of them, in the
+        order in which they complete.
+        Each worker creates one HomdefParser up front and parses all
+        its files with it; mapfile is a table file written by
+        homdefyacc.write_shared_tables() for the workers to load their
+        tables from.
+        The files are handed out chunksize at a time, and the results
+        come back marshalled, as tuples of plain values.
+        Closing the generator early stops the workers.
+    """
+    pool = start_pool(jobs, maxerrors, climbing, compiled, mapfile, spans)
+    try:
+        for data in pool.imap_unordered(_parse, paths, chunksize):
+            yield _result(data)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+if __name__ == '__main__':
+    import argparse
+    argparser = argparse.ArgumentParser(description='Parse homdef specifications in parallel.')
+    argparser.add_argument('-j', '--jobs', type=int, default=None)
+    argparser.add_argument('--tables', help='Table file written by homdefyacc.write_shared_tables()')
+    argparser.add_argument('paths', nargs='+')
+    args = argparser.parse_args()
+
+    failed = 0
+    start = time.time()
+    for result in parse_many(args.paths, args.jobs, mapfile=args.tables):
+        problems = []
+        if result.failure:
+            problems.append(result.failure)
+        problems.extend('illegal input at line %d' % e.lineno for e in result.errors)
+        problems.extend('syntax error at %s' % ('end of input' if e.lineno is None else
+                                                'line %d (%s)' % (e.lineno, e.type))
+                        for e in result.syntaxerrors)
+        if result.program is None and not problems:
+            problems.append('no program')
+        failed += bool(problems)
+        print '%s: %s %.3fs' % (result.path, '; '.join(problems) or 'ok', result.seconds)
+    print '%d files, %d failed, %.2fs' % (len(args.paths), failed, time.time() - start)
+    sys.exit(1 if failed else 0)
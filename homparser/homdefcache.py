@@ -0,0 +1,163 @@
+# ------------------------------------------------------------
+# homdefcache.py
+# On-disk cache of parsed homdef specifications
+# ------------------------------------------------------------
+import os
+import time
+import errno
+import hashlib
+import marshal
+import tempfile
+
+import homdefast as ast
+import homdefyacc
+from homdefparser import HomdefParser
+
+# Version of the cached tree format.  Change it whenever the fields of the
+# ast nodes change, so that old entries are no longer found.
+_format = '3'
+
+
+def _dumps(program):
+    # The cache entry of program, or None if it cannot be serialized.
+    # Whatever goes wrong, the parse itself succeeded and is returned
+    # uncached.
+    try:
+        return marshal.dumps(ast.to_tuple(program))
+    except Exception:
+        return None
+
+
+class ParseCache(object):
+    """ A cache of parsed specifications in directory, keyed by a hash of
+        the source text and the signature of the grammar, so that a
+        change to either of them misses the cache.  Trees with spans are
+        kept apart from those without (see HomdefParser).
+        Each entry is a file holding the marshalled ast.to_tuple() of the
+        program.  Entries are written to a temporary file and renamed
+        into place, so any number of processes can share the directory:
+        a reader sees a whole entry or none.  A hit touches the entry.
+        After every maxsize / 16 bytes written, the least recently used
+        entries are removed until at most maxsize bytes are left.
+        Inputs with illegal characters or syntax errors are parsed every
+        time, since their diagnostics are not cached; with a lazy parser
+        that includes the diagnostics of its bodies.  Neither is a tree
+        that cannot be serialized, nor an entry that cannot be written,
+        for lack of space for instance.
+    """
+    def __init__(self, directory, maxsize=256 * 1024 * 1024, parser=None):
+        self.directory = directory
+        self.maxsize = maxsize
+        self.parser = parser or HomdefParser(climbing=True, compiled=True)
+        self.signature = homdefyacc.get_parser().signature
+        self.hits = 0
+        self.misses = 0
+        # Bytes written since the size of the directory was last checked
+        self.written = 0
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def key(self, data):
+        h = hashlib.sha1(_format + '\0' + self.signature + '\0' +
+                         ('spans\0' if self.parser.spans else ''))
+        h.update(data)
+        return h.hexdigest()
+
+    def get(self, key):
+        """ Return the program cached under key, or None.
+        """
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, 'rb') as f:
+                program = ast.from_tuple(marshal.load(f))
+            os.utime(path, None)
+        except (IOError, OSError, EOFError, ValueError, TypeError, KeyError, IndexError):
+            # Missing, evicted meanwhile, damaged or of an older format
+            return None
+        return program
+
+    def put(self, key, program):
+        data = _dumps(program)
+        if data is not None:
+            self.store(key, data)
+
+    def store(self, key, data):
+        fd, tmppath = tempfile.mkstemp(dir=self.directory, prefix='.tmp')
+        stored = False
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.rename(tmppath, os.path.join(self.directory, key))
+            stored = True
+        except (IOError, OSError):
+            # A full disk or a directory removed meanwhile only costs the
+            # entry, as a damaged entry does in get()
+            pass
+        finally:
+            if not stored:
+                try:
+                    os.unlink(tmppath)
+                except OSError:
+                    pass
+        if not stored:
+            return
+        self.written += len(data)
+        if self.written > self.maxsize // 16:
+            self.evict()
+
+    def evict(self):
+        """ Remove the least recently used entries until at most maxsize
+            bytes are stored.
+        """
+        self.written = 0
+        entries = []
+        total = 0
+        now = time.time()
+        for name in os.listdir(self.directory):
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            if name.startswith('.'):
+                # Left behind by a writer that died an hour ago or more
+                if now - st.st_mtime > 3600:
+                    entries.append((0, 0, name))
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+            total += st.st_size
+        entries.sort()
+        for mtime, size, name in entries:
+            if total <= self.maxsize and mtime:
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+    def parse(self, data, debug=False):
+        """ Return the ast.Program of data, from the cache if possible.
+        """
+        key = self.key(data)
+        program = self.get(key)
+        if program is not None:
+            self.hits += 1
+            return program
+
+        self.misses += 1
+        program = self.parser.parse(data, debug)
+        if program is not None:
+            # The bodies a lazy parse skipped are parsed while the tree is
+            # serialized, so only then are all the diagnostics known
+            entry = _dumps(program)
+            if entry is not None and not self.parser.errors and not self.parser.syntaxerrors:
+                self.store(key, entry)
+        return program
+
+    def parse_file(self, filename, debug=False):
+        with open(filename, 'rb') as f:
+            data = f.read()
+        return self.parse(data, debug)
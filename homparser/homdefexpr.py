@@ -0,0 +1,216 @@
+# ------------------------------------------------------------
+# homdefexpr.py
+# Precedence climbing for homdef expressions
+# ------------------------------------------------------------
+import ply.lex as lex
+import homdefast as ast
+
+# Binding power of the binary operators, all of them left associative
+binaryprec = {
+    'OR': 1,
+    'AND': 2,
+    'EQEQ': 3, 'NEQ': 3,
+    'LT': 4, 'LEQ': 4, 'GT': 4, 'GEQ': 4,
+    'PLUS': 5, 'MINUS': 5,
+    'TIMES': 6, 'DIV': 6,
+}
+
+unaryops = frozenset(['PLUS', 'MINUS', 'EXCLAMATION', 'TILDE'])
+constants = frozenset(['NUMBER', 'TRUE', 'FALSE'])
+
+# Tokens that can start an expression
+starts = unaryops | constants | frozenset(['IDENT', 'LPAREN'])
+
+
+class _Backtrack(Exception):
+    pass
+
+
+# The states that accept an EXPR token, by action table.  The table is kept
+# with them, so that its id is not reused.
+_exprstates = {}
+
+
+def exprstates(action):
+    entry = _exprstates.get(id(action))
+    if entry is None:
+        states = frozenset(state for state, actions in action.items() if 'EXPR' in actions)
+        entry = _exprstates[id(action)] = (action, states)
+    return entry[1]
+
+
+class ExpressionFeed(object):
+    """ Token function for LRParser.parse() that parses expressions by
+        precedence climbing instead of through the LALR tables.
+        Whenever the parser asks for a token in a state that accepts an
+        expression, the whole expression is parsed here and handed over
+        as a single EXPR token whose value is the ast node.  The nodes
+        are the same ones the grammar rules build, and if the parser
+        gives spans (see LRParser.set_spanned()), they get the same
+        spans: the tokens of the rule that built them, which leaves out
+        the parentheses around a node.  An expression that is not well
+        formed is left to the tables: its tokens are replayed unchanged,
+        so errors are reported as before.  After a syntax error
+        all tokens go to the tables, so that error recovery also sees the
+        same tokens.
+    """
+    def __init__(self, parser, get_token):
+        self.parser = parser
+        self.get_token = get_token
+        self.exprstates = exprstates(parser.action)
+        self.spans = bool(parser.spanned)
+        self.pending = []      # Tokens to replay, the next one last
+        self.consumed = []     # Tokens read for the current expression
+        self.tok = None        # Current token
+        self.type = None       # Type of the current token
+
+        # errorok is cleared by a syntax error and stays so for the rest of
+        # the parse unless p_error() calls errok()
+        parser.errorok = True
+
+    def token(self):
+        if self.pending:
+            return self.pending.pop()
+        tok = self.get_token()
+        parser = self.parser
+        if tok is None or tok.type not in starts or not parser.errorok or \
+           parser.statestack[-1] not in self.exprstates:
+            return tok
+
+        self.tok = tok
+        self.type = tok.type
+        self.consumed = [tok]
+        try:
+            node = self.expression()
+        except (_Backtrack, RuntimeError):
+            # Ill-formed or too deeply nested: let the tables have it
+            self.pending = self.consumed[::-1]
+            return self.pending.pop()
+
+        self.pending.append(self.tok)
+        t = lex.LexToken()
+        t.type = 'EXPR'
+        t.value = node
+        t.lineno = tok.lineno
+        t.lexpos = tok.lexpos
+        if self.spans:
+            t.endlexpos = self.consumed[-2].endlexpos
+        return t
+
+    def advance(self):
+        tok = self.tok = self.get_token()
+        self.consumed.append(tok)
+        self.type = tok.type if tok is not None else None
+
+    def expect(self, type):
+        if self.type != type:
+            raise _Backtrack
+        self.advance()
+
+    # With spans, a node starts at the first token of its rule, which is
+    # kept in first, and ends with the last token read for it, which is
+    # the one before the current token.
+
+    # expression : orExpression
+    #            | orExpression QUESTION expression COLON expression
+    def expression(self):
+        first = self.tok
+        cond = self.binary(1)
+        if self.type != 'QUESTION':
+            return cond
+        self.advance()
+        btrue = self.expression()
+        self.expect('COLON')
+        node = ast.ConditionalExpression(cond, btrue, self.expression())
+        if self.spans:
+            node.start = first.lexpos
+            node.end = self.consumed[-2].endlexpos
+        return node
+
+    # orExpression down to multiplicativeExpression
+    def binary(self, minprec):
+        first = self.tok
+        left = self.unary()
+        prec = binaryprec.get(self.type)
+        while prec is not None and prec >= minprec:
+            op = self.tok.value
+            self.advance()
+            left = ast.BinaryExpr(op, left, self.binary(prec + 1))
+            if self.spans:
+                left.start = first.lexpos
+                left.end = self.consumed[-2].endlexpos
+            prec = binaryprec.get(self.type)
+        return left
+
+    # unaryExpression : unop unaryExpression
+    #                 | postfixExpression
+    def unary(self):
+        if self.type in unaryops:
+            first = self.tok
+            self.advance()
+            node = ast.UnaryExpr(first.value, self.unary())
+            if self.spans:
+                node.start = first.lexpos
+                node.end = self.consumed[-2].endlexpos
+            return node
+        return self.postfix()
+
+    # postfixExpression : constant
+    #                   | identifier
+    #                   | LPAREN expression RPAREN
+    #                   | IDENT LPAREN expressionlist RPAREN
+    #                   | postfixExpression LBRACKET expression RBRACKET
+    def postfix(self):
+        tok = self.tok
+        if tok is None:
+            # The input ends inside the expression
+            raise _Backtrack
+        type = self.type
+        if type in constants:
+            self.advance()
+            node = ast.Constant(tok.value)
+            if self.spans:
+                node.start = tok.lexpos
+                node.end = tok.endlexpos
+        elif type == 'IDENT':
+            self.advance()
+            if self.type == 'LPAREN':
+                self.advance()
+                node = ast.FunctionCall(tok.value, self.expressionlist())
+                if self.spans:
+                    node.start = tok.lexpos
+                    node.end = self.consumed[-2].endlexpos
+            else:
+                node = ast.Var(tok.value, None)
+                if self.spans:
+                    node.start = tok.lexpos
+                    node.end = tok.endlexpos
+        elif type == 'LPAREN':
+            self.advance()
+            node = self.expression()
+            self.expect('RPAREN')
+        else:
+            raise _Backtrack
+
+        while self.type == 'LBRACKET':
+            self.advance()
+            node = ast.ArrayAccess(node, self.expression())
+            self.expect('RBRACKET')
+            if self.spans:
+                node.start = tok.lexpos
+                node.end = self.consumed[-2].endlexpos
+        return node
+
+    # expressionlist : expressionlist COMMA expression
+    #                | expression
+    #                |
+    # followed by the closing RPAREN
+    def expressionlist(self):
+        args = []
+        if self.type != 'COMMA' and self.type != 'RPAREN':
+            args.append(self.expression())
+        while self.type == 'COMMA':
+            self.advance()
+            args.append(self.expression())
+        self.expect('RPAREN')
+        return args
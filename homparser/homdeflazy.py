@@ -0,0 +1,65 @@
+# ------------------------------------------------------------
+# homdeflazy.py
+# Skipping the bodies of homdef specifications
+# ------------------------------------------------------------
+import re
+import ply.lex as lex
+import homdefast as ast
+
+_braces = re.compile(r'[{}]')
+
+
+class BodyFeed(object):
+    """ Token function for LRParser.parse() that skips the bodies of
+        the join and sequential specs.
+        When the token after the closing parenthesis of a locals list is
+        a brace, the matching brace is found in the input text and the
+        lexer continues behind it.  The block is handed over as a single
+        LAZYBODY token whose value is an ast.LazyBody, which parse_body
+        turns into the ast.Block when the body is first used.  homdef has
+        no comments or strings, so every brace in the text is a token.
+        A block without its closing brace is left to the tables.
+    """
+    def __init__(self, lexer, get_token, parse_body):
+        self.lexer = lexer
+        self.get_token = get_token
+        self.parse_body = parse_body
+        self.locals = False    # Inside the parentheses of a locals list
+        self.body = False      # Right behind them
+
+    def token(self):
+        tok = self.get_token()
+        if tok is None:
+            return None
+        body, self.body = self.body, False
+        if tok.type == 'LOCALS':
+            self.locals = True
+        elif tok.type == 'RPAREN' and self.locals:
+            # An arglist has no parentheses of its own
+            self.locals = False
+            self.body = True
+        elif tok.type == 'LBRACE' and body:
+            return self.skip(tok) or tok
+        return tok
+
+    def skip(self, tok):
+        lexer = self.lexer
+        depth = 0
+        for m in _braces.finditer(lexer.lexdata, tok.lexpos):
+            if m.group() == '{':
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0:
+                end = m.end()
+                text = lexer.lexdata[tok.lexpos:end]
+                lexer.lexpos = end
+                lexer.lineno += text.count('\n')
+                body = lex.LexToken()
+                body.type = 'LAZYBODY'
+                body.value = ast.LazyBody(text, tok.lexpos, tok.lineno, self.parse_body)
+                body.lineno = tok.lineno
+                body.lexpos = tok.lexpos
+                body.endlexpos = end
+                return body
+        return None
@@ -2,8 +2,16 @@
 # homdeflex.py
 # Parse a small subset of C
 # ------------------------------------------------------------
+import re
+from collections import namedtuple
+
 import ply.lex as lex
 
+try:
+    intern
+except NameError:
+    from sys import intern
+
 # List of token names.   This is always required
 reserved = {
     'if' : 'IF',
@@ -86,16 +94,31 @@ t_LPAREN  = r'\('
 t_RPAREN  = r'\)'
 
 
+# Identifiers and numbers are looked up in the lexer's symbol table, so
+# that every occurrence of the same name or literal in an input shares one
+# object.  Names are also interned, which extends the sharing to every
+# tree parsed by the process.  intern() only takes byte strings on Python 2,
+# so names read from unicode input are only shared through the table.
+
 # A regular expression rule with some action code
 def t_NUMBER(t):
     r'\d+\.*\d*'
-    t.value = int(t.value)
+    value = int(t.value)
+    t.value = t.lexer.symbols.setdefault(value, value)
     return t
 
 
 def t_IDENT(t):
     r'[a-zA-Z_][a-zA-Z_0-9]*'
-    t.type = reserved.get(t.value, 'IDENT')
+    symbols = t.lexer.symbols
+    value = symbols.get(t.value)
+    if value is None:
+        value = t.value
+        if type(value) is str:
+            value = intern(value)
+        symbols[value] = value
+    t.value = value
+    t.type = reserved.get(value, 'IDENT')
     return t
 
 # EOF handling rule
@@ -108,10 +131,41 @@ def t_newline(t):
 # A string containing ignored characters (spaces and tabs)
 t_ignore  = ' \t'
 
+# Illegal characters are not printed but recorded in the errors list of the
+# lexer, one IllegalInput per run of characters that cannot start a token.
+# Once more than maxerrors runs have been recorded the input is rejected
+# with a LexError.
+IllegalInput = namedtuple('IllegalInput', 'offset length lineno')
+
+illegal_re = re.compile(r'[^ \t\na-zA-Z0-9_&:,=!<>{}\[\]()|+?;~*/-]+')
+
 # Error handling rule
 def t_error(t):
-    print("Illegal character '%s'" % t.value[0])
-    t.lexer.skip(1)
+    lexer = t.lexer
+    m = illegal_re.match(lexer.lexdata, t.lexpos)
+    length = m.end() - t.lexpos if m else 1
+    errors = lexer.errors
+    if lexer.maxerrors is not None and len(errors) >= lexer.maxerrors:
+        raise lex.LexError('Too many illegal characters (line %d)' % t.lineno,
+                           lexer.lexdata[t.lexpos:t.lexpos + length])
+    errors.append(IllegalInput(t.lexpos, length, t.lineno))
+    lexer.skip(length)
+
+# Build the lexer.  In optimized mode the rules are not validated and the
+# master regular expressions are read back from lextab.py, which is
+# rewritten whenever the signature of the token rules changes.
+lexer = lex.lex(optimize=1, lextab='lextab')
+lexer.lexerrorlen = 1
+lexer.maxerrors = None
+
+
+def reset(lexer):
+    """ Prepare lexer for a new input: restart the line count and start
+        a new symbol table and error list, so that nothing is carried over
+        from the inputs before.
+    """
+    lexer.lineno = 1
+    lexer.symbols = {}
+    lexer.errors = []
 
-# Build the lexer
-lexer = lex.lex()
\ No newline at end of file
+reset(lexer)
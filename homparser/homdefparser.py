@@ -0,0 +1,271 @@
+# ------------------------------------------------------------
+# homdefparser.py
+# Reentrant parser objects for homdef specifications
+# ------------------------------------------------------------
+import os
+import mmap
+import itertools
+from collections import namedtuple
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+import homdeflex
+import homdefyacc
+import homdefast as ast
+import ply.lex as lex
+from homdefstream import StreamLexer
+from homdefexpr import ExpressionFeed
+from homdeflazy import BodyFeed
+from homdeftokens import ArrayFeed
+
+# A token the parser could not accept.  At the end of the input the type is
+# '$end' and the other fields are None.
+UnexpectedToken = namedtuple('UnexpectedToken', 'lexpos lineno type value')
+
+
+# Add the diagnostics in items to the list into, keeping it in the order of
+# key
+def _merge(into, items, key):
+    if items:
+        into.extend(items)
+        into.sort(key=key)
+
+
+# The end of the input comes after every token
+def _tokenpos(tok):
+    return tok.lexpos if tok.lexpos is not None else float('inf')
+
+
+def _shifted(tokens, offset):
+    for tok in tokens:
+        tok.lexpos += offset
+        tok.endlexpos += offset
+        yield tok
+
+
+class HomdefParser(object):
+    """ A lexer and a parser owned by a single caller.
+        The regular expressions and LALR tables are shared with the
+        module-level lexer and parser, so creating an instance is cheap.
+        Only the lexer position and the parse stacks are private, which
+        makes it safe to use different instances from different threads.
+        Illegal characters are collected in errors; an input with more
+        than maxerrors runs of them is rejected with a LexError.  The
+        tokens that caused syntax errors are collected in syntaxerrors.
+        With climbing set, expressions are parsed by precedence climbing
+        (see homdefexpr.py) instead of by the tables, which is several
+        times faster and builds the same tree.  With compiled set, the
+        parser compiled into parsecode.py is used instead of the generic
+        LALR loop.
+        With lazy set, the bodies of the join and sequential specs are
+        only brace-matched (see homdeflazy.py), and parsed when their body
+        attribute is first read.  Illegal characters and syntax errors in
+        a body are only reported then: they are added, in input order, to
+        the errors and syntaxerrors lists of the parse the body was
+        skipped in.  parse_stream() ignores lazy.
+        With spans set, as it is by default, every ast node gets the
+        offsets of its source text in start and end (see homdefast.Node).
+        Turning it off saves the few percent of parsing time it costs.
+    """
+    def __init__(self, maxerrors=100, climbing=False, compiled=False, lazy=False, spans=True):
+        self.lexer = homdeflex.lexer.clone()
+        self.lexer.maxerrors = maxerrors
+        if compiled:
+            self.parser = homdefyacc.get_compiled_parser().clone()
+        else:
+            self.parser = homdefyacc.get_parser().clone()
+        if spans:
+            self.parser.set_spanned([ast.Node])
+        self.errorfunc = self.parser.errorfunc
+        self.parser.errorfunc = self.syntax_error
+        self.climbing = climbing
+        self.compiled = compiled
+        self.lazy = lazy
+        self.spans = spans
+        self.reset()
+
+    def reset(self):
+        """ Prepare the lexer for a new input: restart the line count and
+            start a new symbol table and error lists.
+        """
+        homdeflex.reset(self.lexer)
+        self.syntaxerrors = []
+
+    @property
+    def errors(self):
+        """ The homdeflex.IllegalInput diagnostics of the last input.
+        """
+        return self.lexer.errors
+
+    def syntax_error(self, tok):
+        if tok is None:
+            self.syntaxerrors.append(UnexpectedToken(None, None, '$end', None))
+        else:
+            # The value of an EXPR token is an ast node
+            value = tok.value if tok.type != 'EXPR' else None
+            self.syntaxerrors.append(UnexpectedToken(tok.lexpos, tok.lineno, tok.type, value))
+        return self.errorfunc(tok)
+
+    def tokenfunc(self, get_token):
+        if self.climbing:
+            return ExpressionFeed(self.parser, get_token).token
+        return get_token
+
+    def parse(self, data, debug=False):
+        """ Parse a complete specification and return its ast.Program.
+        """
+        self.reset()
+        get_token = self.lexer.token
+        if self.lazy:
+            get_token = BodyFeed(self.lexer, get_token, self.body_parser()).token
+        return self.parser.parse(data, lexer=self.lexer, debug=debug,
+                                 tokenfunc=self.tokenfunc(get_token))
+
+    def parse_tokens(self, tokens, debug=False):
+        """ Parse a complete specification that was already tokenized
+            into a TokenArray (see homdeftokens.py) and return its
+            ast.Program.  The illegal characters recorded in tokens
+            become the errors of this parse.
+        """
+        self.reset()
+        self.lexer.input(tokens.data)
+        self.lexer.errors.extend(tokens.errors)
+        get_token = ArrayFeed(tokens, self.lexer).token
+        if self.lazy:
+            get_token = BodyFeed(self.lexer, get_token, self.body_parser()).token
+        return self.parser.parse(lexer=self.lexer, debug=debug,
+                                 tokenfunc=self.tokenfunc(get_token))
+
+    def body_parser(self):
+        # The bodies of the current parse report to its diagnostics, which
+        # reset() replaces before the next one
+        errors, syntaxerrors = self.lexer.errors, self.syntaxerrors
+        return lambda body: self.parse_body(body, errors, syntaxerrors)
+
+    def parse_body(self, body, errors=None, syntaxerrors=None):
+        """ Parse the ast.LazyBody of a lazy parse.  This uses a parser
+            of its own, since the body may be read at any later time.
+            Its diagnostics are merged into the lists errors and
+            syntaxerrors, if given.
+        """
+        parser = HomdefParser(self.lexer.maxerrors, self.climbing, self.compiled,
+                              spans=self.spans)
+        try:
+            return parser.parse_fragment('statement', body.text, lineno=body.lineno,
+                                         offset=body.offset)
+        finally:
+            if errors is not None:
+                _merge(errors, parser.errors, lambda e: e.offset)
+            if syntaxerrors is not None:
+                _merge(syntaxerrors, parser.syntaxerrors, _tokenpos)
+
+    def parse_fragment(self, symbol, data, debug=False, lineno=1, offset=0):
+        """ Parse data as a single expression, statement, arglist,
+            joinspec or sequentialspec, as named by symbol, and return
+            its ast node (a list of ast.Argument for an arglist).  This
+            uses the same tables as a program parse.  data starts on line
+            lineno and at offset of a larger input: the spans of the
+            nodes and the positions of the errors are offsets in that
+            input.
+        """
+        try:
+            marker = lex.LexToken()
+            marker.type = homdefyacc.fragments[symbol]
+        except KeyError:
+            raise ValueError('No fragment parser for %r' % symbol)
+        marker.value = None
+        marker.lineno = lineno
+
+        self.reset()
+        self.lexer.lineno = lineno
+        self.lexer.input(data)
+        tokens = iter(self.lexer.token, None)
+        if offset:
+            tokens = _shifted(tokens, offset)
+        # The marker takes the place of the first token, so that it does
+        # not widen the span of the fragment
+        first = next(tokens, None)
+        marker.lexpos = marker.endlexpos = first.lexpos if first is not None else offset
+        tokens = itertools.chain([marker] if first is None else [marker, first], tokens)
+        get_token = lambda: next(tokens, None)
+        try:
+            return self.parser.parse(lexer=self.lexer, debug=debug,
+                                     tokenfunc=self.tokenfunc(get_token))
+        finally:
+            if offset:
+                errors = self.lexer.errors
+                errors[:] = [e._replace(offset=e.offset + offset) for e in errors]
+
+    def position(self, lexpos):
+        """ Return the (line, column) of a position in the last input.
+        """
+        return self.lexer.position(lexpos)
+
+    def parse_file(self, filename, debug=False):
+        """ Parse the specification stored in filename.
+            The file is mapped into memory instead of being read, so the
+            lexer matches directly against the page cache and only the
+            token values are copied out of it.
+        """
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return self.parse('', debug)
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return self.parse(data, debug)
+        finally:
+            # Index the lines while the mapping is still open, so that
+            # position() keeps working after it is closed
+            self.lexer.position(0)
+            data.close()
+
+    def parse_stream(self, f, chunksize=65536, debug=False):
+        """ Parse a specification read from the file object f while it
+            is being read, holding at most one chunk of it in memory.
+        """
+        self.reset()
+        stream = StreamLexer(f, chunksize, self.lexer)
+        return self.parser.parse(lexer=self.lexer, debug=debug,
+                                 tokenfunc=self.tokenfunc(stream.token))
+
+
+class HomdefParserPool(object):
+    """ A bounded pool of ready HomdefParser instances.
+        acquire() blocks while all the parsers are in use, so the pool
+        size also bounds the number of concurrent parses.
+    """
+    def __init__(self, size=4, maxerrors=100, climbing=False, compiled=False, lazy=False,
+                 spans=True):
+        self.size = size
+        self.free = queue.Queue(size)
+        for i in range(size):
+            self.free.put(HomdefParser(maxerrors, climbing, compiled, lazy, spans))
+
+    def acquire(self, block=True, timeout=None):
+        return self.free.get(block, timeout)
+
+    def release(self, parser):
+        self.free.put_nowait(parser)
+
+    def parse(self, data, debug=False):
+        parser = self.acquire()
+        try:
+            return parser.parse(data, debug)
+        finally:
+            self.release(parser)
+
+    def parse_file(self, filename, debug=False):
+        parser = self.acquire()
+        try:
+            return parser.parse_file(filename, debug)
+        finally:
+            self.release(parser)
+
+    def parse_stream(self, f, chunksize=65536, debug=False):
+        parser = self.acquire()
+        try:
+            return parser.parse_stream(f, chunksize, debug)
+        finally:
+            self.release(parser)
@@ -0,0 +1,91 @@
+# ------------------------------------------------------------
+# homdefstream.py
+# Lexing homdef specifications from a stream
+# ------------------------------------------------------------
+import homdeflex
+
+
+class StreamLexer(object):
+    """ Feeds a lexer from a file object in fixed-size chunks.
+        No homdef token spans a newline, so every chunk is cut after its
+        last newline and the incomplete line is carried over to the next
+        one.  Only one chunk (plus that carried-over line) is in memory at
+        a time, and token and error positions are offsets in the whole
+        stream.
+        Without a lexer, a clone of the module lexer is used, with a
+        symbol table and error list of its own.
+        The token() method can be used as the tokenfunc of
+        LRParser.parse().  Sockets can be read through socket.makefile().
+    """
+    def __init__(self, f, chunksize=65536, lexer=None):
+        if lexer is None:
+            # A clone shares the containers of the module lexer
+            lexer = homdeflex.lexer.clone()
+            homdeflex.reset(lexer)
+        self.file = f
+        self.chunksize = chunksize
+        self.lexer = lexer
+        self.lexer.lineno = 1
+        self.lexer.input('')
+        self.offset = 0        # Stream offset of the chunk being lexed
+        self.consumed = 0      # Number of characters handed to the lexer
+        self.tail = ''         # Incomplete line carried over
+        self.errormark = len(self.lexer.errors)   # First error of the current chunk
+        self.eof = False
+
+    def fill(self):
+        """ Hand the next complete lines to the lexer.
+            Returns False once the stream is exhausted.
+        """
+        self.shift_errors()
+        data = self.tail
+        self.tail = ''
+        while not self.eof:
+            chunk = self.file.read(self.chunksize)
+            if not chunk:
+                self.eof = True
+                break
+            data += chunk
+            cut = data.rfind('\n', len(data) - len(chunk)) + 1
+            if cut:
+                self.tail = data[cut:]
+                data = data[:cut]
+                break
+
+        if not data:
+            return False
+        self.offset = self.consumed
+        self.consumed += len(data)
+        self.lexer.input(data)
+        return True
+
+    def shift_errors(self):
+        # The lexer records errors at offsets in the current chunk
+        errors = self.lexer.errors
+        offset = self.offset
+        for i in range(self.errormark, len(errors)):
+            e = errors[i]
+            errors[i] = e._replace(offset=e.offset + offset)
+        self.errormark = len(errors)
+
+    def token(self):
+        while True:
+            tok = self.lexer.token()
+            if tok is not None:
+                tok.lexpos += self.offset
+                tok.endlexpos += self.offset
+                return tok
+            if not self.fill():
+                return None
+
+    # Iterator interface
+    def __iter__(self):
+        return self
+
+    def next(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+    __next__ = next
@@ -0,0 +1,378 @@
+# ------------------------------------------------------------
+# homdeftokens.py
+# Columnar tokenization of homdef specifications
+# ------------------------------------------------------------
+import re
+import bisect
+import marshal
+import multiprocessing
+from array import array
+
+import homdeflex
+import ply.lex as lex
+
+try:
+    intern
+except NameError:
+    from sys import intern
+
+# The raw bytes of an array, under their Python 3 names where they exist
+_tobytes = getattr(array, 'tobytes', array.tostring)
+_frombytes = getattr(array, 'frombytes', array.fromstring)
+
+# Token types are stored as small integer codes: the position of the token
+# name in homdeflex.tokens.
+typenames = tuple(homdeflex.tokens)
+typecodes = dict((name, code) for code, name in enumerate(typenames))
+
+# Codes of the reserved words, looked up when an identifier is matched
+keywordcodes = dict((word, typecodes[name]) for word, name in homdeflex.reserved.items())
+
+# Negative codes mark matches that do not produce a token
+_IGNORE = -1
+_NEWLINE = -2
+_IDENT = -3
+_ERROR = -4
+
+
+class TokenArray(object):
+    """ The tokens of one input, stored column-wise.
+        types:
+            Token type codes (index into typenames)
+        starts:
+            Offset of the first character of each token
+        lengths:
+            Number of characters in each token
+        linenos:
+            Line number of each token
+        errors:
+            homdeflex.IllegalInput of every run of illegal characters
+            that was skipped
+        The columns are array.array buffers, so numpy.frombuffer() can
+        wrap them without a copy.
+    """
+    __slots__ = ('data', 'types', 'starts', 'lengths', 'linenos', 'errors', 'linestarts')
+
+    def __init__(self, data):
+        self.data = data
+        self.types = array('B')
+        self.starts = array('l')
+        self.lengths = array('l')
+        self.linenos = array('l')
+        self.errors = []
+        self.linestarts = None
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, i):
+        return typenames[self.types[i]]
+
+    def value(self, i):
+        start = self.starts[i]
+        return self.data[start:start + self.lengths[i]]
+
+    def position(self, offset):
+        """ Return the (line, column) of an offset in the input,
+            both numbered from 1.
+        """
+        linestarts = self.linestarts
+        if linestarts is None:
+            linestarts = self.linestarts = lex.line_starts(self.data)
+        line = bisect.bisect_right(linestarts, offset)
+        return line, offset - linestarts[line - 1] + 1
+
+
+def _build_bulk_re(lexer):
+    """ Combine the master regular expressions of the lexer with patterns
+        for the ignored and illegal characters, so that a single finditer()
+        covers the whole input.  Returns the regex and a table mapping the
+        group number of every alternative to a token code.
+    """
+    patterns = []
+    table = [None]
+    for lexre, findex in lexer.lexre:
+        patterns.append(lexre.pattern)
+        for f in findex[1:]:
+            if not f:
+                table.append(None)
+                continue
+            func, tokname = f
+            if func is homdeflex.t_newline:
+                table.append(_NEWLINE)
+            elif func is homdeflex.t_IDENT:
+                table.append(_IDENT)
+            else:
+                table.append(typecodes[tokname])
+    patterns.append('(?P<ignore>[%s]+)' % re.escape(lexer.lexignore))
+    table.append(_IGNORE)
+    patterns.append(r'(?P<error>%s|[\s\S])' % homdeflex.illegal_re.pattern)
+    table.append(_ERROR)
+    return re.compile('|'.join(patterns), lexer.lexreflags), table
+
+
+_bulk_re, _bulk_table = _build_bulk_re(homdeflex.lexer)
+
+
+def tokenize_bulk(data, maxerrors=None):
+    """ Tokenize a complete input without creating a LexToken per token.
+        data may be a string or a buffer such as an mmap object; values
+        are only sliced out of it by TokenArray.value().
+        Illegal characters are handled as by the lexer: a LexError is
+        raised once more than maxerrors runs of them have been found.
+        Returns a TokenArray.
+    """
+    if not isinstance(data[:1], lex.StringTypes) and lex.BufferType is not None:
+        data = lex.BufferType(data)
+    tokens = TokenArray(data)
+    _tokenize(tokens, data, 0, 1, maxerrors)
+    return tokens
+
+
+def _tokenize(tokens, data, offset, lineno, maxerrors):
+    # Append the tokens of data to tokens.  data starts at offset and on
+    # line lineno of the input.  As in homdeflex.t_error(), the run of
+    # illegal characters that exceeds maxerrors is not recorded: the
+    # LexError is raised instead.
+    types = tokens.types.append
+    starts = tokens.starts.append
+    lengths = tokens.lengths.append
+    linenos = tokens.linenos.append
+    errors = tokens.errors
+    table = _bulk_table
+    identcode = typecodes['IDENT']
+
+    for m in _bulk_re.finditer(data):
+        code = table[m.lastindex]
+        if code < 0:
+            if code == _IDENT:
+                code = keywordcodes.get(m.group(), identcode)
+            elif code == _NEWLINE:
+                lineno += m.end() - m.start()
+                continue
+            elif code == _ERROR:
+                if maxerrors is not None and len(errors) >= maxerrors:
+                    raise lex.LexError('Too many illegal characters (line %d)' % lineno, m.group())
+                errors.append(homdeflex.IllegalInput(offset + m.start(), m.end() - m.start(), lineno))
+                continue
+            else:
+                continue
+        start = m.start()
+        types(code)
+        starts(offset + start)
+        lengths(m.end() - start)
+        linenos(lineno)
+
+
+_newline_re = re.compile(r'\n')
+
+
+def split_lines(data, chunksize):
+    """ Yield (start, end) offsets that cut data into chunks of about
+        chunksize characters, each ending after a newline except for the
+        last one.  No token spans a newline, so the chunks can be
+        tokenized separately.
+    """
+    start = 0
+    while start < len(data):
+        m = _newline_re.search(data, start + chunksize - 1)
+        end = m.end() if m else len(data)
+        yield start, end
+        start = end
+
+
+def _tokenize_chunk(args):
+    data, offset, lineno, maxerrors = args
+    tokens = TokenArray(data)
+    try:
+        _tokenize(tokens, data, offset, lineno, maxerrors)
+    except lex.LexError:
+        # The parent raises it again, once the errors of the chunks
+        # before this one are counted
+        pass
+    return marshal.dumps((_tobytes(tokens.types), _tobytes(tokens.starts),
+                          _tobytes(tokens.lengths), _tobytes(tokens.linenos),
+                          [tuple(e) for e in tokens.errors]))
+
+
+def tokenize_parallel(data, pool=None, chunksize=1 << 22, maxerrors=None):
+    """ Tokenize a complete input as tokenize_bulk() does, with its
+        chunks (see split_lines()) tokenized in parallel by the workers
+        of pool, a multiprocessing.Pool.  By default a pool with one
+        worker per CPU is started for the call.
+        The columns of each chunk come back with the offsets and line
+        numbers of the whole input and are concatenated in order.  Only
+        worth it for inputs of many megabytes: every chunk is copied to
+        a worker and its columns are copied back.
+        Returns a TokenArray.
+    """
+    def chunks():
+        lineno = 1
+        for start, end in split_lines(data, chunksize):
+            chunk = data[start:end]
+            # A chunk keeps the run that exceeds maxerrors, for the
+            # LexError raised here
+            yield chunk, start, lineno, maxerrors + 1 if maxerrors is not None else None
+            lineno += chunk.count('\n')
+
+    own = pool is None
+    if own:
+        pool = multiprocessing.Pool()
+    try:
+        tokens = TokenArray(data)
+        for result in pool.imap(_tokenize_chunk, chunks()):
+            types, starts, lengths, linenos, errors = marshal.loads(result)
+            for e in errors:
+                e = homdeflex.IllegalInput(*e)
+                if maxerrors is not None and len(tokens.errors) >= maxerrors:
+                    raise lex.LexError('Too many illegal characters (line %d)' % e.lineno,
+                                       data[e.offset:e.offset + e.length])
+                tokens.errors.append(e)
+            _frombytes(tokens.types, types)
+            _frombytes(tokens.starts, starts)
+            _frombytes(tokens.lengths, lengths)
+            _frombytes(tokens.linenos, linenos)
+    finally:
+        if own:
+            pool.terminate()
+            pool.join()
+    return tokens
+
+
+class ArrayFeed(object):
+    """ Token function for LRParser.parse() that hands out the tokens of
+        a TokenArray as LexTokens with the values the lexer gives them.
+        lexer is the lexer passed to parse(), for its symbol table.  Its
+        lexpos and lineno follow the tokens; a token function that moves
+        lexpos forward (see homdeflazy.BodyFeed) skips the tokens before
+        the new position.
+    """
+    def __init__(self, tokens, lexer):
+        self.tokens = tokens
+        self.lexer = lexer
+        self.index = 0
+
+    def token(self):
+        tokens = self.tokens
+        starts = tokens.starts
+        lexer = self.lexer
+        i = self.index
+        if i < len(starts) and starts[i] < lexer.lexpos:
+            i = bisect.bisect_left(starts, lexer.lexpos, i)
+        if i >= len(starts):
+            self.index = i
+            return None
+        self.index = i + 1
+
+        start = starts[i]
+        end = start + tokens.lengths[i]
+        tok = lex.LexToken()
+        tok.type = type = typenames[tokens.types[i]]
+        tok.lineno = lexer.lineno = tokens.linenos[i]
+        tok.lexpos = start
+        tok.endlexpos = lexer.lexpos = end
+        value = tokens.data[start:end]
+        if type == 'NUMBER':
+            value = int(value)
+            value = lexer.symbols.setdefault(value, value)
+        elif type == 'IDENT' or value in homdeflex.reserved:
+            symbols = lexer.symbols
+            name = symbols.get(value)
+            if name is None:
+                # See homdeflex.t_IDENT()
+                name = intern(value) if value.__class__ is str else value
+                symbols[name] = name
+            value = name
+        tok.value = value
+        return tok
+
+
+def relex(tokens, offset, removed, inserted):
+    """ Apply an edit to the text of a TokenArray and relex only the part
+        of it that the edit can affect.  The edit replaces removed
+        characters at offset with the string inserted.
+        Relexing starts at the beginning of the edited line, since no
+        token spans a newline, and stops at the first token after the
+        edit that starts where a token started before the edit: from
+        there on the old tokens are kept and only shifted.
+        Only the relexing is O(edit).  The starts and line numbers of
+        every token after the edit are shifted one by one, since the
+        columns hold absolute offsets, and the text is copied, so the
+        cost of an edit also grows with the part of the input after it:
+        an edit near the end of a large input is much cheaper than one
+        near the start.
+        tokens is updated in place.  Returns (first, oldend, newend):
+        the tokens in [first:oldend] before the edit were replaced by the
+        tokens in [first:newend].
+    """
+    old = tokens.data
+    data = old[:offset] + inserted + old[offset + removed:]
+    delta = len(inserted) - removed
+    linedelta = inserted.count('\n') - old.count('\n', offset, offset + removed)
+    editend = offset + len(inserted)
+
+    starts = tokens.starts
+    count = len(starts)
+    linestart = old.rfind('\n', 0, offset) + 1
+    first = bisect.bisect_left(starts, linestart)
+    if first:
+        lineno = tokens.linenos[first - 1] + old.count('\n', starts[first - 1], linestart)
+    else:
+        lineno = 1 + old.count('\n', 0, linestart)
+
+    types = array('B')
+    newstarts = array('l')
+    lengths = array('l')
+    linenos = array('l')
+    errors = [e for e in tokens.errors if e.offset < linestart]
+    table = _bulk_table
+    identcode = typecodes['IDENT']
+
+    # Index of the first old token that may still be reused
+    oldend = bisect.bisect_left(starts, editend - delta)
+    resync = len(old)
+    for m in _bulk_re.finditer(data, linestart):
+        code = table[m.lastindex]
+        start = m.start()
+        if start >= editend and (code >= 0 or code == _IDENT):
+            while oldend < count and starts[oldend] < start - delta:
+                oldend += 1
+            if oldend < count and starts[oldend] == start - delta:
+                resync = start - delta
+                break
+        if code < 0:
+            if code == _IDENT:
+                code = keywordcodes.get(m.group(), identcode)
+            elif code == _NEWLINE:
+                lineno += m.end() - start
+                continue
+            elif code == _ERROR:
+                errors.append(homdeflex.IllegalInput(start, m.end() - start, lineno))
+                continue
+            else:
+                continue
+        types.append(code)
+        newstarts.append(start)
+        lengths.append(m.end() - start)
+        linenos.append(lineno)
+    else:
+        oldend = count
+
+    newend = first + len(types)
+    tailstarts = starts[oldend:]
+    if delta:
+        tailstarts = array('l', map(delta.__add__, tailstarts))
+    taillinenos = tokens.linenos[oldend:]
+    if linedelta:
+        taillinenos = array('l', map(linedelta.__add__, taillinenos))
+
+    tokens.types[first:] = types + tokens.types[oldend:]
+    tokens.lengths[first:] = lengths + tokens.lengths[oldend:]
+    starts[first:] = newstarts + tailstarts
+    tokens.linenos[first:] = linenos + taillinenos
+    errors.extend([homdeflex.IllegalInput(e.offset + delta, e.length, e.lineno + linedelta)
+                   for e in tokens.errors if e.offset >= resync])
+    tokens.errors = errors
+    tokens.data = data
+    tokens.linestarts = None
+    return first, oldend, newend
@@ -1,13 +1,47 @@
+import os
+import sys
+import threading
 import ply.yacc as yacc
-from homdeflex import tokens
+import ply.ycompile as ycompile
+import homdeflex
 import homdefast as ast
 
+# EXPR is never produced by the lexer.  It carries an expression that was
+# parsed by precedence climbing instead of by the tables (see homdefexpr.py).
+# Neither are the fragment tokens: a fragment parse sends one of them first,
+# so that the input is parsed as the given symbol instead of as a program
+# (see HomdefParser.parse_fragment()).  LAZYBODY carries the source of a
+# block that a lazy parse skipped (see homdeflazy.py).
+fragments = {
+    'expression': 'START_EXPRESSION',
+    'statement': 'START_STATEMENT',
+    'arglist': 'START_ARGLIST',
+    'joinspec': 'START_JOINSPEC',
+    'sequentialspec': 'START_SEQUENTIALSPEC',
+}
+
+tokens = homdeflex.tokens + ['EXPR', 'LAZYBODY'] + sorted(fragments.values())
+
 precedence = (
     ('nonassoc',    'IFX'),
     ('nonassoc',    'ELSE'),
 )
 
 
+def p_start(p):
+    '''start : program'''
+    p[0] = p[1]
+
+
+def p_start_fragment(p):
+    '''start : START_EXPRESSION expression
+             | START_STATEMENT statement
+             | START_ARGLIST arglist
+             | START_JOINSPEC joinspec
+             | START_SEQUENTIALSPEC sequentialspec'''
+    p[0] = p[2]
+
+
 def p_program(p):
     '''program : joinspec sequentialspec'''
     p[0] = ast.Program(p[1], p[2])
@@ -31,13 +65,12 @@ def p_sequentialspec(p):
     p[0] = ast.SequentialSpec(p[3], p[7], p[11], p[13])
 
 
-# List or arguments
+# List or arguments.  The list rules are left recursive and append to the
+# list built so far, so a list of n elements is built in O(n).
 def p_arglist_mutliple(p):
     ''' arglist : arglist COMMA arg'''
-    if p[1] is []:
-        p[0] = p[1].append(p[3])
-    else:
-        p[0] = [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 def p_arglist_singleton(p):
     '''arglist : arg'''
@@ -49,8 +82,10 @@ def p_arglist_empy(p):
     p[0] = list()
 
 def p_arg(p):
-    '''arg : type IDENT'''
-    p[0] = ast.Argument(p[1], ast.Var(p[2], p[1]))
+    '''arg : type identifier'''
+    # The Var is built by the identifier rule, which gives it its span
+    p[2].type = p[1]
+    p[0] = ast.Argument(p[1], p[2])
 
 def p_arglist_error(p):
     '''arg : error'''
@@ -63,11 +98,9 @@ def p_identlist_singleton(p):
 
 
 def p_identlist_mutliple(p):
-    '''identlist : identifier COMMA identlist'''
-    if p[1] is []:
-        p[0] = p[1].append(p[3])
-    else:
-        p[0] = list(p[3])
+    '''identlist : identlist COMMA identifier'''
+    p[1].append(p[3])
+    p[0] = p[1]
 
 
 def p_identlist_empty(p):
@@ -87,13 +120,16 @@ def p_constant(p):
 
 def p_postfixExpr(p):
     '''postfixExpression : constant
-    | identifier
-    | LPAREN expression RPAREN'''
+    | identifier'''
     p[0] = p[1]
 
+def p_postfixExpr_paren(p):
+    '''postfixExpression : LPAREN expression RPAREN'''
+    p[0] = p[2]
+
 def p_identifer(p):
     '''identifier : IDENT'''
-    p[0] = ast.Var(p[0], None)
+    p[0] = ast.Var(p[1], None)
 
 def p_postfixExpr_array_access(p):
     '''postfixExpression : postfixExpression LBRACKET expression RBRACKET'''
@@ -221,16 +257,23 @@ def p_conditionalExpression(p):
 
 def p_expression(p):
     '''expression : conditionalExpression'''
+    p[0] = p[1]
+
+
+def p_expression_climbed(p):
+    '''expression : EXPR'''
+    p[0] = p[1]
 
 
 def p_expressionlist_singleton(p):
     '''expressionlist : expression'''
-    p[0] = list(p[1])
+    p[0] = [p[1]]
 
 
 def p_expressionlist_list(p):
     '''expressionlist : expressionlist COMMA expression'''
-    p[0] = p[1].append(p[3])
+    p[1].append(p[3])
+    p[0] = p[1]
 
 
 def p_expressionlist_empty(p):
@@ -241,10 +284,8 @@ def p_expressionlist_empty(p):
 # Statements
 def p_statementlist(p):
     '''statementlist : statementlist statement'''
-    if p[1] is None:
-        p[0] = list()
-    else:
-        p[0] = p[1].append(p[2])
+    p[1].append(p[2])
+    p[0] = p[1]
 
 
 def p_statementlist_empty(p):
@@ -258,11 +299,14 @@ def p_assignment(p):
 
 def p_assignment_increment(p):
     '''assignmentStatement : IDENT PLUS PLUS'''
-    p[0] = ast.Assignment(p[1], ast.BinaryExpr(p[2], p[1], ast.Constant(0)))
+    # The increment stands for no source text of its own
+    increment = ast.BinaryExpr(p[2], p[1], ast.unspanned(ast.Constant(0)))
+    p[0] = ast.Assignment(p[1], ast.unspanned(increment))
 
 def p_assignment_decrement(p):
     '''assignmentStatement : IDENT MINUS MINUS'''
-    p[0] = ast.Assignment(p[1], ast.BinaryExpr(p[2], p[1], ast.Constant(0)))
+    decrement = ast.BinaryExpr(p[2], p[1], ast.unspanned(ast.Constant(0)))
+    p[0] = ast.Assignment(p[1], ast.unspanned(decrement))
 
 def p_assignment_rh_error(p):
     '''assignmentStatement : postfixExpression EQ error'''
@@ -306,6 +350,11 @@ def p_block(p):
     p[0] = ast.Block(p[2])
 
 
+def p_block_lazy(p):
+    '''block : LAZYBODY'''
+    p[0] = p[1]
+
+
 # Types
 
 
@@ -325,5 +374,113 @@ def p_error(p):
 # Error
 
 
-
-parser = yacc.yacc()
\ No newline at end of file
+# The parsing tables are generated ahead of time into parsetab.py by running
+# this module as a script.  Importing it does not touch the tables at all:
+# they are loaded on first use, never regenerated, and a grammar that no
+# longer matches them is reported as an error.  The same goes for the
+# compiled parser in parsecode.py.  Neither gives the nodes spans: that is up
+# to the clones that want them (see LRParser.set_spanned()), and parsecode.py
+# is written for clones that give spans to ast.Node.
+_parser = None
+_compiled = None
+_loaded = None
+_mapfile = None
+_parser_lock = threading.Lock()
+
+
+# The parser the tables were read into.  Called with the lock held.
+def _load():
+    global _loaded
+    if _loaded is None:
+        _loaded = yacc.load(mapfile=_mapfile)
+    return _loaded
+
+
+def get_parser():
+    global _parser
+    with _parser_lock:
+        if _parser is None:
+            parser = _load()
+            if isinstance(parser.action, yacc.CompactTable):
+                # Mapped tables are rows of arrays, through which the
+                # generic loop runs about half as fast as through dicts.
+                # It gets dict rows; the compiled parser keeps indexing
+                # the arrays.
+                parser = parser.clone()
+                parser.action = parser.action.dict_rows()
+                parser.goto = parser.goto.dict_rows()
+            _parser = parser
+    return _parser
+
+
+def get_compiled_parser():
+    global _compiled
+    with _parser_lock:
+        if _compiled is None:
+            import parsecode
+            _compiled = ycompile.load_module(_load(), parsecode)
+    return _compiled
+
+
+class LazyParser(object):
+    """ Stand-in for the parser that loads the tables on first use.
+        Without a lexer of its own, parse() uses the module lexer and
+        resets it for every new input, so that the symbols and errors of
+        one input do not pile up into the next.  HomdefParser keeps its
+        own lexer and is the way to parse from several threads.
+    """
+    def __getattr__(self, name):
+        return getattr(get_parser(), name)
+
+    def parse(self, input=None, lexer=None, *args, **kwargs):
+        if lexer is None:
+            lexer = homdeflex.lexer
+            if input is not None:
+                homdeflex.reset(lexer)
+        return get_parser().parse(input, lexer, *args, **kwargs)
+
+
+def write_shared_tables(filename):
+    """ Write the tables of parsetab.py to filename in the mapped format
+        read by use_shared_tables().
+    """
+    import parsetab
+    lr = yacc.LRTable()
+    signature = lr.read_table(parsetab)
+    lr.write_mapped(filename, signature)
+
+
+def use_shared_tables(filename):
+    """ Load the tables from a file written by write_shared_tables()
+        instead of from parsetab.py, so that processes start without
+        importing or decoding the tables.  Parsers created from then on
+        use it.  Every process copies the arrays, a few kilobytes, out of
+        the file: the pages are not shared.  The compiled parser indexes
+        the arrays; the generic parser expands them into dict rows, as
+        fast as those of parsetab.py.
+    """
+    global _parser, _compiled, _loaded, _mapfile
+    with _parser_lock:
+        _mapfile = filename
+        _parser = None
+        _compiled = None
+        _loaded = None
+
+
+def build():
+    """ Regenerate parsetab.py and parser.out from the grammar rules,
+        and compile the tables into parsecode.py.
+    """
+    parser = yacc.yacc()
+    parser.set_spanned([ast.Node])
+    ycompile.write_module(parser, 'parsecode', os.path.dirname(os.path.abspath(__file__)))
+    return parser
+
+
+parser = LazyParser()
+
+
+if __name__ == '__main__':
+    build()
+    if len(sys.argv) > 1:
+        write_shared_tables(sys.argv[1])
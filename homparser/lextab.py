@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.10). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('EXCLAMATION', 'EQEQ', 'NUMBER', 'LBRACKET', 'IDENT', 'DIV', 'TRUE', 'MINUS', 'LOCALS', 'NEQ', 'GEQ', 'RPAREN', 'SEMICOLON', 'COLON', 'QUESTION', 'LT', 'COMMA', 'TILDE', 'PLUS', 'SEPARE', 'GT', 'RBRACE', 'FOR', 'TIMES', 'RETURNS', 'LPAREN', 'JOIN', 'ELSE', 'EQ', 'IF', 'AND', 'LBRACE', 'FALSE', 'INT', 'FLOAT', 'LEQ', 'SEQUENTIAL', 'BOOL', 'RBRACKET', 'OR'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexsignature = "AND COLON COMMA DIV EQ EQEQ EXCLAMATION GEQ GT IDENT LBRACE LBRACKET LEQ LPAREN LT MINUS NEQ NUMBER OR PLUS QUESTION RBRACE RBRACKET RPAREN SEMICOLON TILDE SEPARE TIMES INT FLOAT ELSE FALSE LOCALS IF JOIN FOR RETURNS SEQUENTIAL BOOL TRUE '' 64 INITIAL:inclusive t_NUMBER=\\d+\\.*\\d* t_IDENT=[a-zA-Z_][a-zA-Z_0-9]* t_newline=\\n+ t_AND=\\&\\& t_BOOL=bool t_COLON=\\: t_COMMA=\\, t_DIV=/ t_EQ=\\= t_EQEQ=\\=\\= t_EXCLAMATION=! t_FLOAT=float t_GEQ=>= t_GT=> t_INT=int t_JOIN=join t_LBRACE=\\{ t_LBRACKET=\\[ t_LEQ=<= t_LPAREN=\\( t_LT=< t_MINUS=- t_NEQ=\\!\\= t_OR=\\|\\| t_PLUS=\\+ t_QUESTION=\\? t_RBRACE=\\} t_RBRACKET=\\] t_RPAREN=\\) t_SEMICOLON=\\; t_SEPARE=\\| t_TILDE=\\~ t_TIMES=\\* ' \\t' t_error "
+_lexstatere   = {'INITIAL': [('(?P<t_NUMBER>\\d+\\.*\\d*)|(?P<t_IDENT>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_newline>\\n+)|(?P<t_FLOAT>float)|(?P<t_AND>\\&\\&)|(?P<t_JOIN>join)|(?P<t_OR>\\|\\|)|(?P<t_BOOL>bool)|(?P<t_EQEQ>\\=\\=)|(?P<t_NEQ>\\!\\=)|(?P<t_INT>int)|(?P<t_RPAREN>\\))|(?P<t_TILDE>\\~)|(?P<t_LBRACKET>\\[)|(?P<t_PLUS>\\+)|(?P<t_GEQ>>=)|(?P<t_RBRACE>\\})|(?P<t_COMMA>\\,)|(?P<t_EQ>\\=)|(?P<t_COLON>\\:)|(?P<t_LEQ><=)|(?P<t_LPAREN>\\()|(?P<t_LBRACE>\\{)|(?P<t_TIMES>\\*)|(?P<t_RBRACKET>\\])|(?P<t_SEPARE>\\|)|(?P<t_SEMICOLON>\\;)|(?P<t_QUESTION>\\?)|(?P<t_LT><)|(?P<t_DIV>/)|(?P<t_MINUS>-)|(?P<t_EXCLAMATION>!)|(?P<t_GT>>)', [None, ('t_NUMBER', 'NUMBER'), ('t_IDENT', 'IDENT'), ('t_newline', 'newline'), (None, 'FLOAT'), (None, 'AND'), (None, 'JOIN'), (None, 'OR'), (None, 'BOOL'), (None, 'EQEQ'), (None, 'NEQ'), (None, 'INT'), (None, 'RPAREN'), (None, 'TILDE'), (None, 'LBRACKET'), (None, 'PLUS'), (None, 'GEQ'), (None, 'RBRACE'), (None, 'COMMA'), (None, 'EQ'), (None, 'COLON'), (None, 'LEQ'), (None, 'LPAREN'), (None, 'LBRACE'), (None, 'TIMES'), (None, 'RBRACKET'), (None, 'SEPARE'), (None, 'SEMICOLON'), (None, 'QUESTION'), (None, 'LT'), (None, 'DIV'), (None, 'MINUS'), (None, 'EXCLAMATION'), (None, 'GT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
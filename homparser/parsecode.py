@@ -0,0 +1,2446 @@
+
+# parsecode.py
+# This file is automatically generated. Do not edit.
+_compileversion = '8'
+
+_lr_signature = 'nonassocIFXnonassocELSEAND COLON COMMA DIV EQ EQEQ EXCLAMATION GEQ GT IDENT LBRACE LBRACKET LEQ LPAREN LT MINUS NEQ NUMBER OR PLUS QUESTION RBRACE RBRACKET RPAREN SEMICOLON TILDE SEPARE TIMES INT FLOAT ELSE FALSE LOCALS IF JOIN FOR RETURNS SEQUENTIAL BOOL TRUE EXPR LAZYBODY START_ARGLIST START_EXPRESSION START_JOINSPEC START_SEQUENTIALSPEC START_STATEMENTstart : programstart : START_EXPRESSION expression\n             | START_STATEMENT statement\n             | START_ARGLIST arglist\n             | START_JOINSPEC joinspec\n             | START_SEQUENTIALSPEC sequentialspecprogram : joinspec sequentialspecjoinspec : JOIN LPAREN arglist SEPARE arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN statementjoinspec : JOIN error RPAREN blockjoinspec : JOIN LPAREN arglist SEPARE arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN errorsequentialspec : SEQUENTIAL LPAREN arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN statement arglist : arglist COMMA argarglist : argarglist :arg : type identifierarg : erroridentlist : identifieridentlist : identlist COMMA identifieridentlist :constant : NUMBER\n    | TRUE\n    | FALSEpostfixExpression : constant\n    | identifierpostfixExpression : LPAREN expression RPARENidentifier : IDENTpostfixExpression : postfixExpression LBRACKET expression RBRACKETpostfixExpression : IDENT LPAREN expressionlist RPARENunaryExpression : unop unaryExpressionunaryExpression : postfixExpressionunop : PLUS\n    | MINUS\n    | EXCLAMATION\n    | TILDEmultiplicativeExpression : unaryExpressionmultiplicativeExpression : multiplicativeExpression multop unaryExpressionmultop : TIMES\n    | DIVadditiveExpression : multiplicativeExpressionadditiveExpression : additiveExpression addop multiplicativeExpressionaddop : PLUS\n    | MINUSrelationalExpression : additiveExpressionrelationalExpression : relationalExpression compop additiveExpressioncompop : LT\n    | LEQ\n    | GT\n    | GEQequalityExpression : relationalExpressionequalityExpression : equalityExpression eqop relationalExpressioneqop : EQEQ\n    | NEQandExpression : equalityExpressionandExpression : andExpression AND equalityExpressionorExpression : andExpressionorExpression : orExpression OR andExpressionconditionalExpression : orExpressionconditionalExpression : orExpression QUESTION expression COLON expressionexpression : conditionalExpressionexpression : EXPRexpressionlist : expressionexpressionlist : expressionlist COMMA expressionexpressionlist :statementlist : statementlist statementstatementlist :assignmentStatement : postfixExpression EQ expressionassignmentStatement : IDENT PLUS PLUSassignmentStatement : IDENT MINUS MINUSassignmentStatement : postfixExpression EQ errorassignmentStatement : error EQ expressionstatement : assignmentStatement SEMICOLON\n    | iterationStatement\n    | selectionStatement\n    | blockstatement : error SEMICOLONselectionStatement : IF LPAREN expression RPAREN statement ELSE statementselectionStatement : IF LPAREN expression RPAREN statement %prec IFXiterationStatement : FOR LPAREN assignmentStatement SEMICOLON expression SEMICOLON assignmentStatement RPAREN statementblock : LBRACE statementlist RBRACEblock : LAZYBODYtype : INT\n    | FLOAT\n    | BOOLtype : type TIMES'
+
+_lr_byteorder = 'little'
+
+_lr_spanning = [0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1]
+
+_lr_symbols = ['$end', 'AND', 'BOOL', 'COLON', 'COMMA', 'DIV', 'ELSE', 'EQ', 'EQEQ', 'EXCLAMATION', 'EXPR', 'FALSE', 'FLOAT', 'FOR', 'GEQ', 'GT', 'IDENT', 'IF', 'INT', 'JOIN', 'LAZYBODY', 'LBRACE', 'LBRACKET', 'LEQ', 'LOCALS', 'LPAREN', 'LT', 'MINUS', 'NEQ', 'NUMBER', 'OR', 'PLUS', 'QUESTION', 'RBRACE', 'RBRACKET', 'RETURNS', 'RPAREN', 'SEMICOLON', 'SEPARE', 'SEQUENTIAL', 'START_ARGLIST', 'START_EXPRESSION', 'START_JOINSPEC', 'START_SEQUENTIALSPEC', 'START_STATEMENT', 'TILDE', 'TIMES', 'TRUE', 'error', 'additiveExpression', 'addop', 'andExpression', 'arg', 'arglist', 'assignmentStatement', 'block', 'compop', 'conditionalExpression', 'constant', 'eqop', 'equalityExpression', 'expression', 'expressionlist', 'identifier', 'identlist', 'iterationStatement', 'joinspec', 'multiplicativeExpression', 'multop', 'orExpression', 'postfixExpression', 'program', 'relationalExpression', 'selectionStatement', 'sequentialspec', 'start', 'statement', 'statementlist', 'type', 'unaryExpression', 'unop']
+
+_lr_action_compact = ('EAAAAF0EAAAiAAAAEQAAAIAEAAArAAAACgAAAGEAAAACAAAACgAAAAAAAAAoAAAAUAAAAN0CAAALAAAANQAAAN4CAAAIAAAAiAQAAPUCAABHAAAAAgAAAFACAAB4AAAAIAAAABsDAACgAAAAMwMAAAwAAABPAAAApwAAAE0AAAApBAAAaAUAAI0BAADHAAAAcgUAABAAAABXBAAAgwUAAIsFAABQAgAAiAAAALQBAACcBQAAnAIAALwFAABmAQAAdgAAAIMAAACFAAAALQAAAA0AAAA7AAAA1AAAAEkAAAAVAAAATAAAAFkDAAAHBAAAbgAAAH4AAACFAAAAdwAAAKAEAACcAgAAqAQAAC8EAADABAAAcQMAANgAAAA8AAAAOgAAALgFAADJBQAA4AUAANsBAADhBQAA+AUAAPkFAADIBAAAEAYAABEGAAAoBgAAKQYAAEAGAABBBgAAWAYAAFkGAABwBgAAcQYAAEYBAADbAAAAcwEAAHEAAACsAAAArgAAAGUAAADJAAAAsQAAAJ4AAADvAAAAogAAAPEAAAD8AAAApwAAAEQEAACXAwAA/gAAANUAAAAAAQAAwQAAAMICAAACAgAA0AAAAJEGAAApAgAAdgIAAGMEAAB6AQAAFwEAAOAEAADoBAAACQUAAD8BAADOAAAASwEAAAgFAABMAQAA1gAAAK8DAADnAAAA4AAAACcBAAAkAQAAHQUAAAIAAADuAAAA7AAAANUDAABNAQAAaAEAAK0AAAAxBQAAAQEAABgBAAB0AQAA7QMAABABAAB7AQAAFAEAALsCAAAfAQAAfwEAAA0DAABFBQAAjwEAADoBAABZBQAAPgEAAF0AAAA=', 'CgAKAAgACgAKAAoAiAAKAAoAFQAJAA4AHAA0AAoACgAlADQAiAAlACUAOAAKAAoAFQA4AAoACgAKAAYACgAKAAoAEQAKAAAACgAKAIgAGAALAAsAAwALAAsACwAKAAsACwA0ACUANAAlACUACwALAAAAAAAAAAAAAAAzAAsACwBHAAMACwALAAsAGAALAAsACwACAAsANQALAAsASABIAAwADAAFAAwADAAMAAsADAAMADcADwAzADkAoAAMAAwAFAAHAEcABwCgAAcADAAMAB0ANQAMAAwADAAHAAwADAAMAB8ADAAHAAwADAAwADcAFwAXADkAFwAXABcADAAXABcAXgCgADEAoAAyABcAFwAqAGEAYQAqACoAPAAXABcAPgAHABcAFwAXAD4AFwAXABcAPQAXAD8AFwAXAD4AXgAaABoAPgAaABoAGgAXABoAGgAeACoAHgAqACoAGgAaAF8AjgBgAB4APgA+ABoAGgBjAB4AGgAaABoAjgAaABoAGgBvABoAZAAaABoAZgAjACMAaQAjACMAIwAeABoAIwBfAI4AYAByADYAIwAjAB4ANgBtAEYAXABGACMAIwBcACMAIwAjACMARgAjACMAIwBvACMARgAjACMAYgBiAGUAZQB9AGUAZQBlACMAZQBlADYAbQA2AIEARgBlAGUAXACDAFwAbgCEAG4AZQBlAIkARgBlAGUAZQBuAGUAZQBlAIoAZQBuAGUAZQBnAGcAeAB4AJAAeAB4AHgAZQB4AHgAaABoAGwAbABuAHgAeACFAJEAlACFAIUAlgB4AHgAhgBuAHgAeAB4AIYAeAB4AHgAmAB4AJ0AeAB4AIYAnwB8AHwAhgB8AHwAfAB4AHwAfABbAIUA//+FAIUAfAB8AH4AgACMAFsAhgCGAHwAfAD//1sAfAB8AHwA//98AHwAfAD//3wA//98AHwAnwAvAC8A//8vAC8ALwCNAHwALwB+AIAAjAD//10ALwAvAFsAXQCSAP//dwD//y8ALwB3AJUALwAvAC8AmQAvAC8ALwD//y8A//8vAC8AjQAiACIA//8iACIAIgCcAC8AIgD//10AkgBdAP//IgAiAP//dwCVAHcA/////5kAIgD/////IgAiACIA//8iACIAIgD//yIA//8iACIAnAArACsA//8rACsAKwD//yIAKwD/////////////KwArAP//////////////////KwD/////KwArACsA//8rACsAKwD//ysA//8rACsA//9MAEwA//9MAEwATAD//ysATAD/////////////TABMAP//////////////////TAD/////TABMAEwA//9MAEwATAD//0wA//9MAEwA//9xAHEA//9xAHEAcQD//0wAcQD/////////////cQBxAP//////////////////cQD/////cQBxAHEA//9xAHEAcQD//3EA//9xAHEA//90AHQA//90AHQAdAD//3EAdAD/////////////dAB0AP//////////////////dAD/////dAB0AHQA//90AHQAdAD//3QA//90AHQA//8pACkA//8pACkA/////3QAKQD/////FgD//xYAKQApABYAFgD/////FgAWAP//KQD//xYAKQApACkAFgApACkAKQAWACkA//8pACkAdQB1AP//dQB1AP///////3UAFgAWAP///////3UAdQD//////////////////3UA/////3UAdQB1AP//dQB1AHUA//91AP//dQB1AC0ALQD//y0ALQD///////8tAEEAQQBBAP////8tAC0AQQD///////////////8tAP//QQAtAEEALQBBAC0AQQAtAJcALQCXAC0ALQBwAHAA//9wAHAAlwD//0EAcABBAEEAlwD/////cABwAP//////////////////cAD/////cAANAHAAlwBwAP//cAANAHAAEABwAHAADQD//w0AlwD//w0ADQD/////DQANAP//EAATAA0AEAD//xAADQATAP//EAANAP//EwD//xMA//8NABMAEwD/////EwATAP//DQANABMAmgD//5oAEwD///////8TAP////+aAP//GQATAP////+aAP//GQD/////EwATABkA//8ZAP////8ZABkA/////xkAGQCaAP//GwAZAP///////xkAGwD/////GQCaABsA//8bAP//GQAbABsA/////xsAGwD//xkAGQAbAP///////xsA////////GwD//////////zoAGwD//////////zoA/////xsAGwA6AP//OgD/////OgA6AP////86ADoA/////0UAOgD///////86AEUA/////zoA//9FAP//RQD//zoARQBFAP////9FAEUA//86ADoARQD///////9FAP///////0UA//////////9rAEUA//////////9rAP////9FAEUAawD//2sA/////2sAawD/////awBrAP////+CAGsA////////awCCAP////9rAP//ggD//4IA//9rAIIAggD/////ggCCAP//awBrAIIA////////ggD///////+CAP//////////iwCCAP//////////iwD/////ggCCAIsA//+LAP////+LAIsA/////4sAiwD/////kwCLAP///////4sAkwD/////iwD//5MA//+TAP//iwCTAJMA/////5MAkwD//4sAiwCTAP///////5MAOwD/////kwD//zsAOwA7AP//kwD/////OwD//////////5MAkwD/////OwD//zsA//87AP//OwD/////IAAgADsAIAAgAP///////yAA/////zsA//87AP///////0MA//9DAP////9DAEMA/////0MAQwAgAP//IABDACAA//8gAEMAIAAgAGoAQwBqAP////9qAGoA//8mAGoAagAmACYA//9qAEMAQwD//2oA//92AHYAagB2AHYAAQD//wEAdgD//wEAAQD/////AQABAGoAagAmAAEAJgD//yYAAQAmACYA/////3YA//92AP//dgD//3YA//92AHYABAAEAAQAAQABAP////8EABIAEgASAP//////////EgAEAP//BAD//wQA//8EAP//EgD//xIA//8SAP//EgD//0AAQABAAP//BAD//wQAQABCAEIAQgD//xIA//8SAEIAQAD//0AA//9AAP//QAD//0IA//9CAP//QgD//0IA//9EAEQARAD//0AA//9AAEQAUABQAFAA//9CAP//QgBQAEQA//9EAP//RAD//0QA//9QAP//UAD//1AA//9QAP//eQB5AHkA//9EAP//RAB5AHoAegB6AP//UAD//1AAegB5AP//eQD//3kA//95AP//egD//3oA//96AP//egD/////////////eQD//3kA//9/AH8AfwB7AHoAewB6AH8AewB7AP////97AHsA/////38AewB/AP//fwB7AH8AhwD//4cA/////4cAhwD/////hwCHAP////9/AIcAfwB7AHsAhwD//48A//+PAP////+PAI8A/////48AjwD///////+PAP//hwCHAI8A//+bAP//mwD/////mwCbAP////+bAJsA////////mwD//48AjwCbAP//ngD//54A/////54AngD/////ngCeAP////8hAJ4AIQCbAJsAngD//yEA/////yQA//8kAP///////yEAJAAhAP//IQD//yEAngCeAP//JAAnACQAJwAkAP//JAD//ycAKAAhACgAIQD///////8oACcA//8nACQAJwAkACcA//8oACwAKAAsACgA//8oAP//LAD///////8nAP//JwD/////LAD//ywAKAAsACgALAAuAC4A//8uAC4ASQD//0kA//////////9JACwA//8sAP////////////9JAEoASQBKAEkA//9JAP//SgAuAP//LgD//y4A//8uAC4ASgD//0oASQBKAEkASgBLAE0ASwBNAP///////0sATQD//////////0oA//9KAEsATQBLAE0ASwBNAEsATQBOAE8ATgBPAP///////04ATwD///////9LAE0ASwBNAE4ATwBOAE8ATgBPAE4ATwBRAFIAUQBSAP///////1EAUgD///////9OAE8ATgBPAFEAUgBRAFIAUQBSAFEAUgBTAFQAUwBUAP///////1MAVAD///////9RAFIAUQBSAFMAVABTAFQAUwBUAFMAVABVAFYAVQBWAP///////1UAVgD///////9TAFQAUwBUAFUAVgBVAFYAVQBWAFUAVgBXAFgAVwBYAP///////1cAWAD///////9VAFYAVQBWAFcAWABXAFgAVwBYAFcAWABZAFoAWQBaAP///////1kAWgD///////9XAFgAVwBYAFkAWgBZAFoAWQBaAFkAWgBzAHMA//9zAHMA//////////////////9ZAFoAWQBaAP////////////////////////////////////9zAP//cwD//3MA//9zAHMA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////w==', '6f/p/wAA6f/p/+n/7f/p/+n/QQD///3/+v/w/+n/6f/E//D/XQDE/8T//P/p/+n/QgBbAOn/6f/p/wMA6f/p/+n/PgDp/wMA6f/p/+3/RADs/+z/HgDs/+z/7P/p/+z/7P/w/8T/8P/E/8T/7P/s/wcABAAGAAIAAQCv/+z/7P9bAB8A7P/s/+z/RQDs/+z/7P8dAOz/rv/s/+z/GQAWAOv/6/8dAOv/6//r/+z/6//r/63/OgCv/10A9v/r/+v/QADy/24ANwBEAPL/6//r/0YArv/r/+v/6/81AOv/6//r/0gA6/8zAOv/6//+/63/6v/q/14A6v/q/+r/6//q/+r/rP9FAPn/9v/7/+r/6v/F/73/vf/F/8X/YQDq/+r/FwA0AOr/6v/q/xAA6v/q/+r/YgDq/2UA6v/q/xIArP/o/+j/CwDo/+j/6P/q/+j/6P83AMX/8v/F/8X/6P/o/3kA7f/D/zUADABjAOj/6P9EADMA6P/o/+j/XQDo/+j/6P/3/+j/egDo/+j/ewDm/+b/fADm/+b/5v/y/+j/5v94AO3/w/9/APP/5v/m/zQA8/9bADcA8f/y/+b/5v/x/zsA5v/m/+b/NQDm/+b/5v/3/+b/MwDm/+b/vP+8/+f/5/+DAOf/5//n/+b/5//n//P/fQDz/4YA8v/n/+f/8f+IAPH/NwCJAPL/5//n/44ANADn/+f/5/81AOf/5//n/48A5/8zAOf/5/+7/7v/5P/k/5QA5P/k/+T/5//k/+T/vv++/7r/uv/y/+T/5P/G/10AlwDG/8b/mADk/+T/FwA0AOT/5P/k/xAA5P/k/+T/mgDk//X/5P/k/xIA+P/l/+X/CwDl/+X/5f/k/+X/5f83AMb/AADG/8b/5f/l/1sAwv+RADUADABjAOX/5f8AADMA5f/l/+X/AADl/+X/5f8AAOX/AADl/+X/+P/i/+L/AADi/+L/4v/v/+X/4v+EAML/kAAAAOb/4v/i/zQA5v+RAAAA9P8AAEIA4v/0/+7/4v/i/+L/WwDi/+L/4v8AAOL/AADi/+L/7//Z/9n/AADZ/9n/TQBbAOL/2f8AAOb/lgDm/wAA2f/Z/wAA9P/u//T/AAAAAJsA2f8AAAAA2f/Z/9n/AADZ/9n/2f8AANn/AADZ/9n/ngDd/93/AADd/93/3f8AAE8A3f8AAAAAAAAAAAAA3f/d/wAAAAAAAAAAAAAAAAAA3f8AAAAA3f/d/93/AADd/93/3f8AAN3/AADd/93/AADj/+P/AADj/+P/4/8AAN3/4/8AAAAAAAAAAAAA4//j/wAAAAAAAAAAAAAAAAAA4/8AAAAA4//j/+P/AADj/+P/4/8AAOP/AADj/+P/AADc/9z/AADc/9z/3P8AAOP/3P8AAAAAAAAAAAAA3P/c/wAAAAAAAAAAAAAAAAAA3P8AAAAA3P/c/9z/AADc/9z/3P8AANz/AADc/9z/AADY/9j/AADY/9j/TQAAANz/2P8AAAAAAAAAAAAA2P/Y/wAAAAAAAAAAAAAAAAAA2P8AAAAA2P/Y/9j/AADY/9j/2P8AANj/AADY/9j/AADV/9X/AADV/9X/AAAAAE8A1f8AAAAAv/8AAL//1f/V/7//v/8AAAAAv/+//wAA1f8AAL//1f9UANX/v//V/1MA1f+//9X/AADV/9X/1P/U/wAA1P/U/wAAAAAAANT/v/+//wAAAAAAANT/1P8AAAAAAAAAAAAAAAAAANT/AAAAANT/VADU/wAA1P9TANT/AADU/wAA1P/U/8//z/8AAM//z/8AAAAAAADP/ywAJQAXAAAAAABVAFYAIwAAAAAAAAAAAAAAAABXAAAAEgBZACQAz/8LAM//JwDP/zcAz//y/8//z//O/87/AADO/87/NQAAACgAzv8MAGcAMwAAAAAAVQBWAAAAAAAAAAAAAAAAAAAAVwAAAAAAWQC3/87/8v/O/wAAzv+3/87/5v/O/87/t/8AALf/NAAAALf/t/8AAAAAt/+3/wAA5v+4/7f/OwAAAD0At/+4/wAAPAC3/wAAuP8AALj/AAC3/7j/uP8AAAAAuP+4/wAAt/+3/7j/NwAAAPL/uP8AAAAAAAC4/wAAAAA1AAAAsP+4/wAAAAAzAAAAsP8AAAAAuP+4/7D/AACw/wAAAACw/7D/AAAAALD/sP/y/wAAtv+w/wAAAAAAALD/tv8AAAAAsP80ALb/AAC2/wAAsP+2/7b/AAAAALb/tv8AALD/sP+2/wAAAAAAALb/AAAAAAAAtv8AAAAAAAAAALn/tv8AAAAAAAAAALn/AAAAALb/tv+5/wAAuf8AAAAAuf+5/wAAAAC5/7n/AAAAALX/uf8AAAAAAAC5/7X/AAAAALn/AAC1/wAAtf8AALn/tf+1/wAAAAC1/7X/AAC5/7n/tf8AAAAAAAC1/wAAAAAAALX/AAAAAAAAAACx/7X/AAAAAAAAAACx/wAAAAC1/7X/sf8AALH/AAAAALH/sf8AAAAAsf+x/wAAAACz/7H/AAAAAAAAsf+HAAAAAACx/wAAs/8AALP/AACx/7P/s/8AAAAAs/+z/wAAsf+x/7P/AAAAAAAAs/8AAAAAAACz/wAAAAAAAAAAtP+z/wAAAAAAAAAAtP8AAAAAs/+z/7T/AAC0/wAAAAC0/7T/AAAAALT/tP8AAAAAsv+0/wAAAAAAALT/sv8AAAAAtP8AALL/AACy/wAAtP+y/7L/AAAAALL/sv8AALT/tP+y/wAAAAAAALL/wf8AAAAAsv8AACwAJQAXAAAAsv8AAAAAIwAAAAAAAAAAALL/sv8AAAAAEgAAACQAAAALAAAAJwAAAAAAy//L/8H/y//L/wAAAAAAAEkAAAAAACgAAAAMAAAAAAAAABcAAAARAAAAAAAQABQAAAAAABkAFgBLAAAAy/8SAMv/AADL/wsAy//L/8D/awDA/wAAAADA/8D/AADH/8D/wP/H/8f/AADA/wwAGAAAAMD/AADK/8r/wP/K/8r/FwAAABEASQAAABAAFAAAAAAAGQAWAMD/wP9RABIAUAAAAMf/CwDH/8f/AAAAAEsAAADK/wAAyv8AAMr/AADK/8r/LAAlABcADAAYAAAAAAAjACwAJQAXAAAAAAAAAAAAIwASAAAAJAAAAAsAAAAnAAAAEgAAACQAAAALAAAAJwAAACwAJQAXAAAAKAAAAAwAIwAsACUAFwAAACgAAAAMACMAEgAAACQAAAALAAAAJwAAABIAAAAkAAAACwAAACcAAAAsACUAFwAAACgAAAAMACMALAAlABcAAAAoAAAADAAjABIAAAAkAAAACwAAACcAAAASAAAAJAAAAAsAAAAnAAAALAAlABcAAAAoAAAADAAjACwAJQAXAAAAKAAAAAwAIwASAAAAJAAAAAsAAAAnAAAAEgAAACQAAAALAAAAJwAAAAAAAAAAAAAAKAAAAAwAAAAsACUAFwAXACgAEQAMACMAEAAUAAAAAAAZABYAAAAAABIAEgAkAAAACwALACcAFwAAABEAAAAAABAAFAAAAAAAGQAWAAAAAAAoABIADAAMABgACwAAABcAAAARAAAAAAAQABQAAAAAABkAFgAAAAAAAAASAAAADAAYAAsAAAAXAAAAEQAAAAAAEAAUAAAAAAAZABYAAAAAAAAAEgAAAAwAGAALAAAAFwAAABEAAAAAABAAFAAAAAAAGQAWAAAAAAAsABIAFwAMABgACwAAACMAAAAAAOD/AADg/wAAAAAAABIA4P8kAAAACwAAACcADACgAAAA4P/h/+D/4f/g/wAA4P8AAOH/3v8oAN7/DAAAAAAAAADe/+H/AADh/+D/4f/g/+H/AADe/9//3v/f/97/AADe/wAA3/8AAAAAAADh/wAA4f8AAAAA3/8AAN//3v/f/97/3//J/1oAAADJ/8n/zf8AAM3/AAAAAAAAAADN/9//AADf/wAAAAAAAAAAAADN/ywAzf8XAM3/AADN/wAAIwDJ/wAAyf8AAMn/AADJ/8n/EgAAACQAzf8LAM3/JwDM/9r/zP/a/wAAAAAAAMz/2v8AAAAAAAAAACgAAAAMAMz/2v/M/9r/zP/a/8z/2v8sANv/FwDb/wAAAAAAACMA2/8AAAAAAADM/9r/zP/a/xIA2/8kANv/CwDb/ycA2/8sACwAFwAXAAAAAAAAACMAIwAAAAAAAAAoANv/DADb/xIAEgAkACQACwALACcAJwDX/9b/1//W/wAAAAAAANf/1v8AAAAAAAAoACgADAAMANf/1v/X/9b/1//W/9f/1v/Q/9H/0P/R/wAAAAAAAND/0f8AAAAAAADX/9b/1//W/9D/0f/Q/9H/0P/R/9D/0f/S/ywA0v8XAAAAAAAAANL/IwAAAAAAAADQ/9H/0P/R/9L/EgDS/yQA0v8LANL/JwDT/ywA0/8XAAAAAAAAANP/IwAAAAAAAADS/ygA0v8MANP/EgDT/yQA0/8LANP/JwDI/1oAAADI/8j/AAAAAAAAAAAAAAAAAADT/ygA0/8MAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADI/wAAyP8AAMj/AADI/8j/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA==')
+
+_lr_goto_compact = ('EQAAAAEAAAACAAAAAAAAABgAAAAPAAAAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMAAAAAAAAAAAAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPAAAAAAAAAAGAAAA/QAAACcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOwAAAAAAAAAAAAAAAAAAAAAAAAAgAAAAAAAAAEgAAABgAAAAeAAAACIBAACQAAAAAAAAAEgAAAAAAAAATAAAAAAAAAAqAQAAAAAAAAAAAAAAAAAAJgEAAAAAAACoAAAA/wAAAIMBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAH0BAAAAAAAAFwEAAF4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABUAAAAAAAAAE4AAAAAAAAAAAAAAAAAAABIAAAABAAAAFQAAAAAAAAAAAAAAMAAAADYAAAAPQEAAAAAAAAAAAAAAAAAAPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AAAASwEAACUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHkAAABZAQAAAAAAAFwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGAAAAAAAAAAAAAAAGwAAABnAQAAAAAAAAAAAAB1AQAAAAAAAAAAAAA=', 'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAApAFIALgA2ADgAUgAPABsAKgAKAAoAIABgAF8AGgAaAEoAEwAiADIAJgAvABUALQApAA0ALgAcAA4AOQArACEAKgAKAAUAIAAwAGQAGgAJADEACgAiAAgAJgAvABoALQApAEMALgCNAIwAFQArACEAKgAKAE4AIAA/AIoAGgA2AEcACgAiAFgAJgAvABoALQApAFwALgA2AG0AFQArACEAKgAKAG8AIABmAFgAGgA2AH4AOQAiAE4AJgAvAEoALQApAHcALgA2AJkAOQArACEAKgAKAJUAIABoAAAAGgA2AJwAOQAiAAAAJgAvAAAALQApAAAALgA5AAAAOQArACEAKgAKAAAAIABpAAAAGgCNAJIAOQAiAAAAJgAvAAAALQApAAAALgAAAAAAAAArACEAKgAKAAAAIABsAAAAGgAAAAAAAAAiAAAAJgAvAAAALQApAAAALgAAAAAAAAArACEAKgAKAAAAIAByAAAAGgAAAAAAAAAiAAAAJgAvAAAALQApAAAALgAAAAAAAAArACEAKgAKAAAAIACAAAAAGgAAAAAAAAAiAAAAJgAvAAAALQApAAAALgAAAAAAAAArACEAKgAKAAAAIACBAAAAGgAAAAAAAAAiAAAAJgAvAAAALQApAAAALgAAAAAAAAArACEAKgAKAAAAIACFAAAAGgApAAAAcwAiAAAAJgAvAAoALQAKAAAAIAAaAAAAGgArACEAAAAiAC8AAAAvAAAALQApAAAAAAAAAEwAIQArACEAAAAKAAAAdgAAAAAAGgAAAA8AGwAiACkACgAvAAAALQAKABoAAAATAAoAGgArACEAFQAaAAAADQAvACIAagAAAC8AAABwAA8AGwBxACEACgAAACsAIQAAABoAAAATAAAAAAAPABsAFQAAAAoADQAAAAAAggAaAAAAEwAAAAAADwAbABUAAAAKAA0AAAAAAIsAGgAAABMAAAAAAA8AGwAVAAAACgANAAAAAACTABoAAAATAAAAAAAPABsAFQB1AAoADQAAAAAAnQAaAAAAEwAKAAAAAAAAABUAGgAKAA0AAAAiAJ8AGgAvAAAAAAB0AAAAAAAvAAAAAAArACEAAAAAAAAAAAArACEAAAA=')
+
+_lr_default = [0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 0, 0, -3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -2, -7, -5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -11, 0, 0, 0]
+
+_lr_accessing = ['$end', 'START_STATEMENT', 'START_SEQUENTIALSPEC', 'JOIN', 'START_EXPRESSION', 'joinspec', 'START_JOINSPEC', 'START_ARGLIST', 'start', 'program', 'constant', 'NUMBER', 'TRUE', 'selectionStatement', 'statement', 'assignmentStatement', 'IDENT', 'FOR', 'LPAREN', 'iterationStatement', 'IF', 'postfixExpression', 'LBRACE', 'FALSE', 'error', 'LAZYBODY', 'identifier', 'block', 'sequentialspec', 'SEQUENTIAL', 'LPAREN', 'error', 'equalityExpression', 'unop', 'multiplicativeExpression', 'IDENT', 'MINUS', 'EXPR', 'orExpression', 'PLUS', 'TILDE', 'additiveExpression', 'conditionalExpression', 'unaryExpression', 'EXCLAMATION', 'relationalExpression', 'andExpression', 'postfixExpression', 'expression', 'sequentialspec', 'joinspec', 'INT', 'error', 'FLOAT', 'arg', 'BOOL', 'arglist', 'type', 'SEMICOLON', 'LPAREN', 'PLUS', 'MINUS', 'LPAREN', 'expression', 'LPAREN', 'EQ', 'LBRACKET', 'statementlist', 'EQ', 'SEMICOLON', 'LPAREN', 'arglist', 'RPAREN', 'EQEQ', 'eqop', 'NEQ', 'unaryExpression', 'DIV', 'multop', 'TIMES', 'QUESTION', 'OR', 'addop', 'PLUS', 'MINUS', 'GEQ', 'GT', 'LEQ', 'compop', 'LT', 'AND', 'COMMA', 'identifier', 'IDENT', 'TIMES', 'expressionlist', 'expression', 'PLUS', 'MINUS', 'error', 'assignmentStatement', 'RPAREN', 'expression', 'error', 'expression', 'expression', 'statement', 'RBRACE', 'expression', 'arglist', 'SEPARE', 'block', 'relationalExpression', 'unaryExpression', 'expression', 'andExpression', 'multiplicativeExpression', 'additiveExpression', 'equalityExpression', 'arg', 'RPAREN', 'COMMA', 'SEMICOLON', 'RPAREN', 'RBRACKET', 'RPAREN', 'arglist', 'COLON', 'expression', 'expression', 'statement', 'RETURNS', 'RPAREN', 'expression', 'SEMICOLON', 'ELSE', 'LPAREN', 'RETURNS', 'assignmentStatement', 'statement', 'identlist', 'identifier', 'LPAREN', 'RPAREN', 'RPAREN', 'COMMA', 'identlist', 'statement', 'LOCALS', 'identifier', 'RPAREN', 'LPAREN', 'LOCALS', 'arglist', 'LPAREN', 'RPAREN', 'arglist', 'statement', 'RPAREN', 'statement', 'error']
+
+def bind(rules, passthrough, base, check, value, gotobase, goto):
+    codes = dict((name, code) for code, name in enumerate(_lr_symbols))
+    unknown = len(_lr_symbols)
+    default = _lr_default
+    rule_1 = rules[1]
+    rule_2 = rules[2]
+    rule_3 = rules[3]
+    rule_4 = rules[4]
+    rule_5 = rules[5]
+    rule_6 = rules[6]
+    rule_7 = rules[7]
+    rule_8 = rules[8]
+    rule_9 = rules[9]
+    rule_10 = rules[10]
+    rule_11 = rules[11]
+    rule_12 = rules[12]
+    rule_13 = rules[13]
+    rule_14 = rules[14]
+    rule_15 = rules[15]
+    rule_16 = rules[16]
+    rule_17 = rules[17]
+    rule_18 = rules[18]
+    rule_19 = rules[19]
+    rule_20 = rules[20]
+    rule_21 = rules[21]
+    rule_22 = rules[22]
+    rule_23 = rules[23]
+    rule_24 = rules[24]
+    rule_25 = rules[25]
+    rule_26 = rules[26]
+    rule_27 = rules[27]
+    rule_28 = rules[28]
+    rule_29 = rules[29]
+    rule_30 = rules[30]
+    rule_31 = rules[31]
+    rule_32 = rules[32]
+    rule_33 = rules[33]
+    rule_34 = rules[34]
+    rule_35 = rules[35]
+    rule_36 = rules[36]
+    rule_37 = rules[37]
+    rule_38 = rules[38]
+    rule_39 = rules[39]
+    rule_40 = rules[40]
+    rule_41 = rules[41]
+    rule_42 = rules[42]
+    rule_43 = rules[43]
+    rule_44 = rules[44]
+    rule_45 = rules[45]
+    rule_46 = rules[46]
+    rule_47 = rules[47]
+    rule_48 = rules[48]
+    rule_49 = rules[49]
+    rule_50 = rules[50]
+    rule_51 = rules[51]
+    rule_52 = rules[52]
+    rule_53 = rules[53]
+    rule_54 = rules[54]
+    rule_55 = rules[55]
+    rule_56 = rules[56]
+    rule_57 = rules[57]
+    rule_58 = rules[58]
+    rule_59 = rules[59]
+    rule_60 = rules[60]
+    rule_61 = rules[61]
+    rule_62 = rules[62]
+    rule_63 = rules[63]
+    rule_64 = rules[64]
+    rule_65 = rules[65]
+    rule_66 = rules[66]
+    rule_67 = rules[67]
+    rule_68 = rules[68]
+    rule_69 = rules[69]
+    rule_70 = rules[70]
+    rule_71 = rules[71]
+    rule_72 = rules[72]
+    rule_73 = rules[73]
+    rule_74 = rules[74]
+    rule_75 = rules[75]
+    rule_76 = rules[76]
+    rule_77 = rules[77]
+    rule_78 = rules[78]
+    rule_79 = rules[79]
+    rule_80 = rules[80]
+    rule_81 = rules[81]
+    rule_82 = rules[82]
+    rule_83 = rules[83]
+    rule_84 = rules[84]
+
+    def reduce_1(values, states):
+        # start -> program
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_1(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_2(values, states):
+        # start -> START_EXPRESSION expression
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_2(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_3(values, states):
+        # start -> START_STATEMENT statement
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_3(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_4(values, states):
+        # start -> START_ARGLIST arglist
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_4(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_5(values, states):
+        # start -> START_JOINSPEC joinspec
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_5(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_6(values, states):
+        # start -> START_SEQUENTIALSPEC sequentialspec
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_6(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_7(values, states):
+        # program -> joinspec sequentialspec
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_7(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 71]
+        states.append(state)
+        return state
+
+    def reduce_8(values, states):
+        # joinspec -> JOIN LPAREN arglist SEPARE arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN statement
+        p = values[-16:]
+        p[0] = None
+        del values[-15:]
+        del states[-15:]
+        rule_8(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 66]
+        states.append(state)
+        return state
+
+    def reduce_9(values, states):
+        # joinspec -> JOIN error RPAREN block
+        p = values[-5:]
+        p[0] = None
+        del values[-4:]
+        del states[-4:]
+        rule_9(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 66]
+        states.append(state)
+        return state
+
+    def reduce_10(values, states):
+        # joinspec -> JOIN LPAREN arglist SEPARE arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN error
+        p = values[-16:]
+        p[0] = None
+        del values[-15:]
+        del states[-15:]
+        rule_10(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 66]
+        states.append(state)
+        return state
+
+    def reduce_11(values, states):
+        # sequentialspec -> SEQUENTIAL LPAREN arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN statement
+        p = values[-14:]
+        p[0] = None
+        del values[-13:]
+        del states[-13:]
+        rule_11(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 74]
+        states.append(state)
+        return state
+
+    def reduce_12(values, states):
+        # arglist -> arglist COMMA arg
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_12(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 53]
+        states.append(state)
+        return state
+
+    def reduce_13(values, states):
+        # arglist -> arg
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_13(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 53]
+        states.append(state)
+        return state
+
+    def reduce_14(values, states):
+        # arglist -> <empty>
+        p = [None]
+        rule_14(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 53]
+        states.append(state)
+        return state
+
+    def reduce_15(values, states):
+        # arg -> type identifier
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_15(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 52]
+        states.append(state)
+        return state
+
+    def reduce_16(values, states):
+        # arg -> error
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_16(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 52]
+        states.append(state)
+        return state
+
+    def reduce_17(values, states):
+        # identlist -> identifier
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_17(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 64]
+        states.append(state)
+        return state
+
+    def reduce_18(values, states):
+        # identlist -> identlist COMMA identifier
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_18(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 64]
+        states.append(state)
+        return state
+
+    def reduce_19(values, states):
+        # identlist -> <empty>
+        p = [None]
+        rule_19(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 64]
+        states.append(state)
+        return state
+
+    def reduce_20(values, states):
+        # constant -> NUMBER
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_20(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 58]
+        states.append(state)
+        return state
+
+    def reduce_21(values, states):
+        # constant -> TRUE
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_21(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 58]
+        states.append(state)
+        return state
+
+    def reduce_22(values, states):
+        # constant -> FALSE
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_22(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 58]
+        states.append(state)
+        return state
+
+    def reduce_23(values, states):
+        # postfixExpression -> constant
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_23(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_24(values, states):
+        # postfixExpression -> identifier
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_24(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_25(values, states):
+        # postfixExpression -> LPAREN expression RPAREN
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_25(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_26(values, states):
+        # identifier -> IDENT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_26(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 63]
+        states.append(state)
+        return state
+
+    def reduce_27(values, states):
+        # postfixExpression -> postfixExpression LBRACKET expression RBRACKET
+        p = values[-5:]
+        p[0] = None
+        del values[-4:]
+        del states[-4:]
+        rule_27(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_28(values, states):
+        # postfixExpression -> IDENT LPAREN expressionlist RPAREN
+        p = values[-5:]
+        p[0] = None
+        del values[-4:]
+        del states[-4:]
+        rule_28(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_29(values, states):
+        # unaryExpression -> unop unaryExpression
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_29(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 79]
+        states.append(state)
+        return state
+
+    def reduce_30(values, states):
+        # unaryExpression -> postfixExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_30(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 79]
+        states.append(state)
+        return state
+
+    def reduce_31(values, states):
+        # unop -> PLUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_31(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_32(values, states):
+        # unop -> MINUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_32(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_33(values, states):
+        # unop -> EXCLAMATION
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_33(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_34(values, states):
+        # unop -> TILDE
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_34(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_35(values, states):
+        # multiplicativeExpression -> unaryExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_35(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 67]
+        states.append(state)
+        return state
+
+    def reduce_36(values, states):
+        # multiplicativeExpression -> multiplicativeExpression multop unaryExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_36(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 67]
+        states.append(state)
+        return state
+
+    def reduce_37(values, states):
+        # multop -> TIMES
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_37(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 68]
+        states.append(state)
+        return state
+
+    def reduce_38(values, states):
+        # multop -> DIV
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_38(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 68]
+        states.append(state)
+        return state
+
+    def reduce_39(values, states):
+        # additiveExpression -> multiplicativeExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_39(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 49]
+        states.append(state)
+        return state
+
+    def reduce_40(values, states):
+        # additiveExpression -> additiveExpression addop multiplicativeExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_40(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 49]
+        states.append(state)
+        return state
+
+    def reduce_41(values, states):
+        # addop -> PLUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_41(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 50]
+        states.append(state)
+        return state
+
+    def reduce_42(values, states):
+        # addop -> MINUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_42(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 50]
+        states.append(state)
+        return state
+
+    def reduce_43(values, states):
+        # relationalExpression -> additiveExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_43(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 72]
+        states.append(state)
+        return state
+
+    def reduce_44(values, states):
+        # relationalExpression -> relationalExpression compop additiveExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_44(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 72]
+        states.append(state)
+        return state
+
+    def reduce_45(values, states):
+        # compop -> LT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_45(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_46(values, states):
+        # compop -> LEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_46(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_47(values, states):
+        # compop -> GT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_47(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_48(values, states):
+        # compop -> GEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_48(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_49(values, states):
+        # equalityExpression -> relationalExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_49(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 60]
+        states.append(state)
+        return state
+
+    def reduce_50(values, states):
+        # equalityExpression -> equalityExpression eqop relationalExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_50(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 60]
+        states.append(state)
+        return state
+
+    def reduce_51(values, states):
+        # eqop -> EQEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_51(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 59]
+        states.append(state)
+        return state
+
+    def reduce_52(values, states):
+        # eqop -> NEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_52(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 59]
+        states.append(state)
+        return state
+
+    def reduce_53(values, states):
+        # andExpression -> equalityExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_53(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 51]
+        states.append(state)
+        return state
+
+    def reduce_54(values, states):
+        # andExpression -> andExpression AND equalityExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_54(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 51]
+        states.append(state)
+        return state
+
+    def reduce_55(values, states):
+        # orExpression -> andExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_55(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 69]
+        states.append(state)
+        return state
+
+    def reduce_56(values, states):
+        # orExpression -> orExpression OR andExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_56(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 69]
+        states.append(state)
+        return state
+
+    def reduce_57(values, states):
+        # conditionalExpression -> orExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_57(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 57]
+        states.append(state)
+        return state
+
+    def reduce_58(values, states):
+        # conditionalExpression -> orExpression QUESTION expression COLON expression
+        p = values[-6:]
+        p[0] = None
+        del values[-5:]
+        del states[-5:]
+        rule_58(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 57]
+        states.append(state)
+        return state
+
+    def reduce_59(values, states):
+        # expression -> conditionalExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_59(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 61]
+        states.append(state)
+        return state
+
+    def reduce_60(values, states):
+        # expression -> EXPR
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_60(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 61]
+        states.append(state)
+        return state
+
+    def reduce_61(values, states):
+        # expressionlist -> expression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_61(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 62]
+        states.append(state)
+        return state
+
+    def reduce_62(values, states):
+        # expressionlist -> expressionlist COMMA expression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_62(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 62]
+        states.append(state)
+        return state
+
+    def reduce_63(values, states):
+        # expressionlist -> <empty>
+        p = [None]
+        rule_63(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 62]
+        states.append(state)
+        return state
+
+    def reduce_64(values, states):
+        # statementlist -> statementlist statement
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_64(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 77]
+        states.append(state)
+        return state
+
+    def reduce_65(values, states):
+        # statementlist -> <empty>
+        p = [None]
+        rule_65(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 77]
+        states.append(state)
+        return state
+
+    def reduce_66(values, states):
+        # assignmentStatement -> postfixExpression EQ expression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_66(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_67(values, states):
+        # assignmentStatement -> IDENT PLUS PLUS
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_67(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_68(values, states):
+        # assignmentStatement -> IDENT MINUS MINUS
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_68(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_69(values, states):
+        # assignmentStatement -> postfixExpression EQ error
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_69(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_70(values, states):
+        # assignmentStatement -> error EQ expression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_70(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_71(values, states):
+        # statement -> assignmentStatement SEMICOLON
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_71(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_72(values, states):
+        # statement -> iterationStatement
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_72(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_73(values, states):
+        # statement -> selectionStatement
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_73(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_74(values, states):
+        # statement -> block
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_74(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_75(values, states):
+        # statement -> error SEMICOLON
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_75(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_76(values, states):
+        # selectionStatement -> IF LPAREN expression RPAREN statement ELSE statement
+        p = values[-8:]
+        p[0] = None
+        del values[-7:]
+        del states[-7:]
+        rule_76(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 73]
+        states.append(state)
+        return state
+
+    def reduce_77(values, states):
+        # selectionStatement -> IF LPAREN expression RPAREN statement
+        p = values[-6:]
+        p[0] = None
+        del values[-5:]
+        del states[-5:]
+        rule_77(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 73]
+        states.append(state)
+        return state
+
+    def reduce_78(values, states):
+        # iterationStatement -> FOR LPAREN assignmentStatement SEMICOLON expression SEMICOLON assignmentStatement RPAREN statement
+        p = values[-10:]
+        p[0] = None
+        del values[-9:]
+        del states[-9:]
+        rule_78(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 65]
+        states.append(state)
+        return state
+
+    def reduce_79(values, states):
+        # block -> LBRACE statementlist RBRACE
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        rule_79(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 55]
+        states.append(state)
+        return state
+
+    def reduce_80(values, states):
+        # block -> LAZYBODY
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_80(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 55]
+        states.append(state)
+        return state
+
+    def reduce_81(values, states):
+        # type -> INT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_81(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    def reduce_82(values, states):
+        # type -> FLOAT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_82(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    def reduce_83(values, states):
+        # type -> BOOL
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_83(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    def reduce_84(values, states):
+        # type -> type TIMES
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        rule_84(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    if passthrough:
+        reducers = [None, 75, reduce_2, reduce_3, reduce_4, reduce_5, reduce_6, reduce_7, reduce_8, reduce_9, reduce_10, reduce_11, reduce_12, reduce_13, reduce_14, reduce_15, reduce_16, reduce_17, reduce_18, reduce_19, reduce_20, reduce_21, reduce_22, 70, 70, reduce_25, reduce_26, reduce_27, reduce_28, reduce_29, 79, reduce_31, reduce_32, reduce_33, reduce_34, 67, reduce_36, reduce_37, reduce_38, 49, reduce_40, reduce_41, reduce_42, 72, reduce_44, reduce_45, reduce_46, reduce_47, reduce_48, 60, reduce_50, reduce_51, reduce_52, 51, reduce_54, 69, reduce_56, 57, reduce_58, 61, reduce_60, reduce_61, reduce_62, reduce_63, reduce_64, reduce_65, reduce_66, reduce_67, reduce_68, reduce_69, reduce_70, reduce_71, 76, 76, 76, reduce_75, reduce_76, reduce_77, reduce_78, reduce_79, reduce_80, reduce_81, reduce_82, reduce_83, reduce_84]
+    else:
+        reducers = [None, reduce_1, reduce_2, reduce_3, reduce_4, reduce_5, reduce_6, reduce_7, reduce_8, reduce_9, reduce_10, reduce_11, reduce_12, reduce_13, reduce_14, reduce_15, reduce_16, reduce_17, reduce_18, reduce_19, reduce_20, reduce_21, reduce_22, reduce_23, reduce_24, reduce_25, reduce_26, reduce_27, reduce_28, reduce_29, reduce_30, reduce_31, reduce_32, reduce_33, reduce_34, reduce_35, reduce_36, reduce_37, reduce_38, reduce_39, reduce_40, reduce_41, reduce_42, reduce_43, reduce_44, reduce_45, reduce_46, reduce_47, reduce_48, reduce_49, reduce_50, reduce_51, reduce_52, reduce_53, reduce_54, reduce_55, reduce_56, reduce_57, reduce_58, reduce_59, reduce_60, reduce_61, reduce_62, reduce_63, reduce_64, reduce_65, reduce_66, reduce_67, reduce_68, reduce_69, reduce_70, reduce_71, reduce_72, reduce_73, reduce_74, reduce_75, reduce_76, reduce_77, reduce_78, reduce_79, reduce_80, reduce_81, reduce_82, reduce_83, reduce_84]
+
+    def parse(parser, get_token):
+        states = [0]
+        values = [None]
+        parser.statestack = states
+        state = 0
+        ltype = None
+        while True:
+            t = default[state]
+            if not t:
+                if ltype is None:
+                    lookahead = get_token()
+                    ltype = lookahead.type if lookahead is not None else '$end'
+                    code = codes.get(ltype, unknown)
+                i = base[state] + code
+                if check[i] != state:
+                    return parser.recover(states, values, lookahead)
+                t = value[i]
+            if t > 0:
+                states.append(t)
+                values.append(lookahead.value)
+                ltype = None
+                state = t
+            elif t < 0:
+                r = reducers[-t]
+                if r.__class__ is int:
+                    state = states[-1] = goto[gotobase[states[-2]] + r]
+                else:
+                    state = r(values, states)
+            else:
+                return values[-1]
+
+    return parse
+
+
+def bind_spanned(rules, spanned, passthrough, base, check, value, gotobase, goto):
+    codes = dict((name, code) for code, name in enumerate(_lr_symbols))
+    unknown = len(_lr_symbols)
+    default = _lr_default
+    rule_1 = rules[1]
+    rule_2 = rules[2]
+    rule_3 = rules[3]
+    rule_4 = rules[4]
+    rule_5 = rules[5]
+    rule_6 = rules[6]
+    rule_7 = rules[7]
+    rule_8 = rules[8]
+    rule_9 = rules[9]
+    rule_10 = rules[10]
+    rule_11 = rules[11]
+    rule_12 = rules[12]
+    rule_13 = rules[13]
+    rule_14 = rules[14]
+    rule_15 = rules[15]
+    rule_16 = rules[16]
+    rule_17 = rules[17]
+    rule_18 = rules[18]
+    rule_19 = rules[19]
+    rule_20 = rules[20]
+    rule_21 = rules[21]
+    rule_22 = rules[22]
+    rule_23 = rules[23]
+    rule_24 = rules[24]
+    rule_25 = rules[25]
+    rule_26 = rules[26]
+    rule_27 = rules[27]
+    rule_28 = rules[28]
+    rule_29 = rules[29]
+    rule_30 = rules[30]
+    rule_31 = rules[31]
+    rule_32 = rules[32]
+    rule_33 = rules[33]
+    rule_34 = rules[34]
+    rule_35 = rules[35]
+    rule_36 = rules[36]
+    rule_37 = rules[37]
+    rule_38 = rules[38]
+    rule_39 = rules[39]
+    rule_40 = rules[40]
+    rule_41 = rules[41]
+    rule_42 = rules[42]
+    rule_43 = rules[43]
+    rule_44 = rules[44]
+    rule_45 = rules[45]
+    rule_46 = rules[46]
+    rule_47 = rules[47]
+    rule_48 = rules[48]
+    rule_49 = rules[49]
+    rule_50 = rules[50]
+    rule_51 = rules[51]
+    rule_52 = rules[52]
+    rule_53 = rules[53]
+    rule_54 = rules[54]
+    rule_55 = rules[55]
+    rule_56 = rules[56]
+    rule_57 = rules[57]
+    rule_58 = rules[58]
+    rule_59 = rules[59]
+    rule_60 = rules[60]
+    rule_61 = rules[61]
+    rule_62 = rules[62]
+    rule_63 = rules[63]
+    rule_64 = rules[64]
+    rule_65 = rules[65]
+    rule_66 = rules[66]
+    rule_67 = rules[67]
+    rule_68 = rules[68]
+    rule_69 = rules[69]
+    rule_70 = rules[70]
+    rule_71 = rules[71]
+    rule_72 = rules[72]
+    rule_73 = rules[73]
+    rule_74 = rules[74]
+    rule_75 = rules[75]
+    rule_76 = rules[76]
+    rule_77 = rules[77]
+    rule_78 = rules[78]
+    rule_79 = rules[79]
+    rule_80 = rules[80]
+    rule_81 = rules[81]
+    rule_82 = rules[82]
+    rule_83 = rules[83]
+    rule_84 = rules[84]
+
+    def reduce_1(values, states, starts, ends):
+        # start -> program
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_1(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_2(values, states, starts, ends):
+        # start -> START_EXPRESSION expression
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_2(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_3(values, states, starts, ends):
+        # start -> START_STATEMENT statement
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_3(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_4(values, states, starts, ends):
+        # start -> START_ARGLIST arglist
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_4(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_5(values, states, starts, ends):
+        # start -> START_JOINSPEC joinspec
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_5(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_6(values, states, starts, ends):
+        # start -> START_SEQUENTIALSPEC sequentialspec
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_6(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 75]
+        states.append(state)
+        return state
+
+    def reduce_7(values, states, starts, ends):
+        # program -> joinspec sequentialspec
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_7(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 71]
+        states.append(state)
+        return state
+
+    def reduce_8(values, states, starts, ends):
+        # joinspec -> JOIN LPAREN arglist SEPARE arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN statement
+        p = values[-16:]
+        p[0] = None
+        del values[-15:]
+        del states[-15:]
+        del starts[-14:]
+        del ends[-15:-1]
+        rule_8(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 66]
+        states.append(state)
+        return state
+
+    def reduce_9(values, states, starts, ends):
+        # joinspec -> JOIN error RPAREN block
+        p = values[-5:]
+        p[0] = None
+        del values[-4:]
+        del states[-4:]
+        del starts[-3:]
+        del ends[-4:-1]
+        rule_9(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 66]
+        states.append(state)
+        return state
+
+    def reduce_10(values, states, starts, ends):
+        # joinspec -> JOIN LPAREN arglist SEPARE arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN error
+        p = values[-16:]
+        p[0] = None
+        del values[-15:]
+        del states[-15:]
+        del starts[-14:]
+        del ends[-15:-1]
+        rule_10(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 66]
+        states.append(state)
+        return state
+
+    def reduce_11(values, states, starts, ends):
+        # sequentialspec -> SEQUENTIAL LPAREN arglist RPAREN RETURNS LPAREN identlist RPAREN LOCALS LPAREN arglist RPAREN statement
+        p = values[-14:]
+        p[0] = None
+        del values[-13:]
+        del states[-13:]
+        del starts[-12:]
+        del ends[-13:-1]
+        rule_11(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 74]
+        states.append(state)
+        return state
+
+    def reduce_12(values, states, starts, ends):
+        # arglist -> arglist COMMA arg
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_12(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 53]
+        states.append(state)
+        return state
+
+    def reduce_13(values, states, starts, ends):
+        # arglist -> arg
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_13(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 53]
+        states.append(state)
+        return state
+
+    def reduce_14(values, states, starts, ends):
+        # arglist -> <empty>
+        p = [None]
+        starts.append(ends[-1])
+        ends.append(ends[-1])
+        rule_14(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 53]
+        states.append(state)
+        return state
+
+    def reduce_15(values, states, starts, ends):
+        # arg -> type identifier
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_15(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 52]
+        states.append(state)
+        return state
+
+    def reduce_16(values, states, starts, ends):
+        # arg -> error
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_16(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 52]
+        states.append(state)
+        return state
+
+    def reduce_17(values, states, starts, ends):
+        # identlist -> identifier
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_17(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 64]
+        states.append(state)
+        return state
+
+    def reduce_18(values, states, starts, ends):
+        # identlist -> identlist COMMA identifier
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_18(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 64]
+        states.append(state)
+        return state
+
+    def reduce_19(values, states, starts, ends):
+        # identlist -> <empty>
+        p = [None]
+        starts.append(ends[-1])
+        ends.append(ends[-1])
+        rule_19(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 64]
+        states.append(state)
+        return state
+
+    def reduce_20(values, states, starts, ends):
+        # constant -> NUMBER
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_20(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 58]
+        states.append(state)
+        return state
+
+    def reduce_21(values, states, starts, ends):
+        # constant -> TRUE
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_21(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 58]
+        states.append(state)
+        return state
+
+    def reduce_22(values, states, starts, ends):
+        # constant -> FALSE
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_22(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 58]
+        states.append(state)
+        return state
+
+    def reduce_23(values, states, starts, ends):
+        # postfixExpression -> constant
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_23(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_24(values, states, starts, ends):
+        # postfixExpression -> identifier
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_24(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_25(values, states, starts, ends):
+        # postfixExpression -> LPAREN expression RPAREN
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_25(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_26(values, states, starts, ends):
+        # identifier -> IDENT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_26(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 63]
+        states.append(state)
+        return state
+
+    def reduce_27(values, states, starts, ends):
+        # postfixExpression -> postfixExpression LBRACKET expression RBRACKET
+        p = values[-5:]
+        p[0] = None
+        del values[-4:]
+        del states[-4:]
+        del starts[-3:]
+        del ends[-4:-1]
+        rule_27(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_28(values, states, starts, ends):
+        # postfixExpression -> IDENT LPAREN expressionlist RPAREN
+        p = values[-5:]
+        p[0] = None
+        del values[-4:]
+        del states[-4:]
+        del starts[-3:]
+        del ends[-4:-1]
+        rule_28(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 70]
+        states.append(state)
+        return state
+
+    def reduce_29(values, states, starts, ends):
+        # unaryExpression -> unop unaryExpression
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_29(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 79]
+        states.append(state)
+        return state
+
+    def reduce_30(values, states, starts, ends):
+        # unaryExpression -> postfixExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_30(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 79]
+        states.append(state)
+        return state
+
+    def reduce_31(values, states, starts, ends):
+        # unop -> PLUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_31(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_32(values, states, starts, ends):
+        # unop -> MINUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_32(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_33(values, states, starts, ends):
+        # unop -> EXCLAMATION
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_33(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_34(values, states, starts, ends):
+        # unop -> TILDE
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_34(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 80]
+        states.append(state)
+        return state
+
+    def reduce_35(values, states, starts, ends):
+        # multiplicativeExpression -> unaryExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_35(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 67]
+        states.append(state)
+        return state
+
+    def reduce_36(values, states, starts, ends):
+        # multiplicativeExpression -> multiplicativeExpression multop unaryExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_36(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 67]
+        states.append(state)
+        return state
+
+    def reduce_37(values, states, starts, ends):
+        # multop -> TIMES
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_37(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 68]
+        states.append(state)
+        return state
+
+    def reduce_38(values, states, starts, ends):
+        # multop -> DIV
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_38(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 68]
+        states.append(state)
+        return state
+
+    def reduce_39(values, states, starts, ends):
+        # additiveExpression -> multiplicativeExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_39(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 49]
+        states.append(state)
+        return state
+
+    def reduce_40(values, states, starts, ends):
+        # additiveExpression -> additiveExpression addop multiplicativeExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_40(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 49]
+        states.append(state)
+        return state
+
+    def reduce_41(values, states, starts, ends):
+        # addop -> PLUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_41(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 50]
+        states.append(state)
+        return state
+
+    def reduce_42(values, states, starts, ends):
+        # addop -> MINUS
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_42(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 50]
+        states.append(state)
+        return state
+
+    def reduce_43(values, states, starts, ends):
+        # relationalExpression -> additiveExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_43(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 72]
+        states.append(state)
+        return state
+
+    def reduce_44(values, states, starts, ends):
+        # relationalExpression -> relationalExpression compop additiveExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_44(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 72]
+        states.append(state)
+        return state
+
+    def reduce_45(values, states, starts, ends):
+        # compop -> LT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_45(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_46(values, states, starts, ends):
+        # compop -> LEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_46(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_47(values, states, starts, ends):
+        # compop -> GT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_47(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_48(values, states, starts, ends):
+        # compop -> GEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_48(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 56]
+        states.append(state)
+        return state
+
+    def reduce_49(values, states, starts, ends):
+        # equalityExpression -> relationalExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_49(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 60]
+        states.append(state)
+        return state
+
+    def reduce_50(values, states, starts, ends):
+        # equalityExpression -> equalityExpression eqop relationalExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_50(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 60]
+        states.append(state)
+        return state
+
+    def reduce_51(values, states, starts, ends):
+        # eqop -> EQEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_51(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 59]
+        states.append(state)
+        return state
+
+    def reduce_52(values, states, starts, ends):
+        # eqop -> NEQ
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_52(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 59]
+        states.append(state)
+        return state
+
+    def reduce_53(values, states, starts, ends):
+        # andExpression -> equalityExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_53(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 51]
+        states.append(state)
+        return state
+
+    def reduce_54(values, states, starts, ends):
+        # andExpression -> andExpression AND equalityExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_54(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 51]
+        states.append(state)
+        return state
+
+    def reduce_55(values, states, starts, ends):
+        # orExpression -> andExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_55(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 69]
+        states.append(state)
+        return state
+
+    def reduce_56(values, states, starts, ends):
+        # orExpression -> orExpression OR andExpression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_56(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 69]
+        states.append(state)
+        return state
+
+    def reduce_57(values, states, starts, ends):
+        # conditionalExpression -> orExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_57(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 57]
+        states.append(state)
+        return state
+
+    def reduce_58(values, states, starts, ends):
+        # conditionalExpression -> orExpression QUESTION expression COLON expression
+        p = values[-6:]
+        p[0] = None
+        del values[-5:]
+        del states[-5:]
+        del starts[-4:]
+        del ends[-5:-1]
+        rule_58(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 57]
+        states.append(state)
+        return state
+
+    def reduce_59(values, states, starts, ends):
+        # expression -> conditionalExpression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_59(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 61]
+        states.append(state)
+        return state
+
+    def reduce_60(values, states, starts, ends):
+        # expression -> EXPR
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_60(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 61]
+        states.append(state)
+        return state
+
+    def reduce_61(values, states, starts, ends):
+        # expressionlist -> expression
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_61(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 62]
+        states.append(state)
+        return state
+
+    def reduce_62(values, states, starts, ends):
+        # expressionlist -> expressionlist COMMA expression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_62(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 62]
+        states.append(state)
+        return state
+
+    def reduce_63(values, states, starts, ends):
+        # expressionlist -> <empty>
+        p = [None]
+        starts.append(ends[-1])
+        ends.append(ends[-1])
+        rule_63(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 62]
+        states.append(state)
+        return state
+
+    def reduce_64(values, states, starts, ends):
+        # statementlist -> statementlist statement
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_64(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 77]
+        states.append(state)
+        return state
+
+    def reduce_65(values, states, starts, ends):
+        # statementlist -> <empty>
+        p = [None]
+        starts.append(ends[-1])
+        ends.append(ends[-1])
+        rule_65(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 77]
+        states.append(state)
+        return state
+
+    def reduce_66(values, states, starts, ends):
+        # assignmentStatement -> postfixExpression EQ expression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_66(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_67(values, states, starts, ends):
+        # assignmentStatement -> IDENT PLUS PLUS
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_67(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_68(values, states, starts, ends):
+        # assignmentStatement -> IDENT MINUS MINUS
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_68(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_69(values, states, starts, ends):
+        # assignmentStatement -> postfixExpression EQ error
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_69(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_70(values, states, starts, ends):
+        # assignmentStatement -> error EQ expression
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_70(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 54]
+        states.append(state)
+        return state
+
+    def reduce_71(values, states, starts, ends):
+        # statement -> assignmentStatement SEMICOLON
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_71(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_72(values, states, starts, ends):
+        # statement -> iterationStatement
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_72(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_73(values, states, starts, ends):
+        # statement -> selectionStatement
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_73(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_74(values, states, starts, ends):
+        # statement -> block
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_74(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_75(values, states, starts, ends):
+        # statement -> error SEMICOLON
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_75(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 76]
+        states.append(state)
+        return state
+
+    def reduce_76(values, states, starts, ends):
+        # selectionStatement -> IF LPAREN expression RPAREN statement ELSE statement
+        p = values[-8:]
+        p[0] = None
+        del values[-7:]
+        del states[-7:]
+        del starts[-6:]
+        del ends[-7:-1]
+        rule_76(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 73]
+        states.append(state)
+        return state
+
+    def reduce_77(values, states, starts, ends):
+        # selectionStatement -> IF LPAREN expression RPAREN statement
+        p = values[-6:]
+        p[0] = None
+        del values[-5:]
+        del states[-5:]
+        del starts[-4:]
+        del ends[-5:-1]
+        rule_77(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 73]
+        states.append(state)
+        return state
+
+    def reduce_78(values, states, starts, ends):
+        # iterationStatement -> FOR LPAREN assignmentStatement SEMICOLON expression SEMICOLON assignmentStatement RPAREN statement
+        p = values[-10:]
+        p[0] = None
+        del values[-9:]
+        del states[-9:]
+        del starts[-8:]
+        del ends[-9:-1]
+        rule_78(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 65]
+        states.append(state)
+        return state
+
+    def reduce_79(values, states, starts, ends):
+        # block -> LBRACE statementlist RBRACE
+        p = values[-4:]
+        p[0] = None
+        del values[-3:]
+        del states[-3:]
+        del starts[-2:]
+        del ends[-3:-1]
+        rule_79(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 55]
+        states.append(state)
+        return state
+
+    def reduce_80(values, states, starts, ends):
+        # block -> LAZYBODY
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_80(p)
+        values.append(p[0])
+        state = goto[gotobase[states[-1]] + 55]
+        states.append(state)
+        return state
+
+    def reduce_81(values, states, starts, ends):
+        # type -> INT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_81(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    def reduce_82(values, states, starts, ends):
+        # type -> FLOAT
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_82(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    def reduce_83(values, states, starts, ends):
+        # type -> BOOL
+        p = values[-2:]
+        p[0] = None
+        del values[-1:]
+        del states[-1:]
+        rule_83(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    def reduce_84(values, states, starts, ends):
+        # type -> type TIMES
+        p = values[-3:]
+        p[0] = None
+        del values[-2:]
+        del states[-2:]
+        del starts[-1:]
+        del ends[-2:-1]
+        rule_84(p)
+        v = p[0]
+        v.start = starts[-1]
+        v.end = ends[-1]
+        values.append(v)
+        state = goto[gotobase[states[-1]] + 78]
+        states.append(state)
+        return state
+
+    if passthrough:
+        reducers = [None, 75, reduce_2, reduce_3, reduce_4, reduce_5, reduce_6, reduce_7, reduce_8, reduce_9, reduce_10, reduce_11, reduce_12, reduce_13, reduce_14, reduce_15, reduce_16, reduce_17, reduce_18, reduce_19, reduce_20, reduce_21, reduce_22, 70, 70, reduce_25, reduce_26, reduce_27, reduce_28, reduce_29, 79, reduce_31, reduce_32, reduce_33, reduce_34, 67, reduce_36, reduce_37, reduce_38, 49, reduce_40, reduce_41, reduce_42, 72, reduce_44, reduce_45, reduce_46, reduce_47, reduce_48, 60, reduce_50, reduce_51, reduce_52, 51, reduce_54, 69, reduce_56, 57, reduce_58, 61, reduce_60, reduce_61, reduce_62, reduce_63, reduce_64, reduce_65, reduce_66, reduce_67, reduce_68, reduce_69, reduce_70, reduce_71, 76, 76, 76, reduce_75, reduce_76, reduce_77, reduce_78, reduce_79, reduce_80, reduce_81, reduce_82, reduce_83, reduce_84]
+    else:
+        reducers = [None, reduce_1, reduce_2, reduce_3, reduce_4, reduce_5, reduce_6, reduce_7, reduce_8, reduce_9, reduce_10, reduce_11, reduce_12, reduce_13, reduce_14, reduce_15, reduce_16, reduce_17, reduce_18, reduce_19, reduce_20, reduce_21, reduce_22, reduce_23, reduce_24, reduce_25, reduce_26, reduce_27, reduce_28, reduce_29, reduce_30, reduce_31, reduce_32, reduce_33, reduce_34, reduce_35, reduce_36, reduce_37, reduce_38, reduce_39, reduce_40, reduce_41, reduce_42, reduce_43, reduce_44, reduce_45, reduce_46, reduce_47, reduce_48, reduce_49, reduce_50, reduce_51, reduce_52, reduce_53, reduce_54, reduce_55, reduce_56, reduce_57, reduce_58, reduce_59, reduce_60, reduce_61, reduce_62, reduce_63, reduce_64, reduce_65, reduce_66, reduce_67, reduce_68, reduce_69, reduce_70, reduce_71, reduce_72, reduce_73, reduce_74, reduce_75, reduce_76, reduce_77, reduce_78, reduce_79, reduce_80, reduce_81, reduce_82, reduce_83, reduce_84]
+
+    def parse(parser, get_token):
+        states = [0]
+        values = [None]
+        starts = [0]
+        ends = [0]
+        push_start = starts.append
+        push_end = ends.append
+        parser.statestack = states
+        state = 0
+        ltype = None
+        while True:
+            t = default[state]
+            if not t:
+                if ltype is None:
+                    lookahead = get_token()
+                    ltype = lookahead.type if lookahead is not None else '$end'
+                    code = codes.get(ltype, unknown)
+                i = base[state] + code
+                if check[i] != state:
+                    return parser.recover(states, values, lookahead, starts, ends)
+                t = value[i]
+            if t > 0:
+                states.append(t)
+                values.append(lookahead.value)
+                push_start(lookahead.lexpos)
+                push_end(lookahead.endlexpos)
+                ltype = None
+                state = t
+            elif t < 0:
+                r = reducers[-t]
+                if r.__class__ is int:
+                    state = states[-1] = goto[gotobase[states[-2]] + r]
+                else:
+                    state = r(values, states, starts, ends)
+            else:
+                return values[-1]
+
+    return parse
+
+
@@ -40,6 +40,8 @@ import types
 import copy
 import os
 import inspect
+import bisect
+from array import array
 
 # This tuple contains known string types
 try:
@@ -49,6 +51,14 @@ except AttributeError:
     # Python 3.0
     StringTypes = (str, bytes)
 
+# Buffer objects are lexed in place: regular expressions match directly
+# against them and their slices are strings.  Bytes-like objects whose
+# slices are not strings (bytearray) are viewed through a buffer.
+try:
+    BufferType = buffer
+except NameError:
+    BufferType = None
+
 # This regular expression is used to match valid token names
 _is_identifier = re.compile(r'^[a-zA-Z0-9_]+$')
 
@@ -61,7 +71,13 @@ class LexError(Exception):
 
 
 # Token class.  This class is used to represent the tokens produced.
+# Tokens have a fixed set of attributes, so that creating one allocates no
+# instance dictionary.  lexer is only set on tokens passed to token rules.
+# endlexpos is the position just past the text a token stands for, the end
+# of its own match for the tokens made here (see YaccProduction.lexspan()).
 class LexToken(object):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlexpos', 'lexer')
+
     def __str__(self):
         return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
 
@@ -133,6 +149,7 @@ class Lexer:
         self.lexpos = 0               # Current position in input text
         self.lexlen = 0               # Length of the input text
         self.lexerrorf = None         # Error rule (if any)
+        self.lexerrorlen = None       # Length of the value of error tokens (None for the rest of the input)
         self.lexeoff = None           # EOF rule (if any)
         self.lextokens = None         # List of valid tokens
         self.lexignore = ''           # Ignored characters
@@ -140,6 +157,7 @@ class Lexer:
         self.lexmodule = None         # Module
         self.lineno = 1               # Current line number
         self.lexoptimize = False      # Optimized mode
+        self.linestarts = None        # Offsets at which the lines of the input start
 
     def clone(self, object=None):
         c = copy.copy(self)
@@ -171,7 +189,7 @@ class Lexer:
     # ------------------------------------------------------------
     # writetab() - Write lexer information to a table file
     # ------------------------------------------------------------
-    def writetab(self, lextab, outputdir=''):
+    def writetab(self, lextab, outputdir='', signature=''):
         if isinstance(lextab, types.ModuleType):
             raise IOError("Won't overwrite existing lextab module")
         basetabmodule = lextab.split('.')[-1]
@@ -183,6 +201,7 @@ class Lexer:
             tf.write('_lexreflags   = %s\n' % repr(self.lexreflags))
             tf.write('_lexliterals  = %s\n' % repr(self.lexliterals))
             tf.write('_lexstateinfo = %s\n' % repr(self.lexstateinfo))
+            tf.write('_lexsignature = %s\n' % repr(signature))
 
             # Rewrite the lexstatere table, replacing function objects with function names 
             tabre = {}
@@ -208,7 +227,7 @@ class Lexer:
     # ------------------------------------------------------------
     # readtab() - Read lexer information from a tab file
     # ------------------------------------------------------------
-    def readtab(self, tabfile, fdict):
+    def readtab(self, tabfile, fdict, signature=None):
         if isinstance(tabfile, types.ModuleType):
             lextab = tabfile
         else:
@@ -218,6 +237,9 @@ class Lexer:
         if getattr(lextab, '_tabversion', '0.0') != __tabversion__:
             raise ImportError('Inconsistent PLY version')
 
+        if signature is not None and getattr(lextab, '_lexsignature', None) != signature:
+            raise ImportError('Lexer rules have changed since the table was written')
+
         self.lextokens      = lextab._lextokens
         self.lexreflags     = lextab._lexreflags
         self.lexliterals    = lextab._lexliterals
@@ -251,11 +273,33 @@ class Lexer:
     def input(self, s):
         # Pull off the first character to see if s looks like a string
         c = s[:1]
+        if not isinstance(c, StringTypes) and BufferType is not None:
+            try:
+                s = BufferType(s)
+                c = s[:1]
+            except TypeError:
+                pass
         if not isinstance(c, StringTypes):
             raise ValueError('Expected a string')
         self.lexdata = s
         self.lexpos = 0
         self.lexlen = len(s)
+        self.linestarts = None
+
+    # ------------------------------------------------------------
+    # position() - Return the (line, column) of a position in the input
+    #
+    # Lines and columns are numbered from 1.  The offsets at which the
+    # lines start are collected once per input, the first time a position
+    # is asked for, so tokens and anything built from them only need to
+    # keep their lexpos.
+    # ------------------------------------------------------------
+    def position(self, lexpos):
+        linestarts = self.linestarts
+        if linestarts is None:
+            linestarts = self.linestarts = line_starts(self.lexdata)
+        line = bisect.bisect_right(linestarts, lexpos)
+        return line, lexpos - linestarts[line - 1] + 1
 
     # ------------------------------------------------------------
     # begin() - Changes the lexing state
@@ -326,6 +370,7 @@ class Lexer:
                 tok.value = m.group()
                 tok.lineno = self.lineno
                 tok.lexpos = lexpos
+                lexpos = tok.endlexpos = m.end()
 
                 i = m.lastindex
                 func, tok.type = lexindexfunc[i]
@@ -333,14 +378,11 @@ class Lexer:
                 if not func:
                     # If no token type was set, it's an ignored token
                     if tok.type:
-                        self.lexpos = m.end()
+                        self.lexpos = lexpos
                         return tok
                     else:
-                        lexpos = m.end()
                         break
 
-                lexpos = m.end()
-
                 # If token is processed by a function, call it
 
                 tok.lexer = self      # Set additional attributes useful in token rules
@@ -371,17 +413,20 @@ class Lexer:
                     tok.lineno = self.lineno
                     tok.type = tok.value
                     tok.lexpos = lexpos
-                    self.lexpos = lexpos + 1
+                    tok.endlexpos = self.lexpos = lexpos + 1
                     return tok
 
                 # No match. Call t_error() if defined.
                 if self.lexerrorf:
                     tok = LexToken()
-                    tok.value = self.lexdata[lexpos:]
+                    if self.lexerrorlen is None:
+                        tok.value = lexdata[lexpos:]
+                    else:
+                        tok.value = lexdata[lexpos:lexpos + self.lexerrorlen]
                     tok.lineno = self.lineno
                     tok.type = 'error'
                     tok.lexer = self
-                    tok.lexpos = lexpos
+                    tok.lexpos = tok.endlexpos = lexpos
                     self.lexpos = lexpos
                     newtok = self.lexerrorf(tok)
                     if lexpos == self.lexpos:
@@ -400,7 +445,7 @@ class Lexer:
             tok.type = 'eof'
             tok.value = ''
             tok.lineno = self.lineno
-            tok.lexpos = lexpos
+            tok.lexpos = tok.endlexpos = lexpos
             tok.lexer = self
             self.lexpos = lexpos
             newtok = self.lexeoff(tok)
@@ -423,6 +468,18 @@ class Lexer:
 
     __next__ = next
 
+# -----------------------------------------------------------------------------
+# line_starts()
+#
+# Return an array with the offsets at which the lines of a string start
+# -----------------------------------------------------------------------------
+_newline_re = re.compile(r'\n')
+
+def line_starts(data):
+    starts = array('l', [0])
+    starts.extend([m.end() for m in _newline_re.finditer(data)])
+    return starts
+
 # -----------------------------------------------------------------------------
 #                           ==== Lex Builder ===
 #
@@ -725,6 +782,29 @@ class LexerReflect(object):
         for s in self.strsym.values():
             s.sort(key=lambda x: len(x[1]), reverse=True)
 
+    # Compute a signature over the token rules.  The table written in optimized
+    # mode is only reused while this signature stays the same.
+    def signature(self):
+        parts = []
+        try:
+            parts.append(' '.join(self.tokens))
+            parts.append(repr(self.literals))
+            parts.append(repr(self.reflags))
+            for state in sorted(self.stateinfo):
+                parts.append('%s:%s' % (state, self.stateinfo[state]))
+                for fname, f in self.funcsym[state]:
+                    parts.append('%s=%s' % (fname, _get_regex(f)))
+                for name, r in sorted(self.strsym[state]):
+                    parts.append('%s=%s' % (name, r))
+                parts.append(repr(self.ignore.get(state)))
+                ef = self.errorf.get(state)
+                parts.append(ef.__name__ if ef else '')
+                ef = self.eoff.get(state)
+                parts.append(ef.__name__ if ef else '')
+        except (AttributeError, KeyError, TypeError):
+            pass
+        return ' '.join(parts)
+
     # Validate all of the t_rules collected
     def validate_rules(self):
         for state in self.stateinfo:
@@ -911,7 +991,7 @@ def lex(module=None, object=None, debug=False, optimize=False, lextab='lextab',
 
     if optimize and lextab:
         try:
-            lexobj.readtab(lextab, ldict)
+            lexobj.readtab(lextab, ldict, linfo.signature())
             token = lexobj.token
             input = lexobj.input
             lexer = lexobj
@@ -1040,7 +1120,7 @@ def lex(module=None, object=None, debug=False, optimize=False, lextab='lextab',
                     srcfile = getattr(sys.modules[pkgname], '__file__', '')
             outputdir = os.path.dirname(srcfile)
         try:
-            lexobj.writetab(lextab, outputdir)
+            lexobj.writetab(lextab, outputdir, linfo.signature())
         except IOError as e:
             errorlog.warning("Couldn't write lextab module %r. %s" % (lextab, e))
 
@@ -62,10 +62,16 @@
 import re
 import types
 import sys
+import copy
+import time
 import os.path
 import inspect
+import textwrap
+import ast as pyast
 import base64
+import struct
 import warnings
+from array import array
 
 __version__    = '3.10'
 __tabversion__ = '3.10'
@@ -92,6 +98,14 @@ resultlimit = 40               # Size limit of results when running in debug mod
 
 pickle_protocol = 0            # Protocol to use when writing pickle files
 
+# Layout of mapped table files: a header giving the size of the marshalled
+# index that follows it, then the arrays, each aligned to 8 bytes
+mapped_magic = b'PLYTABLE'
+mapped_header = '<8sI'
+
+def mapped_align(offset):
+    return (offset + 7) & ~7
+
 # String type-checking compatibility
 if sys.version_info[0] < 3:
     string_types = basestring
@@ -155,6 +169,143 @@ def format_stack_entry(r):
     else:
         return '<%s @ 0x%x>' % (type(r).__name__, id(r))
 
+# Recognize grammar rules whose action is p[0] = p[1].  The bytecode of the
+# rule is compared with that of a reference rule, ignoring the docstring.
+def _passthrough_rule(p):
+    'a : b'
+    p[0] = p[1]
+
+def is_passthrough(func):
+    code = getattr(func, '__code__', None)
+    ref = _passthrough_rule.__code__
+    return (code is not None and code.co_argcount == ref.co_argcount and
+            code.co_code == ref.co_code and code.co_consts[1:] == ref.co_consts[1:])
+
+# Return the pass-through rules among productions, as a dict mapping the
+# production number to the name of its left side.  Only unit rules whose
+# right hand side is a nonterminal count, so the symbol that a pass-through
+# reduction relabels is always one the parser created itself.
+def passthrough_rules(productions):
+    nonterminals = set(p.name for p in productions)
+    rules = {}
+    for n, p in enumerate(productions):
+        if p.len == 1 and p.str.split()[2] in nonterminals and is_passthrough(p.callable):
+            rules[n] = p.name
+    return rules
+
+# How the rule of a production treats the spanned classes (see
+# LRParser.set_spanned): span_never if it never returns a new instance of
+# one, span_always if every call does, and span_check if only the value it
+# returns can tell.  The kind is read from the source of the rule: a rule
+# returns a new instance when it sets p[0] to a call of one of the classes,
+# and passes a value on when it sets it to p[n].  A rule that sets p[0]
+# once, at its top level, with no return statement, always does so.  Rules
+# without source, or that use p in any other way, are span_check.
+span_never = 0
+span_always = 1
+span_check = 2
+
+_literals = frozenset(['Num', 'Str', 'Bytes', 'Constant', 'NameConstant', 'List', 'ListComp',
+                       'Tuple', 'Dict', 'DictComp', 'Set', 'SetComp', 'GeneratorExp'])
+
+def _subscript_index(node):
+    index = node.slice
+    if index.__class__.__name__ == 'Index':
+        index = index.value
+    return getattr(index, 'n', getattr(index, 'value', None))
+
+def span_kind(func, classes):
+    try:
+        funcdef = pyast.parse(textwrap.dedent(inspect.getsource(func))).body[0]
+    except (IOError, TypeError, SyntaxError):
+        return span_check
+    if not isinstance(funcdef, pyast.FunctionDef) or len(funcdef.args.args) != 1:
+        return span_check
+    arg = funcdef.args.args[0]
+    p = getattr(arg, 'id', getattr(arg, 'arg', None))
+
+    # Every use of p must be a subscript, and every store into it p[0] = ...
+    names = []
+    subscripts = []
+    stores = []
+    localnames = set()
+    for statement in funcdef.body:
+        for node in pyast.walk(statement):
+            if isinstance(node, pyast.Name):
+                if node.id == p:
+                    names.append(node)
+                elif not isinstance(node.ctx, pyast.Load):
+                    localnames.add(node.id)
+            elif isinstance(node, pyast.Subscript) and getattr(node.value, 'id', None) == p:
+                subscripts.append(node)
+            elif isinstance(node, pyast.Assign):
+                for target in node.targets:
+                    if (isinstance(target, pyast.Subscript) and getattr(target.value, 'id', None) == p
+                        and _subscript_index(target) == 0):
+                        stores.append(node)
+            elif isinstance(node, (pyast.Return, pyast.FunctionDef, pyast.Lambda)):
+                return span_check
+    if len(names) != len(subscripts):
+        return span_check
+    if len(stores) != len([node for node in subscripts if not isinstance(node.ctx, pyast.Load)]):
+        return span_check
+
+    namespace = dict(func.__globals__)
+    builtins = namespace.get('__builtins__', {})
+    namespace.update(builtins if isinstance(builtins, dict) else vars(builtins))
+    new = 0
+    for store in stores:
+        value = store.value
+        if isinstance(value, pyast.Call):
+            callee = value.func
+            path = []
+            while isinstance(callee, pyast.Attribute):
+                path.append(callee.attr)
+                callee = callee.value
+            if not isinstance(callee, pyast.Name) or callee.id in localnames or callee.id not in namespace:
+                return span_check
+            callee = namespace[callee.id]
+            for name in reversed(path):
+                callee = getattr(callee, name, None)
+            if not inspect.isclass(callee):
+                return span_check
+            new += issubclass(callee, classes)
+        elif isinstance(value, pyast.Subscript) and getattr(value.value, 'id', None) == p:
+            pass
+        elif value.__class__.__name__ not in _literals:
+            return span_check
+    if not new:
+        return span_never
+    if new == len(stores) == 1 and stores[0] in funcdef.body:
+        return span_always
+    return span_check
+
+# Return the span kinds of the rules of productions, as a list indexed by
+# production number.  The kinds are remembered for every rule and classes.
+_span_kinds = {}
+
+def span_kinds(productions, classes):
+    kinds = []
+    for p in productions:
+        if not p.callable:
+            kinds.append(span_never)
+            continue
+        key = p.callable, classes
+        if key not in _span_kinds:
+            _span_kinds[key] = span_kind(p.callable, classes)
+        kinds.append(_span_kinds[key])
+    return kinds
+
+# True if value, the result of a rule of the symbols targ[1:], is an instance
+# of classes that the rule did not take from its right side
+def built_instance(value, targ, classes):
+    if not isinstance(value, classes):
+        return False
+    for sym in targ[1:]:
+        if sym.value is value:
+            return False
+    return True
+
 # Panic mode error recovery support.   This feature is being reworked--much of the
 # code here is to offer a deprecation/backwards compatible transition
 
@@ -214,7 +365,13 @@ def call_errorfunc(errorfunc, token, parser):
 #        .lexpos     = Starting lex position
 #        .endlexpos  = Ending lex position (optional, set automatically)
 
-class YaccSymbol:
+# The attributes are fixed, so that creating a symbol allocates no instance
+# dictionary.  The positions are set when tracking or when the parser gives
+# spans (see LRParser.set_spanned()), and lexer when a symbol is passed to
+# p_error().
+class YaccSymbol(object):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos', 'lexer')
+
     def __str__(self):
         return self.type
 
@@ -276,6 +433,71 @@ class YaccProduction:
     def error(self):
         raise SyntaxError
 
+# -----------------------------------------------------------------------------
+#                             == ParseCounters ==
+#
+# Counts of the tokens read and of the reductions of every production, and
+# the time spent in the grammar rules, for LRParser.enable_counters().  The
+# counts are taken by wrappers around the rules and the token function, so
+# the parse loops are not slowed down when counting is off.  Pass-through
+# rules are called like any other rule while counting, so every reduction
+# is counted.
+# -----------------------------------------------------------------------------
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+class ParseCounters(object):
+    def __init__(self, productions):
+        self.productions = productions
+        self.tokens = 0
+        self.reductions = [0] * len(productions)
+        self.seconds = [0.0] * len(productions)
+
+    # Zero the counts.  The lists are updated in place, since the wrappers
+    # hold on to them.
+    def reset(self):
+        self.tokens = 0
+        self.reductions[:] = [0] * len(self.productions)
+        self.seconds[:] = [0.0] * len(self.productions)
+
+    # Return func wrapped to count the reductions of production n
+    def count_rule(self, n, func):
+        reductions = self.reductions
+        seconds = self.seconds
+        def counted(p):
+            reductions[n] += 1
+            start = _clock()
+            try:
+                func(p)
+            finally:
+                seconds[n] += _clock() - start
+        counted.__name__ = func.__name__
+        counted.__doc__ = func.__doc__
+        return counted
+
+    # Return get_token wrapped to count the tokens it returns
+    def count_tokens(self, get_token):
+        def counted():
+            tok = get_token()
+            if tok is not None:
+                self.tokens += 1
+            return tok
+        return counted
+
+    # Write the counts of the productions that were reduced, those that
+    # took the most time first
+    def report(self, out=None):
+        out = out or sys.stderr
+        rows = sorted(((self.seconds[n], self.reductions[n], p.str)
+                       for n, p in enumerate(self.productions) if self.reductions[n]), reverse=True)
+        total = sum(self.seconds)
+        out.write('%d tokens, %d reductions, %.6fs in grammar rules\n' %
+                  (self.tokens, sum(self.reductions), total))
+        out.write('%10s %10s %8s %6s  %s\n' % ('reductions', 'seconds', 'us/call', '%time', 'production'))
+        for seconds, reductions, name in rows:
+            out.write('%10d %10.6f %8.2f %6.1f  %s\n' % (reductions, seconds, seconds / reductions * 1e6,
+                                                      100.0 * seconds / total if total else 0.0, name))
+
 # -----------------------------------------------------------------------------
 #                               == LRParser ==
 #
@@ -289,7 +511,21 @@ class LRParser:
         self.goto = lrtab.lr_goto
         self.errorfunc = errorf
         self.set_defaulted_states()
+        self.set_passthrough_rules()
         self.errorok = True
+        self.signature = None
+        self.counters = None
+        self.spanned = ()
+        self.spanning = []
+
+    # Return a new parser sharing this parser's tables.  The tables are never
+    # modified while parsing, but the state and symbol stacks are, so every
+    # thread that parses concurrently needs a clone of its own.
+    def clone(self):
+        c = copy.copy(self)
+        c.statestack = []
+        c.symstack = []
+        return c
 
     def errok(self):
         self.errorok = True
@@ -299,6 +535,7 @@ class LRParser:
         del self.symstack[:]
         sym = YaccSymbol()
         sym.type = '$end'
+        sym.lexpos = sym.endlexpos = 0
         self.symstack.append(sym)
         self.statestack.append(0)
 
@@ -320,7 +557,66 @@ class LRParser:
     def disable_defaulted_states(self):
         self.defaulted_states = {}
 
+    # Pass-through rule support.
+    # A unit rule such as "a : b" whose action only does p[0] = p[1] leaves the
+    # value on the stack unchanged.  Reducing it needs nothing but the goto, so
+    # instead of calling the rule the parser relabels the symbol on top of the
+    # stack.  Expression grammars are full of cascades of such rules (see
+    # passthrough_rules()).
+    def set_passthrough_rules(self):
+        self.passthrough = passthrough_rules(self.productions)
+
+    def disable_passthrough_rules(self):
+        self.passthrough = {}
+
+    # Span support.
+    # spanned is a tuple of classes, empty unless set.  When a grammar rule builds
+    # an instance of one of them, the parser sets its start and end attributes to
+    # the lexpos of the first token of the rule and the endlexpos of the last, as
+    # lexspan() reports them, with or without tracking.  Tokens must then have an
+    # endlexpos, as the tokens of lex do.  An instance that a rule passes on from
+    # its right side keeps the span it was built with, and an empty rule spans
+    # the end of the symbol before it.  Which rules build instances is found once
+    # from their source (see span_kind()), so only the results of the rules that
+    # may are looked at while parsing.
+    def set_spanned(self, classes):
+        self.spanned = tuple(classes)
+        productions = self.productions if self.counters is None else self.counters.original
+        self.spanning = span_kinds(productions, self.spanned) if self.spanned else []
+
+    # Counters support.
+    # Count the tokens read and the reductions of every production, and time
+    # the grammar rules, until disable_counters() is called (see ParseCounters).
+    # The rules are wrapped in copies of the productions, so clones made
+    # before this call are not affected.  Pass-through rules are turned off
+    # meanwhile, so that their reductions are counted too.  Returns the
+    # counters.
+    def enable_counters(self):
+        if self.counters is None:
+            original = self.productions
+            self.productions = [copy.copy(p) for p in original]
+            self.counters = ParseCounters(self.productions)
+            self.counters.original = original
+            self.counters.passthrough = self.passthrough
+            self.passthrough = {}
+            for n, p in enumerate(self.productions):
+                if p.callable:
+                    p.callable = self.counters.count_rule(n, p.callable)
+        return self.counters
+
+    def disable_counters(self):
+        if self.counters is not None:
+            self.productions = self.counters.original
+            self.passthrough = self.counters.passthrough
+            self.counters = None
+
     def parse(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        if self.counters is not None:
+            if not lexer:
+                from . import lex
+                lexer = lex.lexer
+            tokenfunc = self.counters.count_tokens(tokenfunc or lexer.token)
+
         if debug or yaccdevel:
             if isinstance(debug, int):
                 debug = PlyLogger(sys.stderr)
@@ -345,7 +641,7 @@ class LRParser:
     #
     # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-    def parsedebug(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+    def parsedebug(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None, resume=None):
         #--! parsedebug-start
         lookahead = None                         # Current lookahead symbol
         lookaheadstack = []                      # Stack of lookahead symbols
@@ -353,6 +649,9 @@ class LRParser:
         goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
         prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
         defaulted_states = self.defaulted_states # Local reference to defaulted states
+        passthrough = self.passthrough           # Local reference to pass-through rules
+        spanned = self.spanned                   # Local reference to classes given spans
+        spanning = self.spanning                 # Local reference to span kinds of rules
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
 
@@ -384,21 +683,26 @@ class LRParser:
 
         # Set up the state and symbol stacks
 
-        statestack = []                # Stack of parsing states
+        if resume:
+            # Continue an interrupted parse from its stacks and lookahead
+            statestack, symstack, lookahead = resume
+        else:
+            statestack = []            # Stack of parsing states
+            symstack   = []            # Stack of grammar symbols
+
+            # The start state is assumed to be (0,$end)
+
+            statestack.append(0)
+            sym = YaccSymbol()
+            sym.type = '$end'
+            sym.lexpos = sym.endlexpos = 0
+            symstack.append(sym)
+        state = statestack[-1]
         self.statestack = statestack
-        symstack   = []                # Stack of grammar symbols
         self.symstack = symstack
 
         pslice.stack = symstack         # Put in the production
         errtoken   = None               # Err token
-
-        # The start state is assumed to be (0,$end)
-
-        statestack.append(0)
-        sym = YaccSymbol()
-        sym.type = '$end'
-        symstack.append(sym)
-        state = 0
         while True:
             # Get the next symbol on the input.  If a lookahead symbol
             # is already set, we just use that. Otherwise, we'll pull
@@ -453,6 +757,17 @@ class LRParser:
 
                 if t < 0:
                     # reduce a symbol on the stack, emit a production
+                    if -t in passthrough:
+                        # Pass-through rule.  Relabel the top symbol and goto
+                        pname = passthrough[-t]
+                        symstack[-1].type = pname
+                        state = goto[statestack[-2]][pname]
+                        statestack[-1] = state
+                        #--! DEBUG
+                        debug.info('Action : Pass through rule [%s] and goto state %d', prod[-t].str, state)
+                        #--! DEBUG
+                        continue
+
                     p = prod[-t]
                     pname = p.name
                     plen  = p.len
@@ -499,6 +814,13 @@ class LRParser:
                             del symstack[-plen:]
                             self.state = state
                             p.callable(pslice)
+                            if spanned:
+                                sym.lexpos = targ[1].lexpos
+                                sym.endlexpos = targ[-1].endlexpos
+                                kind = spanning[-t]
+                                if kind and (kind == span_always or built_instance(sym.value, targ, spanned)):
+                                    sym.value.start = sym.lexpos
+                                    sym.value.end = sym.endlexpos
                             del statestack[-plen:]
                             #--! DEBUG
                             debug.info('Result : %s', format_result(pslice[0]))
@@ -542,6 +864,11 @@ class LRParser:
                             # Call the grammar rule with our special slice object
                             self.state = state
                             p.callable(pslice)
+                            if spanned:
+                                sym.lexpos = sym.endlexpos = symstack[-1].endlexpos
+                                kind = spanning[-t]
+                                if kind and (kind == span_always or built_instance(sym.value, targ, spanned)):
+                                    sym.value.start = sym.value.end = sym.lexpos
                             #--! DEBUG
                             debug.info('Result : %s', format_result(pslice[0]))
                             #--! DEBUG
@@ -692,7 +1019,7 @@ class LRParser:
     # changes to the parsedebug() method instead.
     # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-    def parseopt(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+    def parseopt(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None, resume=None):
         #--! parseopt-start
         lookahead = None                         # Current lookahead symbol
         lookaheadstack = []                      # Stack of lookahead symbols
@@ -700,6 +1027,9 @@ class LRParser:
         goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
         prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
         defaulted_states = self.defaulted_states # Local reference to defaulted states
+        passthrough = self.passthrough           # Local reference to pass-through rules
+        spanned = self.spanned                   # Local reference to classes given spans
+        spanning = self.spanning                 # Local reference to span kinds of rules
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
 
@@ -728,21 +1058,26 @@ class LRParser:
 
         # Set up the state and symbol stacks
 
-        statestack = []                # Stack of parsing states
+        if resume:
+            # Continue an interrupted parse from its stacks and lookahead
+            statestack, symstack, lookahead = resume
+        else:
+            statestack = []            # Stack of parsing states
+            symstack   = []            # Stack of grammar symbols
+
+            # The start state is assumed to be (0,$end)
+
+            statestack.append(0)
+            sym = YaccSymbol()
+            sym.type = '$end'
+            sym.lexpos = sym.endlexpos = 0
+            symstack.append(sym)
+        state = statestack[-1]
         self.statestack = statestack
-        symstack   = []                # Stack of grammar symbols
         self.symstack = symstack
 
         pslice.stack = symstack         # Put in the production
         errtoken   = None               # Err token
-
-        # The start state is assumed to be (0,$end)
-
-        statestack.append(0)
-        sym = YaccSymbol()
-        sym.type = '$end'
-        symstack.append(sym)
-        state = 0
         while True:
             # Get the next symbol on the input.  If a lookahead symbol
             # is already set, we just use that. Otherwise, we'll pull
@@ -783,6 +1118,14 @@ class LRParser:
 
                 if t < 0:
                     # reduce a symbol on the stack, emit a production
+                    if -t in passthrough:
+                        # Pass-through rule.  Relabel the top symbol and goto
+                        pname = passthrough[-t]
+                        symstack[-1].type = pname
+                        state = goto[statestack[-2]][pname]
+                        statestack[-1] = state
+                        continue
+
                     p = prod[-t]
                     pname = p.name
                     plen  = p.len
@@ -819,6 +1162,13 @@ class LRParser:
                             del symstack[-plen:]
                             self.state = state
                             p.callable(pslice)
+                            if spanned:
+                                sym.lexpos = targ[1].lexpos
+                                sym.endlexpos = targ[-1].endlexpos
+                                kind = spanning[-t]
+                                if kind and (kind == span_always or built_instance(sym.value, targ, spanned)):
+                                    sym.value.start = sym.lexpos
+                                    sym.value.end = sym.endlexpos
                             del statestack[-plen:]
                             symstack.append(sym)
                             state = goto[statestack[-1]][pname]
@@ -859,6 +1209,11 @@ class LRParser:
                             # Call the grammar rule with our special slice object
                             self.state = state
                             p.callable(pslice)
+                            if spanned:
+                                sym.lexpos = sym.endlexpos = symstack[-1].endlexpos
+                                kind = spanning[-t]
+                                if kind and (kind == span_always or built_instance(sym.value, targ, spanned)):
+                                    sym.value.start = sym.value.end = sym.lexpos
                             symstack.append(sym)
                             state = goto[statestack[-1]][pname]
                             statestack.append(state)
@@ -998,7 +1353,7 @@ class LRParser:
     # by the ply/ygen.py script. Make changes to the parsedebug() method instead.
     # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-    def parseopt_notrack(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+    def parseopt_notrack(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None, resume=None):
         #--! parseopt-notrack-start
         lookahead = None                         # Current lookahead symbol
         lookaheadstack = []                      # Stack of lookahead symbols
@@ -1006,6 +1361,9 @@ class LRParser:
         goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
         prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
         defaulted_states = self.defaulted_states # Local reference to defaulted states
+        passthrough = self.passthrough           # Local reference to pass-through rules
+        spanned = self.spanned                   # Local reference to classes given spans
+        spanning = self.spanning                 # Local reference to span kinds of rules
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
 
@@ -1034,21 +1392,26 @@ class LRParser:
 
         # Set up the state and symbol stacks
 
-        statestack = []                # Stack of parsing states
+        if resume:
+            # Continue an interrupted parse from its stacks and lookahead
+            statestack, symstack, lookahead = resume
+        else:
+            statestack = []            # Stack of parsing states
+            symstack   = []            # Stack of grammar symbols
+
+            # The start state is assumed to be (0,$end)
+
+            statestack.append(0)
+            sym = YaccSymbol()
+            sym.type = '$end'
+            sym.lexpos = sym.endlexpos = 0
+            symstack.append(sym)
+        state = statestack[-1]
         self.statestack = statestack
-        symstack   = []                # Stack of grammar symbols
         self.symstack = symstack
 
         pslice.stack = symstack         # Put in the production
         errtoken   = None               # Err token
-
-        # The start state is assumed to be (0,$end)
-
-        statestack.append(0)
-        sym = YaccSymbol()
-        sym.type = '$end'
-        symstack.append(sym)
-        state = 0
         while True:
             # Get the next symbol on the input.  If a lookahead symbol
             # is already set, we just use that. Otherwise, we'll pull
@@ -1089,6 +1452,14 @@ class LRParser:
 
                 if t < 0:
                     # reduce a symbol on the stack, emit a production
+                    if -t in passthrough:
+                        # Pass-through rule.  Relabel the top symbol and goto
+                        pname = passthrough[-t]
+                        symstack[-1].type = pname
+                        state = goto[statestack[-2]][pname]
+                        statestack[-1] = state
+                        continue
+
                     p = prod[-t]
                     pname = p.name
                     plen  = p.len
@@ -1116,6 +1487,13 @@ class LRParser:
                             del symstack[-plen:]
                             self.state = state
                             p.callable(pslice)
+                            if spanned:
+                                sym.lexpos = targ[1].lexpos
+                                sym.endlexpos = targ[-1].endlexpos
+                                kind = spanning[-t]
+                                if kind and (kind == span_always or built_instance(sym.value, targ, spanned)):
+                                    sym.value.start = sym.lexpos
+                                    sym.value.end = sym.endlexpos
                             del statestack[-plen:]
                             symstack.append(sym)
                             state = goto[statestack[-1]][pname]
@@ -1151,6 +1529,11 @@ class LRParser:
                             # Call the grammar rule with our special slice object
                             self.state = state
                             p.callable(pslice)
+                            if spanned:
+                                sym.lexpos = sym.endlexpos = symstack[-1].endlexpos
+                                kind = spanning[-t]
+                                if kind and (kind == span_always or built_instance(sym.value, targ, spanned)):
+                                    sym.value.start = sym.value.end = sym.lexpos
                             symstack.append(sym)
                             state = goto[statestack[-1]][pname]
                             statestack.append(state)
@@ -1985,8 +2368,15 @@ class LRTable(object):
         if parsetab._tabversion != __tabversion__:
             raise VersionError('yacc table file version is out of date')
 
-        self.lr_action = parsetab._lr_action
-        self.lr_goto = parsetab._lr_goto
+        if hasattr(parsetab, '_lr_symbols'):
+            byteorder = parsetab._lr_byteorder
+            self.lr_action = CompactTable(parsetab._lr_symbols, *[decode_array(typecode, s, byteorder)
+                                          for typecode, s in zip('ihh', parsetab._lr_action_compact)])
+            self.lr_goto = CompactTable(parsetab._lr_symbols, *[decode_array(typecode, s, byteorder)
+                                        for typecode, s in zip('ihh', parsetab._lr_goto_compact)])
+        else:
+            self.lr_action = parsetab._lr_action
+            self.lr_goto = parsetab._lr_goto
 
         self.lr_productions = []
         for p in parsetab._lr_productions:
@@ -2022,11 +2412,228 @@ class LRTable(object):
         in_f.close()
         return signature
 
+    # Read a table file written by write_mapped().  The file is mapped into
+    # memory read-only and the arrays, a few kilobytes, are copied out of it,
+    # so each process holds tables of its own.  Reading them takes no import
+    # and no decoding of the table module.
+    def read_mapped(self, filename):
+        import marshal
+        import mmap
+
+        if not os.path.exists(filename):
+          raise ImportError
+
+        with open(filename, 'rb') as in_f:
+            data = mmap.mmap(in_f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, size = struct.unpack_from(mapped_header, data)
+        if magic != mapped_magic:
+            raise VersionError('%s is not a mapped table file' % filename)
+        index = struct.calcsize(mapped_header)
+        tabversion, self.lr_method, signature, byteorder, symbols, productions, layout = \
+            marshal.loads(data[index:index + size])
+        if tabversion != __tabversion__:
+            raise VersionError('yacc table file version is out of date')
+        if byteorder != sys.byteorder:
+            raise VersionError('yacc table file was written with the wrong byte order')
+
+        start = mapped_align(index + size)
+        arrays = []
+        for typecode, offset, count in layout:
+            a = array(typecode)
+            a.fromstring(data[start + offset:start + offset + count * a.itemsize])
+            arrays.append(a)
+        data.close()
+        self.lr_action = CompactTable(symbols, *arrays[:3])
+        self.lr_goto = CompactTable(symbols, *arrays[3:])
+
+        self.lr_productions = []
+        for p in productions:
+            self.lr_productions.append(MiniProduction(*p))
+
+        return signature
+
+    # Write the tables in the compact form, as a file for read_mapped()
+    def write_mapped(self, filename, signature=''):
+        import marshal
+
+        symbols, action, goto = compact_tables(self.lr_action, self.lr_goto)
+        arrays = action + goto
+        layout = []
+        offset = 0
+        for a in arrays:
+            layout.append((a.typecode, offset, len(a)))
+            offset = mapped_align(offset + a.itemsize * len(a))
+
+        outp = []
+        for p in self.lr_productions:
+            if p.func:
+                outp.append((p.str, p.name, p.len, p.func, os.path.basename(p.file), p.line))
+            else:
+                outp.append((str(p), p.name, p.len, None, None, None))
+        index = marshal.dumps((__tabversion__, self.lr_method, signature, sys.byteorder,
+                               symbols, outp, layout))
+
+        with open(filename, 'wb') as outf:
+            outf.write(struct.pack(mapped_header, mapped_magic, len(index)))
+            outf.write(index)
+            outf.write(b'\0' * (mapped_align(outf.tell()) - outf.tell()))
+            for a in arrays:
+                a.tofile(outf)
+                outf.write(b'\0' * (mapped_align(outf.tell()) - outf.tell()))
+
     # Bind all production function names to callable objects in pdict
     def bind_callables(self, pdict):
         for p in self.lr_productions:
             p.bind(pdict)
 
+# -----------------------------------------------------------------------------
+#                            == Compact tables ==
+#
+# The action and goto tables can be stored with row displacement.  All rows
+# of a table are overlaid in one array of values, each row starting at an
+# offset of its own (its base) chosen so that no two rows use the same slot,
+# and a check array records the row that owns every slot.  The entry of row
+# r for a symbol is at base[r] + code, code being the number of the symbol in
+# the list of all symbols, and it exists if check holds r there.
+#
+# The arrays are array.array buffers of small ints, stored base64 encoded in
+# the table module.  CompactTable looks them up in place and behaves like the
+# dict of dicts it replaces, so the parse loops and everything else reading
+# LRParser.action and LRParser.goto work unchanged, at the price of slower
+# lookups.  Code that indexes the arrays directly is generated by ycompile.
+# -----------------------------------------------------------------------------
+
+# Lay out rows, a sequence of (row, {key: value}), in displacement arrays.
+# codes maps every key to a column.  Rows are placed first fit, the largest
+# first.  The arrays leave room for a column past the last one, which no row
+# uses and so never passes the check.
+def compact_rows(rows, codes, nrows):
+    base = array('i', [0] * nrows)
+    check = array('h')
+    value = array('h')
+    width = len(codes) + 1
+    for row, entries in sorted(rows, key=lambda item: (-len(item[1]), item[0])):
+        cols = [(codes[key], v) for key, v in entries.items()]
+        b = 0
+        while any(b + c < len(check) and check[b + c] != -1 for c, v in cols):
+            b += 1
+        if b + width > len(check):
+            check.extend([-1] * (b + width - len(check)))
+            value.extend([0] * (b + width - len(value)))
+        for c, v in cols:
+            check[b + c] = row
+            value[b + c] = v
+        base[row] = b
+    return base, check, value
+
+# Number the symbols of the action and goto tables and lay both out.  Returns
+# the symbols and the (base, check, value) arrays of each table.
+def compact_tables(action, goto):
+    terminals = set()
+    for actions in action.values():
+        terminals.update(actions)
+    nonterminals = set()
+    for gotos in goto.values():
+        nonterminals.update(gotos)
+    symbols = sorted(terminals) + sorted(nonterminals)
+    codes = dict((name, code) for code, name in enumerate(symbols))
+    nstates = max(state for state, actions in action.items()) + 1
+    return symbols, compact_rows(action.items(), codes, nstates), compact_rows(goto.items(), codes, nstates)
+
+def encode_array(a):
+    data = a.tobytes() if hasattr(a, 'tobytes') else a.tostring()
+    s = base64.b64encode(data)
+    if not isinstance(s, str):
+        s = s.decode('ascii')
+    return s
+
+def decode_array(typecode, s, byteorder):
+    a = array(typecode)
+    data = base64.b64decode(s)
+    if hasattr(a, 'frombytes'):
+        a.frombytes(data)
+    else:
+        a.fromstring(data)
+    if byteorder != sys.byteorder:
+        a.byteswap()
+    return a
+
+class CompactRow(object):
+    __slots__ = ('table', 'state', 'base')
+
+    def __init__(self, table, state, base):
+        self.table = table
+        self.state = state
+        self.base = base
+
+    def get(self, name, default=None):
+        table = self.table
+        code = table.codes.get(name)
+        if code is not None:
+            i = self.base + code
+            if table.check[i] == self.state:
+                return table.value[i]
+        return default
+
+    def __getitem__(self, name):
+        v = self.get(name)
+        if v is None:
+            raise KeyError(name)
+        return v
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def items(self):
+        table = self.table
+        check, value, state, b = table.check, table.value, self.state, self.base
+        return [(name, value[b + code]) for code, name in enumerate(table.symbols)
+                if check[b + code] == state]
+
+    def keys(self):
+        return [name for name, v in self.items()]
+
+    def values(self):
+        return [v for name, v in self.items()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+# A table of rows indexed by state.  It is a list of CompactRow so that the
+# parse loops index it as fast as the dict it replaces.
+class CompactTable(list):
+    def __init__(self, symbols, base, check, value):
+        self.symbols = symbols
+        self.codes = dict((name, code) for code, name in enumerate(symbols))
+        self.base = base
+        self.check = check
+        self.value = value
+        list.__init__(self, [CompactRow(self, state, b) for state, b in enumerate(base)])
+
+    def get(self, state, default=None):
+        if 0 <= state < len(self):
+            return self[state]
+        return default
+
+    def keys(self):
+        return list(range(len(self)))
+
+    def values(self):
+        return list(self)
+
+    def items(self):
+        return list(enumerate(self))
+
+    # The table as the dict of dicts it stands for.  The generic loops look up
+    # every action by symbol name, which is several times faster in a dict
+    # than through a CompactRow.
+    def dict_rows(self):
+        return dict((state, dict(row.items())) for state, row in enumerate(self))
+
 
 # -----------------------------------------------------------------------------
 #                           === LR Generator ===
@@ -2723,7 +3330,7 @@ class LRGeneratedTable(LRTable):
     # This function writes the LR parsing tables to a file
     # -----------------------------------------------------------------------------
 
-    def write_table(self, tabmodule, outputdir='', signature=''):
+    def write_table(self, tabmodule, outputdir='', signature='', compact=False):
         if isinstance(tabmodule, types.ModuleType):
             raise IOError("Won't overwrite existing tabmodule")
 
@@ -2742,35 +3349,43 @@ _lr_method = %r
 _lr_signature = %r
     ''' % (os.path.basename(filename), __tabversion__, self.lr_method, signature))
 
-            # Change smaller to 0 to go back to original tables
-            smaller = 1
-
-            # Factor out names to try and make smaller
-            if smaller:
-                items = {}
-
-                for s, nd in self.lr_action.items():
-                    for name, v in nd.items():
-                        i = items.get(name)
-                        if not i:
-                            i = ([], [])
-                            items[name] = i
-                        i[0].append(s)
-                        i[1].append(v)
-
-                f.write('\n_lr_action_items = {')
-                for k, v in items.items():
-                    f.write('%r:([' % k)
-                    for i in v[0]:
-                        f.write('%r,' % i)
-                    f.write('],[')
-                    for i in v[1]:
-                        f.write('%r,' % i)
-
-                    f.write(']),')
-                f.write('}\n')
-
-                f.write('''
+            if compact:
+                # Row-displaced arrays, loaded without expanding them
+                symbols, action, goto = compact_tables(self.lr_action, self.lr_goto)
+                f.write('\n_lr_byteorder = %r\n' % sys.byteorder)
+                f.write('\n_lr_symbols = %r\n' % symbols)
+                f.write('\n_lr_action_compact = (%r, %r, %r)\n' % tuple(encode_array(a) for a in action))
+                f.write('\n_lr_goto_compact = (%r, %r, %r)\n' % tuple(encode_array(a) for a in goto))
+            else:
+                # Change smaller to 0 to go back to original tables
+                smaller = 1
+
+                # Factor out names to try and make smaller
+                if smaller:
+                    items = {}
+
+                    for s, nd in self.lr_action.items():
+                        for name, v in nd.items():
+                            i = items.get(name)
+                            if not i:
+                                i = ([], [])
+                                items[name] = i
+                            i[0].append(s)
+                            i[1].append(v)
+
+                    f.write('\n_lr_action_items = {')
+                    for k, v in items.items():
+                        f.write('%r:([' % k)
+                        for i in v[0]:
+                            f.write('%r,' % i)
+                        f.write('],[')
+                        for i in v[1]:
+                            f.write('%r,' % i)
+
+                        f.write(']),')
+                    f.write('}\n')
+
+                    f.write('''
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
    for _x,_y in zip(_v[0],_v[1]):
@@ -2779,38 +3394,38 @@ for _k, _v in _lr_action_items.items():
 del _lr_action_items
 ''')
 
-            else:
-                f.write('\n_lr_action = { ')
-                for k, v in self.lr_action.items():
-                    f.write('(%r,%r):%r,' % (k[0], k[1], v))
-                f.write('}\n')
-
-            if smaller:
-                # Factor out names to try and make smaller
-                items = {}
-
-                for s, nd in self.lr_goto.items():
-                    for name, v in nd.items():
-                        i = items.get(name)
-                        if not i:
-                            i = ([], [])
-                            items[name] = i
-                        i[0].append(s)
-                        i[1].append(v)
-
-                f.write('\n_lr_goto_items = {')
-                for k, v in items.items():
-                    f.write('%r:([' % k)
-                    for i in v[0]:
-                        f.write('%r,' % i)
-                    f.write('],[')
-                    for i in v[1]:
-                        f.write('%r,' % i)
-
-                    f.write(']),')
-                f.write('}\n')
-
-                f.write('''
+                else:
+                    f.write('\n_lr_action = { ')
+                    for k, v in self.lr_action.items():
+                        f.write('(%r,%r):%r,' % (k[0], k[1], v))
+                    f.write('}\n')
+
+                if smaller:
+                    # Factor out names to try and make smaller
+                    items = {}
+
+                    for s, nd in self.lr_goto.items():
+                        for name, v in nd.items():
+                            i = items.get(name)
+                            if not i:
+                                i = ([], [])
+                                items[name] = i
+                            i[0].append(s)
+                            i[1].append(v)
+
+                    f.write('\n_lr_goto_items = {')
+                    for k, v in items.items():
+                        f.write('%r:([' % k)
+                        for i in v[0]:
+                            f.write('%r,' % i)
+                        f.write('],[')
+                        for i in v[1]:
+                            f.write('%r,' % i)
+
+                        f.write(']),')
+                    f.write('}\n')
+
+                    f.write('''
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
    for _x, _y in zip(_v[0], _v[1]):
@@ -2818,11 +3433,11 @@ for _k, _v in _lr_goto_items.items():
        _lr_goto[_x][_k] = _y
 del _lr_goto_items
 ''')
-            else:
-                f.write('\n_lr_goto = { ')
-                for k, v in self.lr_goto.items():
-                    f.write('(%r,%r):%r,' % (k[0], k[1], v))
-                f.write('}\n')
+                else:
+                    f.write('\n_lr_goto = { ')
+                    for k, v in self.lr_goto.items():
+                        f.write('(%r,%r):%r,' % (k[0], k[1], v))
+                    f.write('}\n')
 
             # Write production table
             f.write('_lr_productions = [\n')
@@ -3213,7 +3828,7 @@ class ParserReflect(object):
 
 def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, start=None,
          check_recursion=True, optimize=False, write_tables=True, debugfile=debug_file,
-         outputdir=None, debuglog=None, errorlog=None, picklefile=None):
+         outputdir=None, debuglog=None, errorlog=None, picklefile=None, compact=False):
 
     if tabmodule is None:
         tabmodule = tab_module
@@ -3289,6 +3904,7 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
             try:
                 lr.bind_callables(pinfo.pdict)
                 parser = LRParser(lr, pinfo.error_func)
+                parser.signature = read_signature
                 parse = parser.parse
                 return parser
             except Exception as e:
@@ -3475,7 +4091,7 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
     # Write the table file if requested
     if write_tables:
         try:
-            lr.write_table(tabmodule, outputdir, signature)
+            lr.write_table(tabmodule, outputdir, signature, compact)
         except IOError as e:
             errorlog.warning("Couldn't create %r. %s" % (tabmodule, e))
 
@@ -3489,6 +4105,76 @@ def yacc(method='LALR', debug=yaccdebug, module=None, tabmodule=tab_module, star
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
+    parser.signature = signature
+
+    parse = parser.parse
+    return parser
+
+# -----------------------------------------------------------------------------
+# load(module)
+#
+# Build a parser from previously generated tables only.  Unlike yacc(), the
+# grammar is not validated, no tables are generated and no file is ever
+# written.  A YaccError is raised if the tables are missing or were generated
+# from a different grammar.  The tables are read from mapfile if it is given
+# (see LRTable.read_mapped), else from picklefile or tabmodule.
+# -----------------------------------------------------------------------------
+
+def load(module=None, tabmodule=tab_module, start=None, picklefile=None, mapfile=None):
+
+    if tabmodule is None:
+        tabmodule = tab_module
+
+    # Reference to the parsing method of the last built parser
+    global parse
+
+    # Get the module dictionary used for the parser
+    if module:
+        _items = [(k, getattr(module, k)) for k in dir(module)]
+        pdict = dict(_items)
+        # If no __file__ attribute is available, try to obtain it from the __module__ instead
+        if '__file__' not in pdict:
+            pdict['__file__'] = sys.modules[pdict['__module__']].__file__
+    else:
+        pdict = get_caller_module_dict(2)
+
+    # Determine if the module is package of a package or not.
+    # If so, fix the tabmodule setting so that tables load correctly
+    pkg = pdict.get('__package__')
+    if pkg and isinstance(tabmodule, str):
+        if '.' not in tabmodule:
+            tabmodule = pkg + '.' + tabmodule
+
+    # Set start symbol if it's specified directly using an argument
+    if start is not None:
+        pdict['start'] = start
+
+    # Collect parser information from the dictionary
+    pinfo = ParserReflect(pdict)
+    pinfo.get_all()
+
+    if pinfo.error:
+        raise YaccError('Unable to build parser')
+
+    # Read the tables and check them against the grammar
+    lr = LRTable()
+    source = mapfile or picklefile or tabmodule
+    try:
+        if mapfile:
+            read_signature = lr.read_mapped(mapfile)
+        elif picklefile:
+            read_signature = lr.read_pickle(picklefile)
+        else:
+            read_signature = lr.read_table(tabmodule)
+    except ImportError:
+        raise YaccError('No parsing tables found in %r' % source)
+
+    if read_signature != pinfo.signature():
+        raise YaccError('Parsing tables in %r do not match the grammar' % source)
+
+    lr.bind_callables(pinfo.pdict)
+    parser = LRParser(lr, pinfo.error_func)
+    parser.signature = read_signature
 
     parse = parser.parse
     return parser
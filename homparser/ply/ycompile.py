@@ -0,0 +1,376 @@
+# ply: ycompile.py
+#
+# Compiles the LALR tables of a parser into a Python module of specialized
+# code.  Every production gets its own reduce function with its length, goto
+# offset and grammar rule bound as constants, and the parse loop keeps a stack
+# of plain values instead of YaccSymbol objects.  Rules that only pass their
+# single value up (see yacc.passthrough_rules) are reduced by a goto alone,
+# unless the parser has pass-through rules turned off, as it has while
+# counting.
+#
+# The tables are stored as row-displacement arrays (see yacc.compact_tables)
+# that the generated code indexes directly.  The goto check array is not
+# needed: a goto looked up after a reduction always exists.  The arrays are
+# those of a compact table file, so a parser loaded from a mapped table file
+# (see LRTable.read_mapped) lends its arrays to the generated code.
+#
+# write_module() generates the module and load_module() turns it into a
+# CompiledParser, which parses with the generated loop.  Only syntax errors
+# leave that loop: the stacks are converted and handed to the generic loop of
+# LRParser, which reports and recovers from the error as it always does.
+# Debugging and tracking parses use the generic loop from the start.
+#
+# Grammar rules are called with a list in place of the YaccProduction, so
+# they may only index it.  write_module() refuses rules that use p.lineno(),
+# p.lexer and the like, or that raise SyntaxError.
+#
+# A parser with spanned classes (see LRParser.set_spanned()) gets a second
+# loop, which keeps the lexpos and endlexpos of every symbol on the stack next
+# to the values and sets the start and end of the instances of those classes
+# that the rules build.  A rule of n symbols keeps the start of the first and
+# the end of the last.  Which rules build instances is decided when the module
+# is written, from the span kinds of the parser it is written from (see
+# yacc.span_kind()): only their reducers set spans, and only those of the
+# span_check rules look at the value.  The module can only give spans to
+# parsers with the same kinds.  Parsers without spans never pay for the
+# positions.
+
+import os.path
+import sys
+import types
+
+from .yacc import (LRParser, YaccSymbol, YaccError, CompactTable, passthrough_rules, yaccdevel,
+                   compact_tables, encode_array, decode_array, span_never, span_always)
+
+__compileversion__ = '8'
+
+# Names that show that a rule needs the real YaccProduction
+_production_names = frozenset(['lineno', 'set_lineno', 'linespan', 'lexpos', 'lexspan',
+                               'error', 'lexer', 'parser', 'slice', 'stack', 'SyntaxError'])
+
+# The parse loop.  reducers[n] reduces production n: it is the symbol code of
+# the left side of a pass-through rule, or a function that returns the new
+# state.  Unknown
+# tokens get the column past the last symbol, which never passes the check.
+_parse_source = '''
+    def parse(parser, get_token):
+        states = [0]
+        values = [None]
+        parser.statestack = states
+        state = 0
+        ltype = None
+        while True:
+            t = default[state]
+            if not t:
+                if ltype is None:
+                    lookahead = get_token()
+                    ltype = lookahead.type if lookahead is not None else '$end'
+                    code = codes.get(ltype, unknown)
+                i = base[state] + code
+                if check[i] != state:
+                    return parser.recover(states, values, lookahead)
+                t = value[i]
+            if t > 0:
+                states.append(t)
+                values.append(lookahead.value)
+                ltype = None
+                state = t
+            elif t < 0:
+                r = reducers[-t]
+                if r.__class__ is int:
+                    state = states[-1] = goto[gotobase[states[-2]] + r]
+                else:
+                    state = r(values, states)
+            else:
+                return values[-1]
+
+    return parse
+'''
+
+# The same loop with the position stacks
+_spanned_parse_source = '''
+    def parse(parser, get_token):
+        states = [0]
+        values = [None]
+        starts = [0]
+        ends = [0]
+        push_start = starts.append
+        push_end = ends.append
+        parser.statestack = states
+        state = 0
+        ltype = None
+        while True:
+            t = default[state]
+            if not t:
+                if ltype is None:
+                    lookahead = get_token()
+                    ltype = lookahead.type if lookahead is not None else '$end'
+                    code = codes.get(ltype, unknown)
+                i = base[state] + code
+                if check[i] != state:
+                    return parser.recover(states, values, lookahead, starts, ends)
+                t = value[i]
+            if t > 0:
+                states.append(t)
+                values.append(lookahead.value)
+                push_start(lookahead.lexpos)
+                push_end(lookahead.endlexpos)
+                ltype = None
+                state = t
+            elif t < 0:
+                r = reducers[-t]
+                if r.__class__ is int:
+                    state = states[-1] = goto[gotobase[states[-2]] + r]
+                else:
+                    state = r(values, states, starts, ends)
+            else:
+                return values[-1]
+
+    return parse
+'''
+
+
+def _uses_production(func):
+    code = getattr(func, '__code__', None)
+    return code is None or bool(_production_names.intersection(code.co_names))
+
+
+def write_module(parser, module, outputdir=''):
+    if isinstance(module, types.ModuleType):
+        raise IOError("Won't overwrite existing module")
+    if parser.signature is None:
+        raise YaccError('The parser has no table signature')
+
+    action = dict(parser.action.items())
+    nstates = max(action) + 1
+    default = [parser.defaulted_states.get(state, 0) for state in range(nstates)]
+
+    # The symbol through which each state is entered
+    accessing = ['$end'] * nstates
+    for actions in action.values():
+        for name, t in actions.items():
+            if t > 0:
+                accessing[t] = name
+    for state, row in parser.goto.items():
+        for name, t in row.items():
+            accessing[t] = name
+
+    symbols, actionarrays, gotoarrays = compact_tables(action, parser.goto)
+    codes = dict((name, code) for code, name in enumerate(symbols))
+
+    passthrough = passthrough_rules(parser.productions)
+    spanning = parser.spanning or [span_never] * len(parser.productions)
+    reducers = ['None']
+    shortcuts = ['None']
+    for n, p in enumerate(parser.productions):
+        if n == 0:
+            continue
+        if _uses_production(p.callable):
+            raise YaccError('%s:%d: Rule %r cannot be compiled: it uses the production object' %
+                            (p.file, p.line, p.func))
+        reducers.append('reduce_%d' % n)
+        shortcuts.append('%d' % codes[p.name] if n in passthrough else 'reduce_%d' % n)
+
+    lines = []
+    spannedlines = []
+    for n, p in enumerate(parser.productions):
+        if n == 0:
+            continue
+        for spans in (False, True):
+            out = spannedlines if spans else lines
+            if spans:
+                out.append('    def reduce_%d(values, states, starts, ends):' % n)
+            else:
+                out.append('    def reduce_%d(values, states):' % n)
+            out.append('        # %s' % p.str)
+            if p.len:
+                out.append('        p = values[-%d:]' % (p.len + 1))
+                out.append('        p[0] = None')
+                out.append('        del values[-%d:]' % p.len)
+                out.append('        del states[-%d:]' % p.len)
+                if spans and p.len > 1:
+                    out.append('        del starts[-%d:]' % (p.len - 1))
+                    out.append('        del ends[-%d:-1]' % p.len)
+            else:
+                out.append('        p = [None]')
+                if spans:
+                    out.append('        starts.append(ends[-1])')
+                    out.append('        ends.append(ends[-1])')
+            out.append('        rule_%d(p)' % n)
+            if spans and spanning[n] == span_always:
+                out.append('        v = p[0]')
+                out.append('        v.start = starts[-1]')
+                out.append('        v.end = ends[-1]')
+                out.append('        values.append(v)')
+            elif spans and spanning[n] != span_never:
+                # A value passed on from the right side keeps its span
+                out.append('        v = p[0]')
+                out.append('        if isinstance(v, spanned)%s:' %
+                           ''.join(' and v is not p[%d]' % i for i in range(1, p.len + 1)))
+                out.append('            v.start = starts[-1]')
+                out.append('            v.end = ends[-1]')
+                out.append('        values.append(v)')
+            else:
+                out.append('        values.append(p[0])')
+            out.append('        state = goto[gotobase[states[-1]] + %d]' % codes[p.name])
+            out.append('        states.append(state)')
+            out.append('        return state')
+            out.append('')
+
+    basemodulename = module.split('.')[-1]
+    filename = os.path.join(outputdir, basemodulename) + '.py'
+    with open(filename, 'w') as f:
+        f.write('''
+# %s
+# This file is automatically generated. Do not edit.
+_compileversion = %r
+
+_lr_signature = %r
+
+''' % (os.path.basename(filename), __compileversion__, parser.signature))
+
+        f.write('_lr_byteorder = %r\n\n' % sys.byteorder)
+        f.write('_lr_spanning = %r\n\n' % list(parser.spanning))
+        f.write('_lr_symbols = %r\n\n' % symbols)
+        f.write('_lr_action_compact = (%r, %r, %r)\n\n' % tuple(encode_array(a) for a in actionarrays))
+        f.write('_lr_goto_compact = (%r, %r)\n\n' % (encode_array(gotoarrays[0]), encode_array(gotoarrays[2])))
+        f.write('_lr_default = %r\n\n' % default)
+        f.write('_lr_accessing = %r\n\n' % accessing)
+
+        for header, body, source in [('bind(rules, ', lines, _parse_source),
+                                     ('bind_spanned(rules, spanned, ', spannedlines, _spanned_parse_source)]:
+            f.write('def %spassthrough, base, check, value, gotobase, goto):\n' % header)
+            f.write('    codes = dict((name, code) for code, name in enumerate(_lr_symbols))\n')
+            f.write('    unknown = len(_lr_symbols)\n')
+            f.write('    default = _lr_default\n')
+            for n in range(1, len(reducers)):
+                f.write('    rule_%d = rules[%d]\n' % (n, n))
+            f.write('\n')
+            f.write('\n'.join(body))
+            f.write('\n    if passthrough:\n')
+            f.write('        reducers = [%s]\n' % ', '.join(shortcuts))
+            f.write('    else:\n')
+            f.write('        reducers = [%s]\n' % ', '.join(reducers))
+            f.write(source)
+            f.write('\n\n')
+
+
+def load_module(parser, module):
+    if isinstance(module, types.ModuleType):
+        code = module
+    else:
+        exec('import %s' % module)
+        code = sys.modules[module]
+
+    if code._compileversion != __compileversion__ or code._lr_signature != parser.signature:
+        raise YaccError('Compiled parser in %r does not match the grammar' % code.__name__)
+
+    action, goto = parser.action, parser.goto
+    if isinstance(action, CompactTable) and action.symbols == code._lr_symbols:
+        arrays = action.base, action.check, action.value, goto.base, goto.value
+    else:
+        byteorder = code._lr_byteorder
+        base, check, value = code._lr_action_compact
+        gotobase, gotovalue = code._lr_goto_compact
+        arrays = (decode_array('i', base, byteorder), decode_array('h', check, byteorder),
+                  decode_array('h', value, byteorder), decode_array('i', gotobase, byteorder),
+                  decode_array('h', gotovalue, byteorder))
+
+    return CompiledParser(parser, _binder(code, arrays), code._lr_accessing)
+
+
+def _binder(code, arrays):
+    def bind(rules, spanned, spanning, passthrough):
+        if spanned:
+            if list(spanning) != code._lr_spanning:
+                raise YaccError('Compiled parser in %r was written for other spanned classes' %
+                                code.__name__)
+            return code.bind_spanned(rules, spanned, passthrough, *arrays)
+        return code.bind(rules, passthrough, *arrays)
+    return bind
+
+
+# -----------------------------------------------------------------------------
+#                            == CompiledParser ==
+#
+# An LRParser that parses with a generated loop.  It shares the tables of the
+# parser it was made from, so the generic loop is still at hand for debugging,
+# tracking and error recovery, and clone() works as for any LRParser.  bind()
+# returns the loop calling the grammar rules in a list, by production number,
+# giving spans to the instances of the spanned classes, if there are any, and
+# reducing pass-through rules by a goto if passthrough is true.
+# -----------------------------------------------------------------------------
+
+class CompiledParser(LRParser):
+    def __init__(self, parser, bind, accessing):
+        self.__dict__.update(parser.__dict__)
+        self.bind = bind
+        self.accessing = accessing
+        self.lexer = None
+        self.bind_rules()
+
+    def bind_rules(self):
+        self.parsefunc = self.bind([p.callable for p in self.productions], self.spanned,
+                                   self.spanning, bool(self.passthrough))
+
+    def set_spanned(self, classes):
+        LRParser.set_spanned(self, classes)
+        self.bind_rules()
+
+    def enable_counters(self):
+        counters = LRParser.enable_counters(self)
+        self.bind_rules()
+        return counters
+
+    def disable_counters(self):
+        LRParser.disable_counters(self)
+        self.bind_rules()
+
+    def set_passthrough_rules(self):
+        LRParser.set_passthrough_rules(self)
+        self.bind_rules()
+
+    def disable_passthrough_rules(self):
+        LRParser.disable_passthrough_rules(self)
+        self.bind_rules()
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False, tokenfunc=None):
+        if debug or tracking or yaccdevel:
+            return LRParser.parse(self, input, lexer, debug, tracking, tokenfunc)
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        self.lexer = lexer
+        self.token = tokenfunc or lexer.token
+        if self.counters is not None:
+            self.token = self.counters.count_tokens(self.token)
+        return self.parsefunc(self, self.token)
+
+    # Called by the generated loop on a syntax error.  The value stack becomes
+    # a symbol stack, the type of each symbol being the one through which its
+    # state was entered, and the generic loop takes over from there.
+    # The loop with spans also hands over the positions of the symbols.
+    def recover(self, states, values, lookahead, starts=None, ends=None):
+        accessing = self.accessing
+        symstack = []
+        for state, value in zip(states, values):
+            sym = YaccSymbol()
+            sym.type = accessing[state]
+            sym.value = value
+            symstack.append(sym)
+        if starts is not None:
+            for sym, start, end in zip(symstack, starts, ends):
+                sym.lexpos = start
+                sym.endlexpos = end
+        if lookahead is None:
+            lookahead = YaccSymbol()
+            lookahead.type = '$end'
+        return self.parseopt_notrack(None, self.lexer, False, False, self.token,
+                                     (states, symstack, lookahead))
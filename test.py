@@ -1,3 +1,5 @@
+import mmap
+import homparser.homdeflex as hdl
 import homparser.homdefyacc as hdy
 
 
@@ -8,4 +10,168 @@ program = hdy.parser.parse(data)
 print program.sequential.wf()
 print program.join.wf()
 print program.join.locals[0].type.baseType == 'int'
-print program.sequential.locals[0].type.baseType == 'int'
\ No newline at end of file
+print program.sequential.locals[0].type.baseType == 'int'
+
+# The same file, memory-mapped
+f = open('tests/testinput', 'rb')
+mapped = hdy.parser.parse(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+print mapped.sequential.wf() and mapped.join.wf()
+print mapped.sequential.locals[0].type.baseType == program.sequential.locals[0].type.baseType
+
+# An illegal character is reported for its own input only
+hdy.parser.parse(data.replace('(', '$(', 1))
+print len(hdl.lexer.errors) == 1
+hdy.parser.parse(data)
+print hdl.lexer.errors == []
+
+# A stream lexer keeps its diagnostics to itself
+import StringIO
+from homparser.homdefstream import StreamLexer
+stream = StreamLexer(StringIO.StringIO('a $ b\nc $ d\n'), 4)
+tokens = list(stream)
+print [e.offset for e in stream.lexer.errors] == [2, 8] and hdl.lexer.errors == []
+
+# Expressions cut off by the end of the input are left to the tables
+import sys
+from homparser.homdefparser import HomdefParser
+stdout, sys.stdout = sys.stdout, StringIO.StringIO()   # p_error() prints
+try:
+    results = []
+    for text in ['a [', 'a + (b', data[:data.index('sum * n +') + len('sum * n +')]]:
+        for climbing in (False, True):
+            parser = HomdefParser(climbing=climbing)
+            parser.parse(text)
+            results.append((parser.errors, parser.syntaxerrors))
+finally:
+    sys.stdout = stdout
+print all(results[i] == results[i + 1] and results[i][1] for i in range(0, len(results), 2))
+
+# A file that cannot be read has no diagnostics of its own
+import os
+import tempfile
+from homparser import homdefbatch
+tmpdir = tempfile.mkdtemp()
+bad = os.path.join(tmpdir, 'bad.hd')
+with open(bad, 'w') as f:
+    f.write(data.replace('(', '$(', 1).replace(';', '', 1))
+results = dict((r.path, r) for r in homdefbatch.parse_many([bad, os.path.join(tmpdir, 'missing.hd')], jobs=1))
+os.unlink(bad)
+os.rmdir(tmpdir)
+missing = results[os.path.join(tmpdir, 'missing.hd')]
+print bool(results[bad].errors and results[bad].syntaxerrors) and missing.failure.startswith('IOError') and \
+    missing.errors == [] and missing.syntaxerrors == []
+
+# A lazily parsed body reports the same diagnostics as an eager parse
+text = data.replace('sum = 0;', 'sum = $0;').replace('sum * n', 'sum * * n')
+stdout, sys.stdout = sys.stdout, StringIO.StringIO()
+try:
+    results = []
+    for lazy in (False, True):
+        parser = HomdefParser(lazy=lazy)
+        program = parser.parse(text)
+        program.join.body, program.sequential.body
+        results.append((parser.errors, parser.syntaxerrors))
+finally:
+    sys.stdout = stdout
+print bool(results[0] == results[1] and results[0][0] and results[0][1])
+
+# The lexer and the bulk and parallel tokenizers reject an input after the
+# same number of runs of illegal characters
+from homparser import homdeflex, homdeftokens
+from homparser.ply.lex import LexError
+
+def rejected(tokenize, text):
+    try:
+        tokenize(text)
+    except LexError:
+        return True
+    return False
+
+def lex_all(text):
+    lexer = homdeflex.lexer.clone()
+    homdeflex.reset(lexer)
+    lexer.maxerrors = 2
+    lexer.input(text)
+    list(lexer)
+
+print all([rejected(lex_all, text),
+           rejected(lambda text: homdeftokens.tokenize_bulk(text, 2), text),
+           rejected(lambda text: homdeftokens.tokenize_parallel(text, chunksize=4, maxerrors=2), text)] ==
+          [errors > 2] * 3
+          for errors, text in [(2, 'a $ b\nc $ d\n'), (3, 'a $ b\nc $ d\ne $ f\n')])
+
+# Spans leave out the parentheses around a node, and end past its last token
+text = ' ((a + (b * c)) - f(x)[1]) '
+spans = []
+for climbing in (False, True):
+    for compiled in (False, True):
+        expr = HomdefParser(climbing=climbing, compiled=compiled).parse_fragment('expression', text)
+        left, call = expr.lexpr, expr.rexpr
+        spans.append([text[n.start:n.end] for n in (expr, left, left.lexpr, left.rexpr, call, call.name)])
+print spans == [['(a + (b * c)) - f(x)[1]', 'a + (b * c)', 'a', 'b * c', 'f(x)[1]', 'f(x)']] * 4
+
+args = HomdefParser(compiled=True).parse_fragment('arglist', 'int x, bool *yy', offset=3)
+print [(a.name.start, a.name.end, a.start, a.end) for a in args] == [(7, 8, 3, 8), (16, 18, 10, 18)] and \
+    HomdefParser(compiled=True, spans=False).parse_fragment('expression', text).coord is None
+
+# A deep tree is sent back from a worker like any other
+deep = os.path.join(tempfile.mkdtemp(), 'deep.hd')
+with open(deep, 'w') as f:
+    f.write(data.replace('sum = 0;', 'sum = %s;' % ' + '.join(['n'] * 1500)))
+result, = homdefbatch.parse_many([deep], jobs=1)
+os.unlink(deep)
+os.rmdir(os.path.dirname(deep))
+print result.failure is None and result.program.sequential.wf()
+
+# A lazy parse is not cached before its bodies are checked, and a damaged
+# entry is a miss
+import marshal
+from homparser.homdefcache import ParseCache
+from homparser import homdefast as ast
+cachedir = tempfile.mkdtemp()
+cache = ParseCache(cachedir, parser=HomdefParser(lazy=True))
+stdout, sys.stdout = sys.stdout, StringIO.StringIO()
+try:
+    bad_body = data.replace('sum * n', 'sum * * n')
+    cache.parse(bad_body)
+    cache.parse(bad_body)
+finally:
+    sys.stdout = stdout
+with open(os.path.join(cachedir, cache.key(data)), 'wb') as f:
+    f.write(marshal.dumps(('Program', None, None)))
+print cache.hits == 0 and cache.parse(data).sequential.wf() and cache.parse(data).join.wf() and \
+    (cache.hits, cache.misses) == (1, 3)
+for name in os.listdir(cachedir):
+    os.unlink(os.path.join(cachedir, name))
+os.rmdir(cachedir)
+
+# Unicode input is lexed as byte strings are
+import io
+text = data.decode('ascii')
+parsers = [HomdefParser(), HomdefParser(climbing=True, compiled=True, lazy=True)]
+programs = [parser.parse(text) for parser in parsers]
+programs.append(parsers[0].parse_tokens(homdeftokens.tokenize_bulk(text)))
+programs.append(parsers[0].parse_stream(io.StringIO(text), 64))
+print all(p.sequential.wf() and p.join.wf() for p in programs) and \
+    [ast.to_tuple(p) for p in programs] == [ast.to_tuple(HomdefParser().parse(data))] * 4
+
+# Counting parsers count the pass-through reductions, compiled or not
+counts = []
+for parser in [hdy.get_parser().clone(), hdy.get_compiled_parser().clone()]:
+    counters = parser.enable_counters()
+    parser.parse(data, lexer=hdl.lexer.clone())
+    parser.disable_counters()
+    counts.append(counters.reductions)
+cascade = [n for n, p in enumerate(parser.productions) if n in parser.passthrough]
+print counts[0] == counts[1] and any(counts[0][n] for n in cascade) and \
+    parser.passthrough == hdy.get_parser().passthrough
+
+# Nodes have spans by default, whichever loop builds them
+starts = []
+for climbing, compiled, lazy in [(False, False, False), (True, True, False), (True, True, True)]:
+    sequential = HomdefParser(climbing=climbing, compiled=compiled, lazy=lazy).parse(data).sequential
+    statement = sequential.body.statements[-1]
+    starts.append((sequential.coord, statement.coord, statement.rvalue.coord))
+print starts[0] == starts[1] == starts[2] and None not in starts[0] and \
+    data[slice(*starts[0][0])].startswith('sequential') and data[slice(*starts[0][2])] == 'sum * n + 3'